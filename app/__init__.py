@@ -3,14 +3,22 @@ from ddtrace import patch
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app import accounts, analytics, authors, github, images, members, posts
+from app import (
+    accounts,
+    analytics,
+    authors,
+    github,
+    images,
+    members,
+    metrics,
+    posts,
+)
 from config import settings
+from database import engines
+from database.local import ensure_local_database
 from database.orm import Base, engine
 from log import LOGGER
 
-Base.metadata.create_all(bind=engine)
-
-
 patch(fastapi=True)
 
 
@@ -46,5 +54,22 @@ api.include_router(accounts.router)
 api.include_router(authors.router)
 api.include_router(images.router)
 api.include_router(github.router)
+api.include_router(metrics.router)
+
+
+@api.on_event("startup")
+def create_tables():
+    """Create ORM tables, seeding local stand-ins of Ghost's tables first."""
+    if settings.DATABASE_LOCAL:
+        ensure_local_database(engines, settings.DATABASE_LOCAL_POSTS)
+    Base.metadata.create_all(bind=engine)
+
+
+@api.on_event("shutdown")
+async def close_connections():
+    """Close pooled connections, including those held by asyncio drivers."""
+    await engines.dispose_async()
+    engines.dispose()
+
 
 LOGGER.success(f"API successfully started.")
@@ -1,6 +1,8 @@
 """User account management & functionality."""
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.accounts.subscriptions import new_ghost_subscription
 from clients import ghost, mailgun
@@ -11,11 +13,12 @@ from database.crud import (
     get_account,
     get_comment_upvote,
     get_donation,
+    read_bind,
     remove_comment_upvote,
     submit_comment_upvote,
 )
 from database.models import Account, Comment
-from database.orm import get_db
+from database.orm import get_async_db
 from database.schemas import (
     NetlifyAccountCreationResponse,
     NetlifyUserEvent,
@@ -35,7 +38,7 @@ router = APIRouter(prefix="/account", tags=["accounts"])
     response_model=NetlifyAccountCreationResponse,
 )
 async def new_account(
-    new_account_event: NetlifyUserEvent, db: Session = Depends(get_db)
+    new_account_event: NetlifyUserEvent, db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create user account from Netlify identity signup.
@@ -43,19 +46,19 @@ async def new_account(
     :param new_account_event: Newly created user account from Netlify.
     :type new_account_event: NetlifyUserEvent
     :param db: ORM Database session.
-    :type db: Session
+    :type db: AsyncSession
     :returns: NetlifyAccountCreationResponse
     """
     account = new_account_event.user
-    db_account = get_account(db, account.email)
+    db_account = await get_account(db, account.email, primary=True)
     if db_account:
         LOGGER.warning(f"User account already exists for `{account.email}`.")
         raise HTTPException(
             status_code=400,
             detail=f"User account already exists for `{account.email}`.",
         )
-    create_account(db, account)
-    db_account = get_account(db, account.email)
+    await create_account(db, account)
+    db_account = await get_account(db, account.email, primary=True)
     if db_account:
         return NetlifyAccountCreationResponse(
             succeeded=db_account,
@@ -73,20 +76,20 @@ async def new_account(
     description="Save user-generated comments submitted on posts.",
     response_model=NewComment,
 )
-async def new_comment(comment: NewComment, db: Session = Depends(get_db)):
+async def new_comment(comment: NewComment, db: AsyncSession = Depends(get_async_db)):
     """
     Save user comment to database and notify post author.
 
     :param comment: User-submitted comment.
     :type comment: NewComment
     :param db: ORM Database session.
-    :type db: Session
+    :type db: AsyncSession
     """
     post = ghost.get_post(comment.post_id)
     authors = ghost.get_authors()
     if comment.user_email not in authors:
         mailgun.email_notification_new_comment(post, comment.__dict__)
-    create_comment(db, comment)
+    await create_comment(db, comment)
     ghost.rebuild_netlify_site()
     if comment.user_email not in authors:
         mailgun.email_notification_new_comment(post, comment.__dict__)
@@ -99,12 +102,16 @@ async def new_comment(comment: NewComment, db: Session = Depends(get_db)):
     description="Increment a comment's upvote count, or revoke an existing upvote from a user.",
     response_model=UpvoteComment,
 )
-async def upvote_comment(upvote_request: UpvoteComment, db: Session = Depends(get_db)):
-    existing_vote = get_comment_upvote(
-        db, upvote_request.user_id, upvote_request.comment_id
+async def upvote_comment(
+    upvote_request: UpvoteComment, db: AsyncSession = Depends(get_async_db)
+):
+    existing_vote = await get_comment_upvote(
+        db, upvote_request.user_id, upvote_request.comment_id, primary=True
     )
     if upvote_request.vote and existing_vote is None:
-        submit_comment_upvote(db, upvote_request.user_id, upvote_request.comment_id)
+        await submit_comment_upvote(
+            db, upvote_request.user_id, upvote_request.comment_id
+        )
         return upvote_request
     elif upvote_request.vote and existing_vote:
         LOGGER.warning(
@@ -115,7 +122,9 @@ async def upvote_comment(upvote_request: UpvoteComment, db: Session = Depends(ge
             detail=f"Upvote already submitted for comment `{upvote_request.comment_id}` from user `{upvote_request.user_id}`.",
         )
     elif upvote_request.vote is False and existing_vote:
-        remove_comment_upvote(db, upvote_request.user_id, upvote_request.comment_id)
+        await remove_comment_upvote(
+            db, upvote_request.user_id, upvote_request.comment_id
+        )
         return upvote_request
     elif upvote_request.vote is False and existing_vote is None:
         LOGGER.warning(
@@ -133,16 +142,18 @@ async def upvote_comment(upvote_request: UpvoteComment, db: Session = Depends(ge
     description="Save record of new donation to persistent ledger.",
     response_model=NewDonation,
 )
-async def accept_donation(donation: NewDonation, db: Session = Depends(get_db)):
+async def accept_donation(
+    donation: NewDonation, db: AsyncSession = Depends(get_async_db)
+):
     """
     Save BuyMeACoffee donation to database.
 
     :param donation: New donation.
     :type donation: NewDonation
     :param db: ORM Database session.
-    :type db: Session
+    :type db: AsyncSession
     """
-    db_donation = get_donation(db, donation.coffee_id)
+    db_donation = await get_donation(db, donation.coffee_id)
     if db_donation:
         LOGGER.warning(
             f"Donation `{donation.coffee_id}` from `{donation.email}` already exists."
@@ -151,15 +162,21 @@ async def accept_donation(donation: NewDonation, db: Session = Depends(get_db)):
             status_code=400,
             detail=f"Donation `{donation.coffee_id}` from `{donation.email}` already exists.",
         )
-    create_donation(db=db, donation=donation)
+    await create_donation(db=db, donation=donation)
     ghost.rebuild_netlify_site()
     return donation
 
 
 @router.get("/comments", summary="Test get comments via ORM")
-async def test_orm(db: Session = Depends(get_db)):
+async def test_orm(db: AsyncSession = Depends(get_async_db)):
     """Test endpoint for fetching comments joined with user info."""
-    comments = db.query(Comment).join(Account, Comment.user_id == Account.id).all()
+    result = await db.execute(
+        select(Comment)
+        .join(Account, Comment.user_id == Account.id)
+        .options(selectinload(Comment.user)),
+        bind_arguments=read_bind(db),
+    )
+    comments = result.scalars().all()
     for comment in comments:
         LOGGER.info(comment.user)
     return comments
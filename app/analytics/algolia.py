@@ -68,7 +68,7 @@ def import_algolia_search_queries(records: List[dict], table_name: str) -> str:
         records,
         table_name,
         "analytics",
-        replace=True,
+        swap=True,
     )
     LOGGER.success(f"Inserted {rows} rows into `{table_name}` table.")
     return rows
@@ -2,8 +2,7 @@
 from pandas import DataFrame
 
 from clients import gbq
-from config import basedir
-from database import rdbms
+from database import queries, rdbms
 
 
 def import_site_analytics(timeframe: str) -> DataFrame:
@@ -14,10 +13,10 @@ def import_site_analytics(timeframe: str) -> DataFrame:
     :type timeframe: str
     :returns: DataFrame
     """
-    sql_query = open(f"{basedir}/database/queries/analytics/{timeframe}.sql").read()
+    sql_query = queries.sql(f"analytics/{timeframe}")
     sql_table = f"{timeframe}_stats"
     query_job = gbq.query(sql_query)
     result = query_job.result()
     df = result.to_dataframe()
-    result = rdbms.insert_dataframe(df, sql_table, "analytics", action="replace")
+    result = rdbms.insert_dataframe(df, sql_table, "analytics", action="swap")
     return result
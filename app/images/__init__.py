@@ -1,17 +1,27 @@
 """Generate optimized images to be served from Google Cloud CDN."""
-from typing import Optional
+from hashlib import sha1
+from typing import List, Optional
 
-from fastapi import APIRouter, Query
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from PIL import UnidentifiedImageError
+from starlette.concurrency import run_in_threadpool
 
+from app.images.cache import DerivativeCache, read_chunks
+from app.images.pubsub import verify_push
 from clients import gcs
-from config import basedir, settings
-from database import rdbms
-from database.schemas import PostUpdate
+from clients.storage import VARIANT_FORMATS
+from config import settings
+from database import queries, rdbms
+from database.schemas import PostUpdate, StorageNotification
 from log import LOGGER
 
 router = APIRouter(prefix="/images", tags=["images"])
 
+derivative_cache = DerivativeCache(
+    settings.IMAGE_CACHE_DIRECTORY, settings.IMAGE_CACHE_MAX_BYTES
+)
+
 
 @router.post(
     "/",
@@ -30,8 +40,15 @@ async def optimize_post_image(post_update: PostUpdate):
     feature_image = post.feature_image
     title = post.title
     if feature_image:
-        new_images.append(gcs.create_retina_image(feature_image))
-        new_images.append(gcs.create_mobile_image(feature_image))
+        new_images.append(
+            await run_in_threadpool(gcs.create_retina_image, feature_image)
+        )
+        new_images.append(
+            await run_in_threadpool(gcs.create_mobile_image, feature_image)
+        )
+        new_images.extend(
+            await run_in_threadpool(gcs.create_responsive_images, feature_image) or []
+        )
         new_images = [image for image in new_images if image is not None]
         if bool(new_images):
             LOGGER.info(
@@ -51,31 +68,43 @@ async def optimize_post_image(post_update: PostUpdate):
     summary="Batch optimize CDN images.",
     description="Generates retina and mobile varieties of post feature_images. \
             Defaults to images uploaded within the current month; \
-            accepts a `?directory=` parameter which accepts a path to recursively optimize images on the given CDN.",
+            accepts repeated `?directory=` parameters (paths or `YYYY-YYYY` year ranges) to recursively optimize images on the given CDN.",
 )
 async def bulk_transform_images(
-    directory: Optional[str] = Query(
+    directory: Optional[List[str]] = Query(
         default=None,
         title="directory",
-        description="Subdirectory of remote CDN to transverse and transform images.",
+        description="Subdirectories of remote CDN to transverse and transform images.",
         max_length=50,
-    )
+    ),
+    dry_run: bool = Query(
+        default=False,
+        title="dry_run",
+        description="Report images which would be purged or created without writing anything.",
+    ),
+    incremental: bool = Query(
+        default=False,
+        title="incremental",
+        description="Only transform images uploaded since the previous incremental run.",
+    ),
 ):
     """
     Apply transformations to images uploaded within the current month.
-    Optionally accepts a `directory` parameter to override image directory.
+    Optionally accepts `directory` parameters to override image directories;
+    directories are transformed concurrently.
 
-    :param directory: Remote directory to recursively fetch images and apply transformations.
-    :type directory: Optional[str]
+    :param directory: Remote directories to recursively fetch images and apply transformations.
+    :type directory: Optional[List[str]]
+    :param dry_run: Report images which would be purged or created without writing anything.
+    :type dry_run: bool
+    :param incremental: Only transform images uploaded since the previous incremental run.
+    :type incremental: bool
     """
     if directory is None:
         directory = settings.GCP_BUCKET_FOLDER
-    images = {
-        "purged": gcs.purge_unwanted_images(directory),
-        "retina": gcs.retina_transformations(directory),
-        "mobile": gcs.mobile_transformations(directory),
-        "standard": gcs.standard_transformations(directory),
-    }
+    images = await run_in_threadpool(
+        gcs.bulk_transformations, directory, dry_run=dry_run, incremental=incremental
+    )
     log = []
     for k, v in images.items():
         if v is not None:
@@ -86,36 +115,179 @@ async def bulk_transform_images(
     return images
 
 
+@router.post(
+    "/events",
+    summary="Transform newly uploaded image.",
+    description="Consume Cloud Storage `OBJECT_FINALIZE` notifications delivered by an \
+            authenticated Pub/Sub push subscription and transform only the uploaded image.",
+)
+async def transform_uploaded_image(
+    request: Request,
+    notification: StorageNotification,
+    token: Optional[str] = Query(
+        default=None,
+        title="token",
+        description="Shared secret configured on the push subscription's endpoint.",
+    ),
+):
+    """
+    Apply image transformations to a single object upon upload.
+
+    :param request: Incoming push request; checked for a signed bearer token.
+    :type request: Request
+    :param notification: Pub/Sub push message wrapping a Cloud Storage notification.
+    :type notification: StorageNotification
+    :param token: Shared secret configured on the push subscription's endpoint.
+    :type token: Optional[str]
+    """
+    await run_in_threadpool(
+        verify_push,
+        request,
+        token,
+        settings.GCP_PUBSUB_PUSH_TOKEN,
+        settings.GCP_PUBSUB_PUSH_AUDIENCE,
+        settings.GCP_PUBSUB_PUSH_SERVICE_ACCOUNT,
+    )
+    attributes = notification.message.attributes
+    object_id = attributes.get("objectId")
+    if attributes.get("eventType") != "OBJECT_FINALIZE" or object_id is None:
+        return PlainTextResponse(
+            content=f"Ignored `{attributes.get('eventType')}` event for `{object_id}`."
+        )
+    image_blob = await run_in_threadpool(gcs.backend.stat, object_id)
+    if image_blob is None:
+        return PlainTextResponse(content=f"Ignored event for missing `{object_id}`.")
+    folder = object_id.rsplit("/", 1)[0]
+    images = await run_in_threadpool(gcs.transform_images, folder, [image_blob])
+    LOGGER.success(f"Transformed uploaded image `{object_id}`: {images}")
+    return images
+
+
+@router.get(
+    "/srcset",
+    summary="Responsive image variants.",
+    description="Fetch `srcset` values for each generated width & format variant of an image.",
+)
+async def image_srcset(
+    url: str = Query(
+        ...,
+        title="url",
+        description="Public CDN URL of the original image.",
+    )
+):
+    """
+    Fetch the responsive variant ladder of a single image.
+
+    :param url: Public CDN URL of the original image.
+    :type url: str
+    """
+    srcset = await run_in_threadpool(gcs.responsive_srcset, url)
+    return {"image": url, "srcset": srcset}
+
+
+@router.get(
+    "/render",
+    summary="Render resized image on demand.",
+    description="Serve a resized variant of a CDN image at the requested width & format, \
+            rendering and caching it locally on first request.",
+)
+async def render_image(
+    request: Request,
+    path: str = Query(
+        ...,
+        title="path",
+        description="Path of the source image relative to the CDN bucket.",
+    ),
+    width: int = Query(
+        ...,
+        title="width",
+        description="Width of rendered image in pixels.",
+        gt=0,
+        le=settings.IMAGE_RENDER_MAX_WIDTH,
+    ),
+    image_format: str = Query(
+        default="jpeg",
+        alias="format",
+        title="format",
+        description="Output format of rendered image (jpeg, webp, avif).",
+    ),
+):
+    """
+    Serve a cached derivative of an image, generating it on first request.
+
+    :param request: Incoming request; checked for `If-None-Match`.
+    :type request: Request
+    :param path: Path of the source image relative to the CDN bucket.
+    :type path: str
+    :param width: Width of rendered image in pixels.
+    :type width: int
+    :param image_format: Output format of rendered image.
+    :type image_format: str
+    """
+    if image_format not in gcs.variant_formats:
+        raise HTTPException(
+            status_code=422, detail=f"Unsupported image format `{image_format}`."
+        )
+    try:
+        source = await run_in_threadpool(gcs.backend.stat, path)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if source is None:
+        raise HTTPException(status_code=404, detail=f"Image `{path}` not found.")
+    key = sha1(
+        f"{path}:{source.md5_hash}:{source.generation}:{width}:{image_format}".encode()
+    ).hexdigest()
+    headers = {
+        "Cache-Control": f"public, max-age={settings.IMAGE_CACHE_MAX_AGE}, immutable",
+        "ETag": f'"{key}"',
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    cached_image = derivative_cache.get(key)
+    if cached_image is None:
+        try:
+            rendered_width, output = await run_in_threadpool(
+                gcs.render_variant, path, width, image_format
+            )
+        except UnidentifiedImageError:
+            raise HTTPException(status_code=422, detail=f"`{path}` is not an image.")
+        with output:
+            cached_image = await run_in_threadpool(derivative_cache.put, key, output)
+        LOGGER.info(f"Rendered `{path}` at {rendered_width}w as {image_format}.")
+    return StreamingResponse(
+        read_chunks(cached_image),
+        media_type=VARIANT_FORMATS[image_format]["content_type"],
+        headers=headers,
+    )
+
+
 @router.get("/lynx")
 async def bulk_assign_lynx_images():
     """Assign images to any Lynx posts which are missing a feature image."""
-    results = rdbms.execute_query_from_file(
-        f"{basedir}/database/queries/images/lynx_missing_images.sql", "hackers_prod"
-    )
+    results = rdbms.read_query(queries["images/lynx_missing_images"], "hackers_prod")
     posts = [result.id for result in results]
-    for post in posts:
-        image = gcs.fetch_random_lynx_image()
-        result = rdbms.execute_query(
-            f"UPDATE posts SET feature_image = '{image}' WHERE id = '{post}';",
-            "hackers_prod",
-        )
-        if result:
-            LOGGER.info(f"Updated Lynx post {post} with image {image}")
-    LOGGER.success(f"Updated {len(posts)} Lynx posts with image")
+    rows = [
+        {"id": post, "feature_image": gcs.fetch_random_lynx_image(no_repeat=True)}
+        for post in posts
+    ]
+    rdbms.bulk_update(rows, "posts", "hackers_prod")
+    LOGGER.success(f"Updated {len(posts)} Lynx posts with image: {rows}")
     return {"updated": posts}
 
 
 @router.get("/sort")
-async def bulk_organize_images(directory: Optional[str] = None):
+async def bulk_organize_images(directory: Optional[str] = None, dry_run: bool = False):
     """
     Sort retina and mobile images into their appropriate directories.
 
     :param directory: Remote directory to organize images into subdirectories.
     :type directory: Optional[str]
+    :param dry_run: Report images which would be moved without moving them.
+    :type dry_run: bool
     """
     if directory is None:
         directory = settings.GCP_BUCKET_FOLDER
-    retina_images = gcs.organize_retina_images(directory)
+    retina_images = gcs.organize_retina_images(directory, dry_run=dry_run)
     image_headers = gcs.image_headers(directory)
     LOGGER.success(
         f"Moved {len(retina_images)} retina images, modified {len(image_headers)} content types."
@@ -0,0 +1,151 @@
+"""Size-capped on-disk cache of rendered image derivatives.
+
+The directory is the index, so worker processes can share one cache: entries
+are opened before streaming, and recency is tracked by modification time.
+"""
+import shutil
+from os import DirEntry, makedirs, path, remove, replace, scandir, utime
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import time_ns
+from typing import IO, Iterator, List, Optional
+
+from log import LOGGER
+
+# Bytes read per chunk when streaming a cached derivative to a client.
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def read_chunks(file: IO[bytes]) -> Iterator[bytes]:
+    """
+    Stream an open cached derivative in fixed-size chunks, closing it when done.
+
+    :param file: Cached derivative as returned by `DerivativeCache`.
+    :type file: IO[bytes]
+    :returns: Iterator[bytes]
+    """
+    with file:
+        while True:
+            chunk = file.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+class DerivativeCache:
+    """Least-recently-used cache of rendered images stored on local disk."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        makedirs(directory, exist_ok=True)
+
+    @property
+    def size(self) -> int:
+        """Total bytes of cached derivatives."""
+        return sum(entry.stat().st_size for entry in self._scan())
+
+    def _path(self, key: str) -> str:
+        """
+        Filesystem path of a cached derivative.
+
+        :param key: Hex digest identifying a derivative.
+        :type key: str
+        :returns: str
+        """
+        return path.join(self.directory, key)
+
+    def _scan(self) -> List[DirEntry]:
+        """
+        List cached derivatives, skipping partially written temp files.
+
+        :returns: List[DirEntry]
+        """
+        return [
+            entry
+            for entry in scandir(self.directory)
+            if entry.is_file() and not entry.name.endswith(".tmp")
+        ]
+
+    def get(self, key: str) -> Optional[IO[bytes]]:
+        """
+        Open a cached derivative, marking it as recently used.
+
+        :param key: Hex digest identifying a derivative.
+        :type key: str
+        :returns: Optional[IO[bytes]]
+        """
+        try:
+            file = open(self._path(key), "rb")
+        except FileNotFoundError:
+            return None
+        self._touch(key)
+        return file
+
+    def put(self, key: str, file_obj: IO[bytes]) -> IO[bytes]:
+        """
+        Store a derivative, evicting least-recently-used entries beyond the size cap.
+
+        :param key: Hex digest identifying a derivative.
+        :type key: str
+        :param file_obj: Encoded image to cache.
+        :type file_obj: IO[bytes]
+        :returns: IO[bytes]
+        """
+        file_obj.seek(0)
+        output = NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False)
+        try:
+            shutil.copyfileobj(file_obj, output)
+            output.flush()
+            replace(output.name, self._path(key))
+        except OSError:
+            output.close()
+            remove(output.name)
+            raise
+        self._touch(key)
+        output.seek(0)
+        self._evict(keep=key)
+        return output
+
+    def _touch(self, key: str):
+        """
+        Mark a derivative as recently used; filesystem timestamps are too coarse.
+
+        :param key: Hex digest identifying a derivative.
+        :type key: str
+        """
+        now = time_ns()
+        try:
+            utime(self._path(key), ns=(now, now))
+        except FileNotFoundError:
+            # Evicted by another worker; an open copy stays readable.
+            pass
+
+    def _evict(self, keep: str):
+        """
+        Delete least recently used derivatives until the cache fits its size cap.
+
+        :param keep: Key of the derivative just stored, which is never evicted.
+        :type keep: str
+        """
+        with self._lock:
+            entries = []
+            for entry in self._scan():
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, entry.name, stat))
+            size = sum(stat.st_size for _, _, stat in entries)
+            for _, name, stat in sorted(entries):
+                if size <= self.max_bytes:
+                    break
+                if name == keep:
+                    continue
+                try:
+                    remove(self._path(name))
+                except FileNotFoundError:
+                    pass
+                size -= stat.st_size
+                LOGGER.info(f"Evicted cached image derivative `{name}`")
@@ -0,0 +1,53 @@
+"""Authenticate Pub/Sub push deliveries before acting on them."""
+from hmac import compare_digest
+from typing import Optional
+
+from fastapi import HTTPException, Request
+from google.auth.exceptions import GoogleAuthError
+from google.auth.transport import requests
+from google.oauth2 import id_token
+
+from log import LOGGER
+
+
+def verify_push(
+    request: Request,
+    token: Optional[str],
+    expected_token: Optional[str],
+    audience: Optional[str],
+    service_account: Optional[str] = None,
+):
+    """
+    Require a push's shared `?token=` secret and/or its signed OIDC bearer token.
+
+    :param request: Incoming push request.
+    :type request: Request
+    :param token: Shared secret passed in the push endpoint's query string.
+    :type token: Optional[str]
+    :param expected_token: Shared secret configured on the push subscription.
+    :type expected_token: Optional[str]
+    :param audience: Audience configured for the subscription's OIDC tokens.
+    :type audience: Optional[str]
+    :param service_account: Email of the service account which signs pushes.
+    :type service_account: Optional[str]
+    """
+    if not expected_token and not audience:
+        LOGGER.error("Rejected Pub/Sub push; no push authentication is configured.")
+        raise HTTPException(status_code=403, detail="Push authentication disabled.")
+    if expected_token and not compare_digest(token or "", expected_token):
+        raise HTTPException(status_code=403, detail="Invalid push token.")
+    if audience:
+        scheme, _, bearer = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not bearer:
+            raise HTTPException(status_code=401, detail="Missing push bearer token.")
+        try:
+            claims = id_token.verify_oauth2_token(
+                bearer, requests.Request(), audience=audience
+            )
+        except (GoogleAuthError, ValueError) as e:
+            LOGGER.warning(f"Rejected Pub/Sub push with invalid bearer token: {e}")
+            raise HTTPException(status_code=401, detail="Invalid push bearer token.")
+        if service_account and (
+            claims.get("email") != service_account or not claims.get("email_verified")
+        ):
+            raise HTTPException(status_code=403, detail="Unexpected push sender.")
@@ -0,0 +1,28 @@
+from io import BytesIO
+
+from app.images.cache import DerivativeCache, read_chunks
+
+
+def test_derivative_cache_evicts_least_recently_used(tmp_path):
+    """Cache stays within its size cap by evicting the least recently used image."""
+    cache = DerivativeCache(str(tmp_path), max_bytes=250)
+    for key in ["a", "b"]:
+        cache.put(key, BytesIO(b"x" * 100)).close()
+    cache.get("a").close()
+    cache.put("c", BytesIO(b"x" * 100)).close()
+    assert cache.get("b") is None
+    assert b"".join(read_chunks(cache.get("a"))) == b"x" * 100
+    assert cache.get("c") is not None
+    assert cache.size == 200
+    assert sorted(entry.name for entry in tmp_path.iterdir()) == ["a", "c"]
+
+
+def test_derivative_cache_shared_between_workers(tmp_path):
+    """Entries opened by one worker stay readable after another evicts them."""
+    first = DerivativeCache(str(tmp_path), max_bytes=150)
+    second = DerivativeCache(str(tmp_path), max_bytes=150)
+    first.put("a", BytesIO(b"a" * 100)).close()
+    streaming = second.get("a")
+    first.put("b", BytesIO(b"b" * 100)).close()
+    assert second.get("a") is None
+    assert b"".join(read_chunks(streaming)) == b"a" * 100
@@ -0,0 +1,37 @@
+import pytest
+from fastapi import HTTPException
+from mock import Mock, patch
+
+from app.images.pubsub import verify_push
+
+
+def test_verify_push_token():
+    """Pushes are rejected unless authentication is configured and satisfied."""
+    request = Mock(headers={})
+    with pytest.raises(HTTPException) as e:
+        verify_push(request, "secret", None, None)
+    assert e.value.status_code == 403
+    with pytest.raises(HTTPException) as e:
+        verify_push(request, "wrong", "secret", None)
+    assert e.value.status_code == 403
+    verify_push(request, "secret", "secret", None)
+
+
+def test_verify_push_bearer_token():
+    """Signed push tokens must verify and come from the expected sender."""
+    request = Mock(headers={"authorization": "Bearer jwt"})
+    claims = {"email": "push@example.iam.gserviceaccount.com", "email_verified": True}
+    with patch("app.images.pubsub.id_token.verify_oauth2_token", return_value=claims):
+        verify_push(request, None, None, "https://api.example.com/images/events")
+        with pytest.raises(HTTPException) as e:
+            verify_push(
+                request,
+                None,
+                None,
+                "https://api.example.com/images/events",
+                "other@example.iam.gserviceaccount.com",
+            )
+        assert e.value.status_code == 403
+    with pytest.raises(HTTPException) as e:
+        verify_push(Mock(headers={}), None, None, "https://api.example.com")
+    assert e.value.status_code == 401
@@ -0,0 +1,38 @@
+"""Expose runtime performance metrics."""
+from typing import Optional
+
+from fastapi import APIRouter
+
+from database import engines, query_stats
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get(
+    "/pool",
+    summary="Database connection pool usage.",
+    description="Connections in use and checkout wait times per database connection pool.",
+)
+async def database_pool_metrics():
+    """Report connection pool usage & time spent waiting for pooled connections."""
+    return engines.pool_status()
+
+
+@router.get(
+    "/queries",
+    summary="Database query timings.",
+    description="Calls, rows and total, average & maximum duration per SQL statement.",
+)
+async def database_query_metrics(limit: Optional[int] = 50, reset: bool = False):
+    """
+    Report statements in order of aggregate time spent executing them.
+
+    :param limit: Maximum number of statements to report.
+    :type limit: Optional[int]
+    :param reset: Clear recorded timings once reported.
+    :type reset: bool
+    """
+    stats = query_stats.summary(limit)
+    if reset:
+        query_stats.reset()
+    return stats
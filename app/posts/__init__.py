@@ -2,11 +2,13 @@
 from datetime import datetime, timedelta
 from time import sleep
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Query
 from fastapi.exceptions import HTTPException
 from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
 
 from app.moment import get_current_datetime, get_current_time
+from app.posts.flags import refresh_flags_for_post, refresh_post_flags
 from app.posts.lynx.parse import batch_lynx_embeds, generate_link_previews
 from app.posts.metadata import assign_img_alt, batch_assign_img_alt
 from app.posts.update import (
@@ -16,14 +18,19 @@ from app.posts.update import (
     update_metadata_images,
 )
 from clients import ghost
-from config import basedir
-from database import rdbms
+from config import settings
+from database import queries, rdbms
+from database.crud import get_watermarks, set_watermarks
+from database.orm import get_db
 from database.read_sql import collect_sql_queries, fetch_raw_lynx_posts
 from database.schemas import PostBulkUpdate, PostUpdate
 from log import LOGGER
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
+# Watermark of the last refresh of derived post flags.
+FLAGS_JOB = "posts/flags/refresh"
+
 
 @router.post(
     "/",
@@ -39,6 +46,7 @@ async def update_post(post_update: PostUpdate):
     :param post_update: Request to update Ghost post.
     :type post_update: PostUpdate
     """
+    refresh_flags_for_post(post_update.post.current.id)
     previous_update = post_update.post.previous
     if previous_update:
         current_time = get_current_datetime()
@@ -89,6 +97,8 @@ async def update_post(post_update: PostUpdate):
     time = get_current_time()
     body["posts"][0]["updated_at"] = time
     response, code = ghost.update_post(post.id, body, post.slug)
+    # Our own update's webhook is ignored above, so refresh flags for it here.
+    refresh_flags_for_post(post.id)
     LOGGER.success(f"Successfully updated post `{slug}`: {body}")
     return {str(code): response}
 
@@ -99,12 +109,51 @@ async def update_post(post_update: PostUpdate):
     description="Run a sequence of analytics to ensure all posts have proper metadata.",
     response_model=PostBulkUpdate,
 )
-async def batch_update_metadata():
+async def batch_update_metadata(
+    mode: str = Query(
+        default="autocommit",
+        title="mode",
+        description="Run updates as `autocommit` statements, one `transaction`, \
+            or `concurrent` transactions per table.",
+        regex="^(autocommit|transaction|concurrent)$",
+    ),
+    full_run: bool = Query(
+        default=False,
+        title="full_run",
+        description="Rewrite all rows rather than those changed since the last run.",
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Run `posts/updates` queries over rows updated since each query's last
+    successful run, reporting rows affected & duration per query.
+
+    :param mode: Execution mode of update queries.
+    :type mode: str
+    :param full_run: Ignore watermarks and rewrite all rows.
+    :type full_run: bool
+    :param db: ORM database session.
+    :type db: Session
+    """
     update_queries = collect_sql_queries("posts/updates")
-    update_results, num_updated = rdbms.execute_queries(update_queries, "hackers_prod")
-    insert_posts = rdbms.execute_query_from_file(
-        f"{basedir}/database/queries/posts/selects/missing_all_metadata.sql",
-        "hackers_prod",
+    jobs = {name: f"posts/updates/{name}" for name in update_queries}
+    # Overlap runs slightly so rows committed mid-run or with clock skew aren't missed.
+    run_started = datetime.utcnow() - timedelta(seconds=settings.SQL_WATERMARK_OVERLAP)
+    watermarks = get_watermarks(db, [] if full_run else [FLAGS_JOB, *jobs.values()])
+    # Updates select posts by their flags, so bring flags up to date first.
+    if refresh_post_flags(watermarks.get(FLAGS_JOB, datetime(1970, 1, 1))) is not None:
+        set_watermarks(db, {FLAGS_JOB: run_started})
+    params = {
+        name: {"since": watermarks.get(job, datetime(1970, 1, 1))}
+        for name, job in jobs.items()
+    }
+    update_results, num_updated = rdbms.execute_queries(
+        update_queries, "hackers_prod", mode=mode, params=params
+    )
+    if update_results:
+        set_watermarks(db, {jobs[name]: run_started for name in update_results})
+    insert_posts = rdbms.read_query(
+        queries["posts/selects/missing_all_metadata"], "hackers_prod"
     )
     insert_results = update_metadata(insert_posts)
     LOGGER.success(
@@ -149,10 +198,12 @@ async def post_link_previews(post_update: PostUpdate):
         if html is not None and "kg-card" not in html:
             if previous.get("slug", None) is None:
                 num_embeds, doc = generate_link_previews(post.__dict__)
-                result = rdbms.execute_query(
-                    f"UPDATE posts SET mobiledoc = '{doc}' WHERE id = '{post_id}';",
+                result = rdbms.execute_params(
+                    "UPDATE posts SET mobiledoc = :mobiledoc WHERE id = :id;",
+                    {"mobiledoc": doc, "id": post_id},
                     "hackers_prod",
                 )
+                refresh_flags_for_post(post_id)
                 LOGGER.info(f"Generated Previews for Lynx post {slug}: {doc}")
                 return result
         return JSONResponse(
@@ -0,0 +1,34 @@
+"""Maintain indexed flags derived from post content, eg. `has_image_card`."""
+from datetime import datetime
+from typing import Optional
+
+from database import queries, rdbms
+from log import LOGGER
+
+
+def refresh_post_flags(since: datetime) -> Optional[int]:
+    """
+    Recompute flags of every post updated since a given time.
+
+    :param since: Refresh posts updated at or after this time.
+    :type since: datetime
+    :returns: Optional[int]
+    """
+    rows = rdbms.execute_params(
+        queries["posts/flags/refresh"], {"since": since}, "hackers_prod"
+    )
+    LOGGER.info(f"Refreshed flags of posts updated since {since}: {rows} rows.")
+    return rows
+
+
+def refresh_flags_for_post(post_id: str) -> Optional[int]:
+    """
+    Recompute flags of a single post, eg. upon receiving its update webhook.
+
+    :param post_id: ID of updated post.
+    :type post_id: str
+    :returns: Optional[int]
+    """
+    return rdbms.execute_params(
+        queries["posts/flags/refresh_post"], {"post_id": post_id}, "hackers_prod"
+    )
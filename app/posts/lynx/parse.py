@@ -1,11 +1,11 @@
 """Replace <a> tags in Lynx posts with cards."""
 import re
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 import requests
 import simplejson as json
 from requests.exceptions import HTTPError, SSLError
-from sqlalchemy.engine.result import Result
+from sqlalchemy.engine.row import Row
 
 from app.posts.lynx.mobiledoc import mobile_doc
 from app.posts.lynx.scrape import scrape_link
@@ -58,7 +58,7 @@ def remove_404s(links: List[str]) -> List[str]:
     return valid_links
 
 
-def batch_lynx_embeds(posts: Result) -> dict:
+def batch_lynx_embeds(posts: Iterator[Row]) -> dict:
     """Generate link embeds for multiple Lynx posts."""
     total_embeds = 0
     updated_posts = []
@@ -75,7 +75,7 @@ def batch_lynx_embeds(posts: Result) -> dict:
         )
     return {
         "summary": {
-            "posts_updated": posts.rowcount(),
+            "posts_updated": len(updated_posts),
             "links_updated": total_embeds,
             "posts": updated_posts,
         }
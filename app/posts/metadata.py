@@ -1,11 +1,10 @@
-from typing import List, Optional
+from typing import Iterator, List
 
 import simplejson as json
 
 from app.posts.update import update_mobiledoc
 from clients import ghost
-from config import basedir
-from database import rdbms
+from database import queries, rdbms
 
 images_updated = []
 posts_update = []
@@ -27,8 +26,9 @@ def assign_img_alt(mobiledoc: str) -> str:
 def batch_assign_img_alt():
     """Update image cards lacking `alt` img attribute."""
     updated_posts = []
-    posts = posts_missing_alt_text()
-    for post in posts:
+    total_posts = 0
+    for post in posts_missing_alt_text():
+        total_posts += 1
         mobiledoc = json.loads(post["mobiledoc"])
         mobiledoc = assign_img_alt(mobiledoc)
         post_update = update_mobiledoc(post, mobiledoc)
@@ -43,24 +43,26 @@ def batch_assign_img_alt():
             )
     return {
         "summary": {
-            "total_posts": len(posts),
+            "total_posts": total_posts,
             "updated_posts": len(updated_posts),
         },
         "posts": updated_posts,
     }
 
 
-def posts_missing_alt_text() -> Optional[List[dict]]:
+def posts_missing_alt_text() -> Iterator[dict]:
     """
-    Fetch IDs of posts which lack alt tags in image cards.
+    Fetch posts which lack alt tags in image cards from Ghost, reading their IDs
+    a page at a time so no cursor is held open during Ghost requests.
 
-    :returns: Optional[List[dict]]
+    :returns: Iterator[dict]
     """
-    sql_query = (
-        f"{basedir}/database/queries/posts/selects/img_alt_missing_mobiledoc.sql"
+    pages = rdbms.read_pages(
+        queries["posts/selects/img_alt_missing_mobiledoc"], "hackers_prod"
     )
-    posts = rdbms.execute_query_from_file(sql_query, "hackers_prod")
-    return [ghost.get_post(post["id"]) for post in posts]
+    for page in pages:
+        for post in page:
+            yield ghost.get_post(post["id"])
 
 
 def add_alt_tag(image_card: List) -> List[dict]:
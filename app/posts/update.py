@@ -74,7 +74,7 @@ def update_add_lynx_image(body: dict) -> dict:
     :type body: dict
     :returns: dict
     """
-    feature_image = gcs.fetch_random_lynx_image()
+    feature_image = gcs.fetch_random_lynx_image(no_repeat=True)
     body["posts"][0].update(
         {
             "feature_image": feature_image,
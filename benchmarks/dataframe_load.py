@@ -0,0 +1,179 @@
+"""Benchmark loading analytics DataFrames via pandas' default path vs. `Database`.
+
+Usage: python -m benchmarks.dataframe_load --rows 10000 --output bench.json
+"""
+import argparse
+import random
+from os import makedirs, path
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Dict, Optional
+
+import simplejson as json
+from pandas import DataFrame
+
+from config import basedir
+from database.engines import EngineRegistry
+from database.sql_db import INSERT_CHUNK_SIZE, Database
+from log import LOGGER
+
+# Database & table standing in for `analytics`.`yearly_stats`.
+DATABASE_NAME = "analytics"
+TABLE_NAME = "benchmark_yearly_stats"
+
+# Pandas insert methods benchmarked via `Database.insert_dataframe`.
+METHODS = [None, "multi"]
+
+
+def synthetic_stats(rows: int, seed: int) -> DataFrame:
+    """
+    Build a DataFrame shaped like the results of `analytics/yearly.sql`.
+
+    :param rows: Number of pages to generate.
+    :type rows: int
+    :param seed: Seed for titles & view counts.
+    :type seed: int
+    :returns: DataFrame
+    """
+    rng = random.Random(seed)
+    words = ["python", "sql", "flask", "pandas", "data", "lynx", "async", "gcp"]
+    slugs = [
+        f"{'-'.join(rng.choices(words, k=rng.randint(2, 6)))}-{i}" for i in range(rows)
+    ]
+    return DataFrame(
+        {
+            "title": [slug.replace("-", " ").title() for slug in slugs],
+            "url": [f"https://hackersandslackers.com/{slug}/" for slug in slugs],
+            "slug": slugs,
+            "views": sorted((rng.randint(1, 50000) for _ in slugs), reverse=True),
+        }
+    )
+
+
+def legacy_load(rdbms: Database, df: DataFrame):
+    """
+    Load a DataFrame the way `insert_dataframe` did previously.
+
+    :param rdbms: Database client under benchmark.
+    :type rdbms: Database
+    :param df: Tabular data to insert.
+    :type df: DataFrame
+    """
+    df.to_sql(TABLE_NAME, rdbms.engines[DATABASE_NAME], if_exists="replace")
+
+
+def time_load(
+    load: Callable, rdbms: Database, df: DataFrame, repeat: int
+) -> Dict[str, float]:
+    """
+    Replace the benchmark table `repeat` times & summarize throughput.
+
+    :param load: Function loading a DataFrame into the benchmark table.
+    :type load: Callable
+    :param rdbms: Database client under benchmark.
+    :type rdbms: Database
+    :param df: Tabular data to insert.
+    :type df: DataFrame
+    :param repeat: Number of timed loads.
+    :type repeat: int
+    :returns: Dict[str, float]
+    """
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        load(rdbms, df)
+        timings.append(perf_counter() - start)
+    seconds = median(timings)
+    return {
+        "seconds": round(seconds, 4),
+        "rows_per_sec": round(len(df) / seconds) if seconds else 0,
+    }
+
+
+def run_benchmark(
+    rows: int,
+    seed: int = 0,
+    repeat: int = 3,
+    chunksize: int = INSERT_CHUNK_SIZE,
+    uri: Optional[str] = None,
+) -> Dict[str, dict]:
+    """
+    Benchmark the previous & current DataFrame load paths against one database.
+
+    :param rows: Number of synthetic rows to load.
+    :type rows: int
+    :param seed: Seed for synthetic data.
+    :type seed: int
+    :param repeat: Number of timed loads per path; the median is reported.
+    :type repeat: int
+    :param chunksize: Rows per chunk loaded by `Database.insert_dataframe`.
+    :type chunksize: int
+    :param uri: Database server URI; a temporary SQLite directory if unset.
+    :type uri: Optional[str]
+    :returns: Dict[str, dict]
+    """
+    df = synthetic_stats(rows, seed)
+    with TemporaryDirectory() as tmp:
+        engines = EngineRegistry(uri or f"sqlite:///{tmp}", {})
+        rdbms = Database(engines)
+        dialect = engines[DATABASE_NAME].dialect.name
+        results = {
+            "legacy": time_load(legacy_load, rdbms, df, repeat),
+        }
+        for method in METHODS:
+            results[method or "executemany"] = time_load(
+                lambda rdbms, df: rdbms.insert_dataframe(
+                    df,
+                    TABLE_NAME,
+                    DATABASE_NAME,
+                    "replace",
+                    chunksize=chunksize,
+                    method=method,
+                ),
+                rdbms,
+                df,
+                repeat,
+            )
+        rdbms.execute_query(f"DROP TABLE IF EXISTS {TABLE_NAME}", DATABASE_NAME)
+        engines.dispose()
+    for timing in results.values():
+        timing["speedup"] = round(results["legacy"]["seconds"] / timing["seconds"], 2)
+    LOGGER.info(f"Benchmarked DataFrame loads: {results}")
+    return {
+        "dataframe": {"rows": rows, "seed": seed, "repeat": repeat},
+        "dialect": dialect,
+        "paths": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000, help="Synthetic rows.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed loads per path.")
+    parser.add_argument(
+        "--chunksize", type=int, default=INSERT_CHUNK_SIZE, help="Rows per INSERT."
+    )
+    parser.add_argument("--uri", help="Database server URI (temp SQLite if unset).")
+    parser.add_argument(
+        "--output",
+        default=path.join(basedir, "logs", "benchmark_dataframe_load.json"),
+        help="Path to write JSON results to; `-` for stdout.",
+    )
+    args = parser.parse_args()
+    LOGGER.disable("database")
+    results = json.dumps(
+        run_benchmark(args.rows, args.seed, args.repeat, args.chunksize, args.uri)
+    )
+    if args.output == "-":
+        print(results)
+    else:
+        makedirs(path.dirname(path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as output:
+            output.write(results)
+        LOGGER.success(f"Wrote DataFrame load benchmark to `{args.output}`")
+
+
+if __name__ == "__main__":
+    main()
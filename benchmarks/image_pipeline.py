@@ -0,0 +1,274 @@
+"""Benchmark image transformations against a synthetic, locally stored bucket.
+
+Usage: python -m benchmarks.image_pipeline --images 100 --output bench.json
+"""
+import argparse
+import random
+import resource
+import sys
+from functools import wraps
+from io import BytesIO
+from os import makedirs, path, sysconf
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+import simplejson as json
+from PIL import Image, ImageOps
+
+from clients.storage import GCS
+from clients.storage_backends import LocalBackend, StoredObject
+from config import basedir
+from log import LOGGER
+
+# Dimensions of feature images typically uploaded to the CDN.
+IMAGE_SIZES = [(1200, 675), (1600, 900), (2000, 1125), (2400, 1350), (3000, 2000)]
+
+# Passes benchmarked, in the order the batch image job runs them.
+PASSES = ["retina", "mobile", "standard"]
+
+# Seconds between resident memory samples taken while a pass runs.
+RSS_SAMPLE_INTERVAL = 0.01
+
+
+def synthetic_jpeg(size: tuple, rng: random.Random) -> bytes:
+    """
+    Encode a noisy gradient so file sizes resemble real photographs.
+
+    :param size: Width & height of image.
+    :type size: tuple
+    :param rng: Seeded random number generator.
+    :type rng: random.Random
+    :returns: bytes
+    """
+    gradient = Image.linear_gradient("L").resize(size)
+    texture = (max(size[0] // 4, 1), max(size[1] // 4, 1))
+    noise = Image.effect_noise(texture, rng.randint(20, 60)).resize(size)
+    im = Image.merge("RGB", (gradient, noise, ImageOps.mirror(gradient)))
+    with BytesIO() as output:
+        im.save(output, format="JPEG", quality=90)
+        return output.getvalue()
+
+
+def seed_bucket(backend: LocalBackend, folder: str, count: int, seed: int) -> int:
+    """
+    Upload `count` synthetic images; half standard & half retina-only uploads.
+
+    Standard uploads feed the retina pass, retina-only uploads feed the standard
+    pass, and every retina image feeds the mobile pass.
+
+    :param backend: Local storage stand-in to seed.
+    :type backend: LocalBackend
+    :param folder: Directory to upload images to.
+    :type folder: str
+    :param count: Number of images to generate.
+    :type count: int
+    :param seed: Seed for image dimensions & content.
+    :type seed: int
+    :returns: int
+    """
+    rng = random.Random(seed)
+    total_bytes = 0
+    for i in range(count):
+        data = synthetic_jpeg(rng.choice(IMAGE_SIZES), rng)
+        if i % 2:
+            name = f"{folder}/_retina/upload-{i:05d}@2x.jpg"
+        else:
+            name = f"{folder}/upload-{i:05d}.jpg"
+        backend.write_bytes(name, data, "image/jpg")
+        total_bytes += len(data)
+    return total_bytes
+
+
+def current_rss() -> Optional[int]:
+    """
+    Resident set size of this process in bytes, where `/proc` is available.
+
+    :returns: Optional[int]
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def max_rss() -> int:
+    """
+    Peak resident set size of this process over its lifetime in bytes.
+
+    :returns: int
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class PeakMemory:
+    """Sample resident memory on a background thread to find a block's peak."""
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak = 0
+        self._stop = Event()
+        self._thread = Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while True:
+            rss = current_rss()
+            if rss is None:
+                return
+            self.peak = max(self.peak, rss)
+            if self._stop.wait(self.interval):
+                return
+
+    def __enter__(self) -> "PeakMemory":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._thread.join()
+        if self.peak == 0:
+            # Without `/proc`, fall back to the lifetime peak of the process.
+            self.peak = max_rss()
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of values.
+
+    :param values: Measurements to rank.
+    :type values: List[float]
+    :param pct: Percentile between 0 and 100.
+    :type pct: float
+    :returns: float
+    """
+    if not values:
+        return 0.0
+    ranked = sorted(values)
+    rank = max(int(round(pct / 100 * len(ranked) + 0.5)) - 1, 0)
+    return ranked[min(rank, len(ranked) - 1)]
+
+
+def time_images(gcs: GCS, latencies: List[float]) -> Callable:
+    """
+    Wrap a transformer's per-image step to record its latency.
+
+    :param gcs: Image transformer under benchmark.
+    :type gcs: GCS
+    :param latencies: List to append per-image seconds to.
+    :type latencies: List[float]
+    :returns: Callable
+    """
+    new_image_blob = gcs._new_image_blob
+
+    @wraps(new_image_blob)
+    def timed(image_blob: StoredObject, *args, **kwargs) -> Optional[str]:
+        start = perf_counter()
+        try:
+            return new_image_blob(image_blob, *args, **kwargs)
+        finally:
+            latencies.append(perf_counter() - start)
+
+    return timed
+
+
+def run_pass(gcs: GCS, folder: str, transformation: str) -> Dict[str, float]:
+    """
+    Run a single transformation pass and summarize its throughput & memory,
+    raising if it transformed no images.
+
+    :param gcs: Image transformer under benchmark.
+    :type gcs: GCS
+    :param folder: Directory of synthetic images.
+    :type folder: str
+    :param transformation: Name of pass to run (retina, mobile, standard).
+    :type transformation: str
+    :returns: Dict[str, float]
+    """
+    latencies = []
+    gcs._new_image_blob = time_images(gcs, latencies)
+    transform = getattr(gcs, f"{transformation}_transformations")
+    with PeakMemory() as memory:
+        start = perf_counter()
+        images = transform(folder) or []
+        elapsed = perf_counter() - start
+    del gcs._new_image_blob
+    if not images:
+        # Transformers log & skip failing images, so an empty pass means every
+        # image failed (eg. a signature change) rather than a fast benchmark.
+        raise RuntimeError(f"The {transformation} pass transformed no images.")
+    return {
+        "images": len(images),
+        "seconds": round(elapsed, 4),
+        "images_per_sec": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "peak_rss_mb": round(memory.peak / 1024 / 1024, 1),
+    }
+
+
+def run_benchmark(
+    count: int, seed: int = 0, directory: Optional[str] = None
+) -> Dict[str, dict]:
+    """
+    Seed a synthetic bucket and benchmark each transformation pass over it.
+
+    :param count: Number of synthetic images to generate.
+    :type count: int
+    :param seed: Seed for image dimensions & content.
+    :type seed: int
+    :param directory: Local directory standing in for the bucket; temporary if unset.
+    :type directory: Optional[str]
+    :returns: Dict[str, dict]
+    """
+    with TemporaryDirectory() as tmp:
+        backend = LocalBackend(directory or tmp)
+        folder = "benchmark"
+        seeded_bytes = seed_bucket(backend, folder, count, seed)
+        gcs = GCS(
+            "benchmark",
+            "https://cdn.example.com/",
+            "roundup",
+            backend.root,
+            backend=backend,
+        )
+        results = {}
+        for transformation in PASSES:
+            results[transformation] = run_pass(gcs, folder, transformation)
+            LOGGER.info(f"Benchmarked {transformation} pass: {results[transformation]}")
+    return {
+        "bucket": {"images": count, "bytes": seeded_bytes, "seed": seed},
+        "passes": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=100, help="Synthetic images.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument("--directory", help="Local bucket directory (temp if unset).")
+    parser.add_argument(
+        "--output",
+        default=path.join(basedir, "logs", "benchmark_image_pipeline.json"),
+        help="Path to write JSON results to; `-` for stdout.",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Log each transformed image."
+    )
+    args = parser.parse_args()
+    if not args.verbose:
+        LOGGER.disable("clients")
+    results = json.dumps(run_benchmark(args.images, args.seed, args.directory))
+    if args.output == "-":
+        print(results)
+    else:
+        makedirs(path.dirname(path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as output:
+            output.write(results)
+        LOGGER.success(f"Wrote image pipeline benchmark to `{args.output}`")
+
+
+if __name__ == "__main__":
+    main()
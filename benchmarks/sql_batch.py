@@ -0,0 +1,119 @@
+"""Benchmark the post update batch jobs against a seeded local database.
+
+Usage: python -m benchmarks.sql_batch --posts 50000 --output bench.json
+"""
+import argparse
+from datetime import datetime
+from os import makedirs, path
+from shutil import copyfile
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Dict
+
+import simplejson as json
+
+from config import basedir
+from database.engines import EngineRegistry
+from database.local import LOCAL_ENGINE_ARGS, ensure_local_database, local_uri
+from database.models import PostFlags
+from database.query_registry import QueryRegistry
+from database.sql_db import EXECUTION_MODES, Database
+from log import LOGGER
+
+# Database which batch jobs update.
+DATABASE_NAME = "hackers_prod"
+
+
+def time_batch(directory: str, mode: str, queries: QueryRegistry) -> Dict[str, float]:
+    """
+    Refresh post flags & run every post update in one execution mode.
+
+    :param directory: Directory containing a freshly seeded local database.
+    :type directory: str
+    :param mode: Execution mode passed to `Database.execute_queries`.
+    :type mode: str
+    :param queries: Registry of SQL queries.
+    :type queries: QueryRegistry
+    :returns: Dict[str, float]
+    """
+    engines = EngineRegistry(local_uri(directory), LOCAL_ENGINE_ARGS)
+    rdbms = Database(engines)
+    since = {"since": datetime(1970, 1, 1)}
+    updates = queries.collection("posts/updates")
+    start = perf_counter()
+    rdbms.execute_params(queries["posts/flags/refresh"], since, DATABASE_NAME)
+    flags_seconds = perf_counter() - start
+    results, rows = rdbms.execute_queries(
+        updates, DATABASE_NAME, mode=mode, params={name: since for name in updates}
+    )
+    seconds = perf_counter() - start
+    engines.dispose()
+    return {
+        "seconds": round(seconds, 4),
+        "flags_seconds": round(flags_seconds, 4),
+        "queries": len(results),
+        "rows": rows,
+    }
+
+
+def run_benchmark(posts: int, seed: int = 0) -> Dict[str, dict]:
+    """
+    Seed a local database once, then time the update batch on a copy per mode.
+
+    :param posts: Number of synthetic posts to seed.
+    :type posts: int
+    :param seed: Seed for synthetic posts.
+    :type seed: int
+    :returns: Dict[str, dict]
+    """
+    queries = QueryRegistry(f"{basedir}/database/queries")
+    with TemporaryDirectory() as tmp:
+        seeded = path.join(tmp, "seeded")
+        engines = EngineRegistry(local_uri(seeded), LOCAL_ENGINE_ARGS)
+        start = perf_counter()
+        ensure_local_database(engines, posts, seed)
+        PostFlags.__table__.create(bind=engines[DATABASE_NAME])
+        seed_seconds = perf_counter() - start
+        engines.dispose()
+        results = {}
+        for mode in EXECUTION_MODES:
+            directory = path.join(tmp, mode)
+            makedirs(directory)
+            copyfile(
+                path.join(seeded, DATABASE_NAME), path.join(directory, DATABASE_NAME)
+            )
+            results[mode] = time_batch(directory, mode, queries)
+    LOGGER.info(f"Benchmarked post update batch: {results}")
+    return {
+        "database": {
+            "posts": posts,
+            "seed": seed,
+            "seed_seconds": round(seed_seconds, 4),
+        },
+        "modes": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=10000, help="Synthetic posts.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument(
+        "--output",
+        default=path.join(basedir, "logs", "benchmark_sql_batch.json"),
+        help="Path to write JSON results to; `-` for stdout.",
+    )
+    args = parser.parse_args()
+    LOGGER.disable("database")
+    results = json.dumps(run_benchmark(args.posts, args.seed))
+    if args.output == "-":
+        print(results)
+    else:
+        makedirs(path.dirname(path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as output:
+            output.write(results)
+        LOGGER.success(f"Wrote SQL batch benchmark to `{args.output}`")
+
+
+if __name__ == "__main__":
+    main()
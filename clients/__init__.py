@@ -6,14 +6,28 @@ from clients.google_bigquery import BigQuery
 from clients.mail import Mailgun
 from clients.sms import Twilio
 from clients.storage import GCS
+from clients.storage_backends import GCSBackend, LocalBackend
 from config import basedir, settings
 
+# Image storage backend
+if settings.STORAGE_BACKEND == "local":
+    storage_backend = LocalBackend(settings.STORAGE_LOCAL_DIRECTORY)
+else:
+    storage_backend = GCSBackend(settings.GCP_BUCKET_NAME, basedir)
+
 # Google Cloud Storage
 gcs = GCS(
     bucket_name=settings.GCP_BUCKET_NAME,
     bucket_url=settings.GCP_BUCKET_URL,
     bucket_lynx=settings.GCP_LYNX_DIRECTORY,
     basedir=basedir,
+    variant_widths=settings.GCP_IMAGE_VARIANT_WIDTHS,
+    variant_formats=settings.GCP_IMAGE_VARIANT_FORMATS,
+    manifest_path=settings.GCP_IMAGE_MANIFEST,
+    cursor_path=settings.GCP_IMAGE_CURSORS,
+    lynx_pool_ttl=settings.GCP_LYNX_POOL_TTL,
+    max_workers=settings.GCP_IMAGE_WORKERS,
+    backend=storage_backend,
 )
 
 # Ghost Admin Client
@@ -1,114 +1,160 @@
 """Google Cloud Storage client and image transformer."""
 import re
-from io import BytesIO
-from random import randint
-from typing import Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from random import choice, shuffle
+from tempfile import SpooledTemporaryFile
+from threading import Lock
+from time import monotonic
+from typing import IO, Dict, Iterator, List, Optional, Tuple
 
+import simplejson as json
 from fastapi.exceptions import HTTPException
-from google.cloud import storage
 from google.cloud.exceptions import GoogleCloudError
-from google.cloud.storage.blob import Blob
-from google.cloud.storage.client import Bucket, Client
 from PIL import Image
 
+from clients.storage_backends import (
+    GCSBackend,
+    GenerationMismatch,
+    StorageBackend,
+    StoredObject,
+)
 from log import LOGGER
 
+try:
+    # Registers an AVIF codec with Pillow builds which lack native support.
+    import pillow_avif  # noqa: F401
+except ImportError:
+    pass
+
+# Encoded images larger than this are spooled to disk rather than held in memory.
+SPOOL_MAX_SIZE = 2 * 1024 * 1024
+
+# Attempts at merging into a JSON object which other workers are also updating.
+JSON_MERGE_ATTEMPTS = 5
+
+# Encoder settings for each responsive variant output format.
+VARIANT_FORMATS = {
+    "jpeg": {
+        "extension": "jpg",
+        "content_type": "image/jpeg",
+        "options": {"quality": 85, "optimize": True, "progressive": True},
+    },
+    "webp": {
+        "extension": "webp",
+        "content_type": "image/webp",
+        "options": {"quality": 80, "method": 4},
+    },
+    "avif": {
+        "extension": "avif",
+        "content_type": "image/avif",
+        "options": {"quality": 60},
+    },
+}
+
 
 class GCS:
     """Google Cloud Storage image CDN."""
 
     def __init__(
-        self, bucket_name: str, bucket_url: str, bucket_lynx: str, basedir: str
+        self,
+        bucket_name: str,
+        bucket_url: str,
+        bucket_lynx: str,
+        basedir: str,
+        variant_widths: Optional[List[int]] = None,
+        variant_formats: Optional[List[str]] = None,
+        manifest_path: str = "_manifest/variants.json",
+        cursor_path: str = "_manifest/cursors.json",
+        lynx_pool_ttl: int = 3600,
+        max_workers: int = 4,
+        backend: Optional[StorageBackend] = None,
     ):
         self.bucket_name = bucket_name
         self.bucket_url = bucket_url
         self.bucket_lynx = bucket_lynx
         self.basedir = basedir
-
-    @property
-    def client(self) -> Client:
-        """
-        Google Cloud Storage client.
-
-        :returns: Client
-        """
-        return storage.Client().from_service_account_json(f"{self.basedir}/gcloud.json")
-
-    @property
-    def bucket(self) -> Bucket:
-        """
-        Google Cloud Storage bucket where images are stored.
-
-        :returns: Bucket
-        """
-        return self.client.get_bucket(self.bucket_name)
+        self.backend = backend or GCSBackend(bucket_name, basedir)
+        self.variant_widths = sorted(variant_widths or [400, 800, 1200, 1600])
+        self.variant_formats = self._supported_formats(
+            variant_formats or ["jpeg", "webp", "avif"]
+        )
+        self.manifest_path = manifest_path
+        self.cursor_path = cursor_path
+        self.lynx_pool_ttl = lynx_pool_ttl
+        self.max_workers = max_workers
+        self._manifest_lock = Lock()
+        self._cursor_lock = Lock()
+        self._lynx_pool: List[str] = []
+        self._lynx_pool_loaded_at: Optional[float] = None
+        self._lynx_deck: List[str] = []
+        self._lynx_last: Optional[str] = None
 
     @property
     def bucket_http_url(self) -> str:
         """Publicly accessible URL for images."""
         return self.bucket_url
 
-    def get(self, prefix: str) -> Iterator:
+    def get(self, prefix: str) -> Iterator[StoredObject]:
         """
         Retrieve all blobs in a bucket containing a prefix.
 
         :param prefix: Substring to match against filenames.
         :type prefix: str
-        :returns: Iterator
+        :returns: Iterator[StoredObject]
         """
-        return self.bucket.list_blobs(prefix=prefix)
+        return self.backend.list(prefix)
 
     def _get_standard_blobs(self, folder):
         files = self.get(prefix=folder)
-        return [
-            file
-            for file in files
-            if ".jpg" in file.name
-            and "@2x.jpg" not in file.name
-            and "/_retina" not in file.name
-            and "/_mobile" not in file.name
-            and "/authors" not in file.name
-            and "/assets" not in file.name
-        ]
+        return [file for file in files if self._is_standard_image(file.name)]
 
-    def _get_retina_blobs(self, directory: str) -> List[Blob]:
+    def _get_retina_blobs(self, directory: str) -> List[StoredObject]:
         """
         Retrieve retina image blobs from directory in GCS bucket.
 
         :param directory: Directory from which to fetch blobs.
         :type directory: str
-        :returns: List[Blob]
+        :returns: List[StoredObject]
         """
         files = self.get(prefix=directory)
-        return [
-            file for file in files if "@2x.jpg" in file.name and "/_retina" in file.name
-        ]
+        return [file for file in files if self._is_retina_image(file.name)]
 
-    def _get_mobile_blobs(self, directory: str) -> List[Blob]:
+    def _get_mobile_blobs(self, directory: str) -> List[StoredObject]:
         """
         Retrieve mobile image blobs from directory in GCS bucket.
 
         :param directory: Directory from which to fetch blobs.
         :type directory: str
-        :returns: List[Blob]
+        :returns: List[StoredObject]
         """
         files = self.get(prefix=directory)
         return [
             file
             for file in files
-            if "@2x" not in file.name and "/_mobile" not in file.name
+            if "@2x" not in file.name
+            and "/_mobile" not in file.name
+            and "/_responsive" not in file.name
         ]
 
     @LOGGER.catch
-    def purge_unwanted_images(self, folder: str) -> List[str]:
+    def purge_unwanted_images(
+        self,
+        folder: str,
+        dry_run: bool = False,
+        image_blobs: Optional[List[StoredObject]] = None,
+    ) -> List[str]:
         """
         Delete images which have been compressed or generated multiple times.
 
         :param folder: Directory to recursively apply image transformations.
         :type folder: str
+        :param dry_run: Report images which would be purged without deleting them.
+        :type dry_run: bool
+        :param image_blobs: Check only these blobs rather than listing `folder`.
+        :type image_blobs: Optional[List[StoredObject]]
         :returns: List[str]
         """
-        images_purged = []
         LOGGER.info("Purging unwanted images...")
         substrings = [
             "@2x@2x",
@@ -122,53 +168,93 @@ class GCS:
             "_retina/_retina",
             "_retina/_mobile/",
         ]
-        blobs = self.get(
-            folder,
-        )
-        image_blob_names = [blob.name for blob in blobs]
-        for image_blob_name in image_blob_names:
-            if any(substr in image_blob_name for substr in substrings):
-                self.bucket.delete_blob(image_blob_name)
-                images_purged.append(image_blob_name)
-                LOGGER.info(f"Deleted {image_blob_name}.")
-        return images_purged
-
-    def _remove_repeat_blobs(self, image_blobs):
-        images_purged = []
+        blobs = image_blobs
+        if blobs is None:
+            blobs = self.get(
+                folder,
+            )
+        image_blob_names = [
+            blob.name
+            for blob in blobs
+            if "/_responsive/" not in blob.name
+            and any(substr in blob.name for substr in substrings)
+        ]
+        return self.delete_blobs(image_blob_names, dry_run=dry_run)
+
+    def _remove_repeat_blobs(
+        self, image_blobs: List[str], dry_run: bool = False
+    ) -> List[str]:
         r = re.compile("-[0-9]-[0-9]@2x.jpg")
-        repeat_blobs = list(filter(r.match, image_blobs))
-        for repeat_blob in repeat_blobs:
-            self.bucket.delete_blob(repeat_blob)
-            images_purged.append(repeat_blob)
-            LOGGER.info(f"Deleted {repeat_blob}")
+        repeat_blobs = list(filter(r.search, image_blobs))
+        return self.delete_blobs(repeat_blobs, dry_run=dry_run)
 
     @LOGGER.catch
-    def organize_retina_images(self, folder: str) -> List:
+    def organize_retina_images(self, folder: str, dry_run: bool = False) -> List:
         """
         Move images into their respective folders.
 
         :param folder: Directory to recursively apply image transformations.
         :type folder: str
+        :param dry_run: Report images which would be moved without moving them.
+        :type dry_run: bool
 
         :returns: List
         """
-        moved_blobs = []
-        image_blobs = self._get_retina_blobs(folder)
-        for image_blob in image_blobs:
-            image_folder, image_name = self._get_folder_and_filename(image_blob)
-            if "/_retina/" in image_name:
-                pass
-            moved_blob = self.bucket.blob(f"{image_folder}/_retina/{image_name}")
-            if moved_blob.exists() is False:
-                moved_blob = self.bucket.copy_blob(
-                    image_blob, self.bucket, new_name=moved_blob.name
-                )
-                image_blob.delete()
-                moved_blobs.append(moved_blob.name)
-                LOGGER.info(f"Moved `{image_blob.name}` -> `{moved_blob.name}`")
-            LOGGER.info(f"Ignored moving `{moved_blob.name}`")
+        existing_blob_names = {blob.name for blob in self.get(prefix=folder)}
+        image_blobs = [
+            blob_name
+            for blob_name in existing_blob_names
+            if "@2x.jpg" in blob_name and "/_retina" not in blob_name
+        ]
+        moves = []
+        for image_blob_name in image_blobs:
+            image_folder, image_name = image_blob_name.rsplit("/", 1)
+            moved_blob_name = f"{image_folder}/_retina/{image_name}"
+            if moved_blob_name in existing_blob_names:
+                LOGGER.info(f"Ignored moving `{moved_blob_name}`")
+            else:
+                moves.append((image_blob_name, moved_blob_name))
+        moved_blobs = self.copy_blobs(moves, dry_run=dry_run)
+        self.delete_blobs(
+            [source for source, destination in moves if destination in moved_blobs],
+            dry_run=dry_run,
+        )
         return moved_blobs
 
+    def delete_blobs(self, blob_names: List[str], dry_run: bool = False) -> List[str]:
+        """
+        Delete blobs in batches via the storage backend.
+
+        :param blob_names: Names of blobs to delete.
+        :type blob_names: List[str]
+        :param dry_run: Report blobs which would be deleted without deleting them.
+        :type dry_run: bool
+        :returns: List[str]
+        """
+        if dry_run:
+            for blob_name in blob_names:
+                LOGGER.info(f"Would delete {blob_name}.")
+            return list(blob_names)
+        return self.backend.delete(blob_names)
+
+    def copy_blobs(
+        self, moves: List[Tuple[str, str]], dry_run: bool = False
+    ) -> List[str]:
+        """
+        Copy blobs in batches via the storage backend.
+
+        :param moves: Pairs of (source, destination) blob names.
+        :type moves: List[Tuple[str, str]]
+        :param dry_run: Report blobs which would be copied without copying them.
+        :type dry_run: bool
+        :returns: List[str]
+        """
+        if dry_run:
+            for source, destination in moves:
+                LOGGER.info(f"Would copy `{source}` -> `{destination}`")
+            return [destination for source, destination in moves]
+        return self.backend.copy(moves)
+
     """def image_headers(self, folder: str) -> List:
         header_blobs = []
         image_blobs = [blob for blob in self.get(folder)]
@@ -190,67 +276,623 @@ class GCS:
                 LOGGER.info(f"Applied content-type `image/png` to {image_blob.name}")
         return header_blobs"""
 
+    @staticmethod
+    def _is_standard_image(name: str) -> bool:
+        """
+        Whether a blob is an original, standard resolution image.
+
+        :param name: Blob name.
+        :type name: str
+        :returns: bool
+        """
+        return (
+            ".jpg" in name
+            and "@2x.jpg" not in name
+            and "/_retina" not in name
+            and "/_mobile" not in name
+            and "/_responsive" not in name
+            and "/authors" not in name
+            and "/assets" not in name
+        )
+
+    @staticmethod
+    def _is_retina_image(name: str) -> bool:
+        """
+        Whether a blob is a retina image variant.
+
+        :param name: Blob name.
+        :type name: str
+        :returns: bool
+        """
+        return "@2x.jpg" in name and "/_retina" in name
+
     @LOGGER.catch
-    def retina_transformations(self, folder: str) -> List[Optional[str]]:
+    def retina_transformations(
+        self,
+        folder: str,
+        image_blobs: Optional[List[StoredObject]] = None,
+        dry_run: bool = False,
+    ) -> List[Optional[str]]:
         """
         Create retina image variants from featured images.
 
         :param folder: Directory to recursively apply image transformations,=.
         :type folder: str
+        :param image_blobs: Transform only these blobs rather than listing `folder`.
+        :type image_blobs: Optional[List[StoredObject]]
+        :param dry_run: Report images which would be created without writing them.
+        :type dry_run: bool
         :returns: List[Optional[str]]
         """
         images_transformed = []
-        image_blobs = self._get_standard_blobs(folder)
+        if image_blobs is None:
+            image_blobs = self._get_standard_blobs(folder)
+        else:
+            image_blobs = [b for b in image_blobs if self._is_standard_image(b.name)]
         LOGGER.info(f"Creating retina variants for {len(image_blobs)} images...")
         for image_blob in image_blobs:
             new_image_name = image_blob.name.replace(".jpg", "@2x.jpg")
-            retina_blob = self.bucket.blob(new_image_name)
-            if retina_blob.exists() is False:
-                new_image = self._new_image_blob(image_blob, "retina")
+            if self.backend.exists(new_image_name) is False:
+                new_image = self._new_image_blob(image_blob, "retina", dry_run)
                 if new_image is not None:
                     images_transformed.append(new_image)
         return images_transformed
 
     @LOGGER.catch
-    def standard_transformations(self, folder: str) -> List[Optional[str]]:
+    def standard_transformations(
+        self,
+        folder: str,
+        image_blobs: Optional[List[StoredObject]] = None,
+        dry_run: bool = False,
+    ) -> List[Optional[str]]:
         """
         Generate non-retina variants from retina images missing a standard res counterpart.
 
         :param folder: Directory to recursively apply image transformations.
         :type folder: str
+        :param image_blobs: Transform only these blobs rather than listing `folder`.
+        :type image_blobs: Optional[List[StoredObject]]
+        :param dry_run: Report images which would be created without writing them.
+        :type dry_run: bool
         :returns: List[Optional[str]]
         """
         images_transformed = []
-        retina_blobs = self._get_retina_blobs(folder)
+        if image_blobs is None:
+            retina_blobs = self._get_retina_blobs(folder)
+        else:
+            retina_blobs = [b for b in image_blobs if self._is_retina_image(b.name)]
         LOGGER.info(f"Creating standard variants for {len(retina_blobs)} images...")
         for image_blob in retina_blobs:
             new_image_name = image_blob.name.replace("@2x", "").replace("/_retina", "")
-            standard_blob = self.bucket.blob(new_image_name)
-            if standard_blob.exists() is False:
-                new_image = self._new_image_blob(image_blob, "standard")
+            if self.backend.exists(new_image_name) is False:
+                new_image = self._new_image_blob(image_blob, "standard", dry_run)
                 if new_image is not None:
                     images_transformed.append(new_image)
         return images_transformed
 
     @LOGGER.catch
-    def mobile_transformations(self, folder: str) -> List[Optional[str]]:
+    def mobile_transformations(
+        self,
+        folder: str,
+        image_blobs: Optional[List[StoredObject]] = None,
+        dry_run: bool = False,
+        failed: Optional[List[str]] = None,
+    ) -> List[Optional[str]]:
         """
         Generate mobile-optimized variants of retina images.
 
         :param folder: Directory to recursively apply image transformations.
         :type folder: str
+        :param image_blobs: Transform only these blobs rather than listing `folder`.
+        :type image_blobs: Optional[List[StoredObject]]
+        :param dry_run: Report images which would be created without writing them.
+        :type dry_run: bool
+        :param failed: Collects names of images whose variants failed to render.
+        :type failed: Optional[List[str]]
 
         :returns: List[str]
         """
         images_transformed = []
-        retina_blobs = self._get_retina_blobs(folder)
+        manifest = self.load_manifest()
+        if image_blobs is None:
+            image_blobs = self._get_retina_blobs(folder)
+        retina_blobs = [
+            blob
+            for blob in image_blobs
+            if self._is_retina_image(blob.name)
+            and not self._is_processed(manifest, blob, "mobile")
+        ]
         LOGGER.info(f"Creating mobile variants for {len(retina_blobs)} images...")
+        processed = []
         for image_blob in retina_blobs:
-            new_image = self._new_image_blob(image_blob, "mobile")
+            try:
+                new_image = self._new_image_blob(image_blob, "mobile", dry_run)
+            except Exception:
+                # Already logged; left out of the manifest so it is retried.
+                if failed is not None:
+                    failed.append(image_blob.name)
+                continue
             if new_image is not None:
                 images_transformed.append(new_image)
+            self._record_processed(manifest, image_blob, "mobile", [new_image])
+            processed.append(image_blob.name)
+        if processed and not dry_run:
+            self.save_manifest({name: manifest[name] for name in processed})
+        return images_transformed
+
+    @LOGGER.catch
+    def responsive_transformations(
+        self,
+        folder: str,
+        image_blobs: Optional[List[StoredObject]] = None,
+        dry_run: bool = False,
+        failed: Optional[List[str]] = None,
+    ) -> List[Optional[str]]:
+        """
+        Generate responsive `srcset` variants of standard images.
+
+        :param folder: Directory to recursively apply image transformations.
+        :type folder: str
+        :param image_blobs: Transform only these blobs rather than listing `folder`.
+        :type image_blobs: Optional[List[StoredObject]]
+        :param dry_run: Report images which would be created without writing them.
+        :type dry_run: bool
+        :param failed: Collects names of images whose variants failed to render.
+        :type failed: Optional[List[str]]
+        :returns: List[Optional[str]]
+        """
+        images_transformed = []
+        manifest = self.load_manifest()
+        existing_variants = None
+        if image_blobs is None:
+            image_blobs = self._get_standard_blobs(folder)
+            existing_variants = {
+                blob.name
+                for blob in self.get(prefix=folder)
+                if "/_responsive/" in blob.name
+            }
+        image_blobs = [
+            blob
+            for blob in image_blobs
+            if self._is_standard_image(blob.name)
+            and not self._is_processed(manifest, blob, "responsive")
+        ]
+        LOGGER.info(f"Creating responsive variants for {len(image_blobs)} images...")
+        processed = []
+        for image_blob in image_blobs:
+            try:
+                new_images = self._new_responsive_blobs(
+                    image_blob, existing_variants, dry_run
+                )
+            except Exception:
+                # Already logged; left out of the manifest so it is retried.
+                if failed is not None:
+                    failed.append(image_blob.name)
+                continue
+            images_transformed.extend(new_images)
+            self._record_processed(manifest, image_blob, "responsive", new_images)
+            processed.append(image_blob.name)
+        if processed and not dry_run:
+            self.save_manifest({name: manifest[name] for name in processed})
         return images_transformed
 
+    def transform_images(
+        self,
+        folder: str,
+        image_blobs: List[StoredObject],
+        dry_run: bool = False,
+        failed: Optional[List[str]] = None,
+    ) -> Dict[str, Optional[List[Optional[str]]]]:
+        """
+        Apply purge & image transformations to specific images rather than a folder.
+
+        :param folder: Directory containing the images.
+        :type folder: str
+        :param image_blobs: Newly uploaded or changed images.
+        :type image_blobs: List[StoredObject]
+        :param dry_run: Report images which would be purged or created without
+            writing anything; variants of retina images which don't exist yet
+            aren't reported.
+        :type dry_run: bool
+        :param failed: Collects names of images whose variants failed to render.
+        :type failed: Optional[List[str]]
+        :returns: Dict[str, Optional[List[Optional[str]]]]
+        """
+        purged = self.purge_unwanted_images(folder, dry_run, image_blobs)
+        if not dry_run:
+            image_blobs = [
+                blob for blob in image_blobs if blob.name not in (purged or [])
+            ]
+        retina = self.retina_transformations(folder, image_blobs, dry_run)
+        new_retina_blobs = [self.backend.stat(name) for name in retina or []]
+        image_blobs = image_blobs + [blob for blob in new_retina_blobs if blob]
+        # Passes which raised outright are `None`, as wrapped by `LOGGER.catch`.
+        return {
+            "purged": purged,
+            "retina": retina,
+            "mobile": self.mobile_transformations(folder, image_blobs, dry_run, failed),
+            "standard": self.standard_transformations(folder, image_blobs, dry_run),
+            "responsive": self.responsive_transformations(
+                folder, image_blobs, dry_run, failed
+            ),
+        }
+
+    def incremental_transformations(
+        self, folder: str, dry_run: bool = False
+    ) -> Dict[str, Optional[List[Optional[str]]]]:
+        """
+        Transform only images uploaded or changed since the previous incremental run.
+
+        :param folder: Directory to poll for changed images.
+        :type folder: str
+        :param dry_run: Report images which would be purged or created without
+            writing; leaves the cursor where it was.
+        :type dry_run: bool
+        :returns: Dict[str, Optional[List[Optional[str]]]]
+        """
+        cursors = self.load_cursors()
+        cursor = cursors.get(folder)
+        since = datetime.fromisoformat(cursor) if cursor else None
+        changed = [
+            blob
+            for blob in self.get(prefix=folder)
+            if blob.updated is not None and (since is None or blob.updated > since)
+        ]
+        LOGGER.info(f"Found {len(changed)} images changed in `{folder}` since {cursor}")
+        failed = []
+        images = self.transform_images(folder, changed, dry_run, failed)
+        if changed and not dry_run:
+            newest = self._cursor_after(changed, images, failed)
+            if newest is not None:
+                self.save_cursors({folder: newest.isoformat()})
+        return images
+
+    @staticmethod
+    def _cursor_after(
+        changed: List[StoredObject],
+        images: Dict[str, Optional[List[Optional[str]]]],
+        failed: List[str],
+    ) -> Optional[datetime]:
+        """
+        Newest `updated` time up to which every changed image was transformed.
+
+        :param changed: Images an incremental run attempted to transform.
+        :type changed: List[StoredObject]
+        :param images: Results of each pass; `None` for passes which raised.
+        :type images: Dict[str, Optional[List[Optional[str]]]]
+        :param failed: Names of images whose variants failed to render.
+        :type failed: List[str]
+        :returns: Optional[datetime]
+        """
+        if any(transformed is None for transformed in images.values()):
+            return None
+        changed_names = {blob.name for blob in changed}
+        if any(name not in changed_names for name in failed):
+            # Failed on a derived image, eg. a new retina variant; retry everything.
+            return None
+        failed_at = [blob.updated for blob in changed if blob.name in failed]
+        succeeded = [
+            blob.updated
+            for blob in changed
+            if not failed_at or blob.updated < min(failed_at)
+        ]
+        return max(succeeded, default=None)
+
+    def bulk_transformations(
+        self, folders: List[str], dry_run: bool = False, incremental: bool = False
+    ) -> Dict[str, List[Optional[str]]]:
+        """
+        Transform images across many folders concurrently, merging results per pass.
+
+        :param folders: Directories (or `YYYY-YYYY` year ranges) to transform.
+        :type folders: List[str]
+        :param dry_run: Report images which would be purged or created without writing.
+        :type dry_run: bool
+        :param incremental: Only transform images changed since the previous run.
+        :type incremental: bool
+        :returns: Dict[str, List[Optional[str]]]
+        """
+        folders = self.expand_folders(folders)
+        images = {
+            "purged": [],
+            "retina": [],
+            "mobile": [],
+            "standard": [],
+            "responsive": [],
+        }
+        LOGGER.info(
+            f"Transforming images in {len(folders)} folders across {self.max_workers} workers..."
+        )
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            shards = executor.map(
+                lambda folder: self._transform_folder(folder, dry_run, incremental),
+                folders,
+            )
+            for shard in shards:
+                for transformation, transformed in shard.items():
+                    images[transformation].extend(transformed or [])
+        return images
+
+    def _transform_folder(
+        self, folder: str, dry_run: bool, incremental: bool
+    ) -> Dict[str, List[Optional[str]]]:
+        """
+        Run every image transformation pass over a single folder.
+
+        :param folder: Directory to recursively apply image transformations.
+        :type folder: str
+        :param dry_run: Report images which would be purged or created without writing.
+        :type dry_run: bool
+        :param incremental: Only transform images changed since the previous run.
+        :type incremental: bool
+        :returns: Dict[str, List[Optional[str]]]
+        """
+        if incremental:
+            return self.incremental_transformations(folder, dry_run=dry_run)
+        return {
+            "purged": self.purge_unwanted_images(folder, dry_run=dry_run),
+            "retina": self.retina_transformations(folder, dry_run=dry_run),
+            "mobile": self.mobile_transformations(folder, dry_run=dry_run),
+            "standard": self.standard_transformations(folder, dry_run=dry_run),
+            "responsive": self.responsive_transformations(folder, dry_run=dry_run),
+        }
+
+    @staticmethod
+    def expand_folders(folders: List[str]) -> List[str]:
+        """
+        Expand `YYYY-YYYY` year ranges into monthly `YYYY/MM` folders.
+
+        :param folders: Directories, optionally including inclusive year ranges.
+        :type folders: List[str]
+        :returns: List[str]
+        """
+        expanded = []
+        today = date.today()
+        for folder in folders:
+            year_range = re.fullmatch(r"(\d{4})-(\d{4})", folder)
+            if year_range is None:
+                expanded.append(folder)
+                continue
+            start, end = int(year_range.group(1)), int(year_range.group(2))
+            expanded.extend(
+                f"{year}/{month:02d}"
+                for year in range(start, end + 1)
+                for month in range(1, 13)
+                if (year, month) <= (today.year, today.month)
+            )
+        return list(dict.fromkeys(expanded))
+
+    def load_cursors(self) -> Dict[str, str]:
+        """
+        Fetch `updated` timestamp of the newest image processed per folder.
+
+        :returns: Dict[str, str]
+        """
+        return self._parse_json(
+            self.cursor_path, self.backend.read_bytes(self.cursor_path)
+        )
+
+    def save_cursors(self, cursors: Dict[str, str]):
+        """
+        Merge updated incremental processing cursors into those stored in the bucket.
+
+        :param cursors: Map of folders -> ISO timestamp of newest processed image.
+        :type cursors: Dict[str, str]
+        """
+        with self._cursor_lock:
+            self._merge_json(self.cursor_path, cursors)
+
+    @LOGGER.catch
+    def create_responsive_images(self, image_url: Optional[str]) -> List[str]:
+        """
+        Create responsive `srcset` variants of a single image.
+
+        :param image_url: Image to apply transformation to.
+        :type image_url: Optional[str]
+        :returns: List[str]
+        """
+        if image_url is None:
+            return []
+        relative_image_path = image_url.replace(self.bucket_url, "")
+        image_blob = self.backend.stat(relative_image_path)
+        if image_blob is None:
+            return []
+        return self._new_responsive_blobs(image_blob)
+
+    def responsive_srcset(self, image_url: str) -> Dict[str, str]:
+        """
+        Build `srcset` attribute values for each responsive variant format.
+
+        :param image_url: Image to fetch responsive variants for.
+        :type image_url: str
+        :returns: Dict[str, str]
+        """
+        relative_image_path = image_url.replace(self.bucket_url, "")
+        image_folder, image_name = relative_image_path.rsplit("/", 1)
+        stem = image_name.rsplit(".", 1)[0]
+        variant_names = {
+            blob.name for blob in self.get(prefix=f"{image_folder}/_responsive/{stem}-")
+        }
+        srcset = {}
+        for image_format in self.variant_formats:
+            candidates = [
+                (width, self._responsive_name(image_folder, stem, width, image_format))
+                for width in self.variant_widths
+            ]
+            srcset[image_format] = ", ".join(
+                f"{self.bucket_http_url}{name} {width}w"
+                for width, name in candidates
+                if name in variant_names
+            )
+        return srcset
+
+    def _new_responsive_blobs(
+        self,
+        image_blob: StoredObject,
+        existing_variants: Optional[set] = None,
+        dry_run: bool = False,
+    ) -> List[str]:
+        """
+        Decode an image once and upload every missing width/format variant; errors
+        are logged & re-raised so callers don't record the image as processed.
+
+        :param image_blob: Google storage blob representing an image.
+        :type image_blob: StoredObject
+        :param existing_variants: Names of responsive variants known to exist.
+        :type existing_variants: Optional[set]
+        :param dry_run: Report variants which would be created without encoding them.
+        :type dry_run: bool
+        :returns: List[str]
+        """
+        image_folder, image_name = self._get_folder_and_filename(image_blob)
+        stem = image_name.rsplit(".", 1)[0]
+        if existing_variants is None:
+            existing_variants = {
+                blob.name
+                for blob in self.get(prefix=f"{image_folder}/_responsive/{stem}-")
+            }
+        missing = [
+            (width, image_format)
+            for width in self.variant_widths
+            for image_format in self.variant_formats
+            if self._responsive_name(image_folder, stem, width, image_format)
+            not in existing_variants
+        ]
+        if not missing:
+            return []
+        created = []
+        try:
+            with self.backend.open(image_blob.name) as reader:
+                im = Image.open(reader)
+                if dry_run:
+                    return self._would_create(
+                        [
+                            self._responsive_name(
+                                image_folder, stem, width, image_format
+                            )
+                            for width, image_format in missing
+                            if width <= im.size[0]
+                        ]
+                    )
+                im.load()
+            for width, image_format, output in self.encode_variants(im, missing):
+                new_image_name = self._responsive_name(
+                    image_folder, stem, width, image_format
+                )
+                with output:
+                    self.backend.write(
+                        new_image_name,
+                        output,
+                        VARIANT_FORMATS[image_format]["content_type"],
+                    )
+                created.append(new_image_name)
+                LOGGER.success(f"Created responsive image `{new_image_name}`")
+        except GoogleCloudError as e:
+            LOGGER.error(
+                f"GoogleCloudError while creating responsive images for `{image_blob.name}`: {e}"
+            )
+            raise
+        except Exception as e:
+            LOGGER.error(
+                f"Unexpected exception while creating responsive images for `{image_blob.name}`: {e}"
+            )
+            raise
+        return created
+
+    def render_variant(
+        self, image_name: str, width: int, image_format: str
+    ) -> Tuple[int, IO[bytes]]:
+        """
+        Render a single resized derivative of an image on demand.
+
+        :param image_name: Name of the source image blob.
+        :type image_name: str
+        :param width: Requested width in pixels; clamped to the source width.
+        :type width: int
+        :param image_format: Output format.
+        :type image_format: str
+        :returns: Tuple[int, IO[bytes]]
+        """
+        with self.backend.open(image_name) as reader:
+            im = Image.open(reader)
+            im.load()
+        width = min(width, im.size[0])
+        # Never empty: `encode_variants` only skips widths wider than the source.
+        _, _, output = next(self.encode_variants(im, [(width, image_format)]))
+        return width, output
+
+    @staticmethod
+    def encode_variants(
+        im: Image.Image, variants: List[Tuple[int, str]]
+    ) -> Iterator[Tuple[int, str, IO[bytes]]]:
+        """
+        Encode resized copies of a decoded image; never upscales.
+
+        :param im: Decoded source image.
+        :type im: Image.Image
+        :param variants: Pairs of (width, format) to encode.
+        :type variants: List[Tuple[int, str]]
+        :returns: Iterator[Tuple[int, str, IO[bytes]]]
+        """
+        width, height = im.size
+        if im.mode not in ("RGB", "L"):
+            im = im.convert("RGB")
+        resized = {}
+        for variant_width, image_format in variants:
+            if variant_width > width:
+                continue
+            if variant_width not in resized:
+                variant_height = max(1, round(height * variant_width / width))
+                resized[variant_width] = im.resize(
+                    (variant_width, variant_height), Image.LANCZOS
+                )
+            output = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+            resized[variant_width].save(
+                output,
+                format=image_format.upper(),
+                **VARIANT_FORMATS[image_format]["options"],
+            )
+            output.seek(0)
+            yield variant_width, image_format, output
+
+    @staticmethod
+    def _responsive_name(folder: str, stem: str, width: int, image_format: str) -> str:
+        """
+        Blob name of a responsive image variant.
+
+        :param folder: Directory of the source image.
+        :type folder: str
+        :param stem: Source image filename without extension.
+        :type stem: str
+        :param width: Variant width in pixels.
+        :type width: int
+        :param image_format: Variant output format.
+        :type image_format: str
+        :returns: str
+        """
+        extension = VARIANT_FORMATS[image_format]["extension"]
+        return f"{folder}/_responsive/{stem}-{width}w.{extension}"
+
+    @staticmethod
+    def _supported_formats(image_formats: List[str]) -> List[str]:
+        """
+        Filter variant formats down to those the installed Pillow can encode.
+
+        :param image_formats: Requested variant formats.
+        :type image_formats: List[str]
+        :returns: List[str]
+        """
+        Image.init()
+        supported = []
+        for image_format in image_formats:
+            if image_format in VARIANT_FORMATS and image_format.upper() in Image.SAVE:
+                supported.append(image_format)
+            else:
+                LOGGER.warning(
+                    f"Skipping unsupported image variant format `{image_format}`."
+                )
+        return supported
+
     @LOGGER.catch
     def create_retina_image(self, image_url: Optional[str]) -> Optional[str]:
         """
@@ -263,8 +905,8 @@ class GCS:
         try:
             if image_url is not None:
                 relative_image_path = image_url.replace(self.bucket_url, "")
-                image_blob = storage.Blob(relative_image_path, self.bucket)
-                if image_blob.exists() is False:
+                image_blob = self.backend.stat(relative_image_path)
+                if image_blob is not None:
                     retina_blob = self._new_image_blob(image_blob, "retina")
                     return retina_blob
             return None
@@ -288,97 +930,282 @@ class GCS:
         :returns: Optional[str]
         """
         relative_image_path = image_url.replace(self.bucket_url, "")
-        image_blob = storage.Blob(relative_image_path, self.bucket)
-        if image_blob.exists() is False:
+        image_blob = self.backend.stat(relative_image_path)
+        if image_blob is not None:
             mobile_blob = self._new_image_blob(image_blob, "mobile")
-            return f"{self.bucket_http_url}{mobile_blob}"
+            if mobile_blob is not None:
+                return f"{self.bucket_http_url}{mobile_blob}"
         return None
 
-    def _new_image_blob(self, image_blob: Blob, image_type: str) -> Optional[str]:
+    def _new_image_blob(
+        self, image_blob: StoredObject, image_type: str, dry_run: bool = False
+    ) -> Optional[str]:
         """
         :param image_blob: Google storage blob representing an image.
-        :type image_blob: Blob
+        :type image_blob: StoredObject
         :param image_type: Type of img transformation to apply.
         :type image_type: str
+        :param dry_run: Report the image which would be created without writing it.
+        :type dry_run: bool
         :returns: Optional[str]
         """
         image_folder, image_name = self._get_folder_and_filename(image_blob)
         if image_type == "standard":
             new_image_name = f"{image_folder.replace('/_retina', '/').replace('/_mobile', '/')}{image_name.replace('@2x', '')}"
-            self.bucket.copy_blob(image_blob, self.bucket, new_image_name)
+            if dry_run:
+                return self._would_create([new_image_name])[0]
+            self.backend.copy([(image_blob.name, new_image_name)])
             LOGGER.success(f"Created standard image `{new_image_name}`")
             return new_image_name
         elif image_type == "retina" and "/_retina" not in image_folder:
             new_image_name = (
                 f"{image_folder}/_{image_type}/{image_name.replace('.jpg', '@2x.jpg')}"
             )
-            new_image_blob = self.bucket.blob(new_image_name)
-            if new_image_blob.exists() is False:
-                self.bucket.copy_blob(image_blob, self.bucket, new_image_name)
+            if self.backend.exists(new_image_name) is False:
+                if dry_run:
+                    return self._would_create([new_image_name])[0]
+                self.backend.copy([(image_blob.name, new_image_name)])
                 LOGGER.success(f"Created retina image `{new_image_name}`")
                 return new_image_name
         elif image_type == "mobile" and "@2x" in image_name:
             new_image_name = (
                 f"{image_folder.replace('/_retina', '/_mobile')}/{image_name}"
             )
-            new_image_blob = self.bucket.blob(new_image_name)
-            if new_image_blob.exists() is False:
-                self._create_mobile_image(image_blob, new_image_blob)
-                return new_image_name
+            if self.backend.exists(new_image_name) is False:
+                return self._create_mobile_image(
+                    image_blob.name, new_image_name, dry_run
+                )
         return None
 
-    def fetch_random_lynx_image(self) -> str:
-        """Fetch random Lynx image from GCS bucket."""
-        files = self._get_standard_blobs("roundup")
-        images = [f"{self.bucket_http_url}{image.name}" for image in files]
-        rand = randint(0, len(images) - 1)
-        image = images[rand]
-        return image
+    @property
+    def lynx_pool(self) -> List[str]:
+        """
+        Lynx image URLs, listed from the bucket at most once per `lynx_pool_ttl`.
+
+        :returns: List[str]
+        """
+        if (
+            self._lynx_pool_loaded_at is None
+            or monotonic() - self._lynx_pool_loaded_at > self.lynx_pool_ttl
+        ):
+            files = self._get_standard_blobs(self.bucket_lynx)
+            self._lynx_pool = [f"{self.bucket_http_url}{image.name}" for image in files]
+            self._lynx_pool_loaded_at = monotonic()
+            available = set(self._lynx_pool)
+            self._lynx_deck = [image for image in self._lynx_deck if image in available]
+            LOGGER.info(f"Loaded {len(self._lynx_pool)} Lynx images into pool.")
+        return self._lynx_pool
+
+    def fetch_random_lynx_image(self, no_repeat: bool = False) -> str:
+        """
+        Fetch random Lynx image from GCS bucket.
+
+        :param no_repeat: Draw without replacement until every image has been used.
+        :type no_repeat: bool
+        :returns: str
+        """
+        pool = self.lynx_pool
+        if not no_repeat:
+            return choice(pool)
+        if not self._lynx_deck:
+            deck = list(pool)
+            shuffle(deck)
+            if len(deck) > 1 and deck[-1] == self._lynx_last:
+                deck[0], deck[-1] = deck[-1], deck[0]
+            self._lynx_deck = deck
+        self._lynx_last = self._lynx_deck.pop()
+        return self._lynx_last
+
+    def load_manifest(self) -> dict:
+        """
+        Fetch manifest mapping source images to previously generated variants.
+
+        :returns: dict
+        """
+        return self._parse_json(
+            self.manifest_path, self.backend.read_bytes(self.manifest_path)
+        )
+
+    def save_manifest(self, manifest: dict):
+        """
+        Merge newly processed source images into the manifest stored in the bucket.
+
+        :param manifest: Map of source image names -> fingerprint & variants.
+        :type manifest: dict
+        """
+        with self._manifest_lock:
+            self._merge_json(self.manifest_path, manifest)
+        LOGGER.info(f"Saved {len(manifest)} images to manifest `{self.manifest_path}`")
+
+    def _merge_json(self, name: str, updates: dict):
+        """
+        Merge keys into a JSON object, retrying if another worker rewrote it meanwhile.
+
+        :param name: Name of JSON object in the bucket.
+        :type name: str
+        :param updates: Keys to add or overwrite.
+        :type updates: dict
+        """
+        for attempt in range(1, JSON_MERGE_ATTEMPTS + 1):
+            data, generation = self.backend.read_versioned(name)
+            stored = self._parse_json(name, data)
+            stored.update(updates)
+            try:
+                self.backend.write_bytes(
+                    name,
+                    json.dumps(stored).encode(),
+                    "application/json",
+                    if_generation_match=generation,
+                )
+                return
+            except GenerationMismatch:
+                LOGGER.warning(f"`{name}` changed while saving (attempt {attempt}).")
+        raise GenerationMismatch(
+            f"Gave up saving `{name}` after {JSON_MERGE_ATTEMPTS} attempts."
+        )
+
+    @staticmethod
+    def _parse_json(name: str, data: Optional[bytes]) -> dict:
+        """
+        Decode a JSON object read from the bucket; empty if missing or unreadable.
+
+        :param name: Name of JSON object in the bucket.
+        :type name: str
+        :param data: Raw contents, or `None` if the object doesn't exist.
+        :type data: Optional[bytes]
+        :returns: dict
+        """
+        if data is None:
+            return {}
+        try:
+            return json.loads(data)
+        except ValueError as e:
+            LOGGER.warning(f"Ignoring unreadable `{name}`: {e}")
+            return {}
+
+    @staticmethod
+    def _is_processed(
+        manifest: dict, image_blob: StoredObject, transformation: str
+    ) -> bool:
+        """
+        Check whether an unchanged source image has already been transformed.
+
+        :param manifest: Map of source image names -> fingerprint & variants.
+        :type manifest: dict
+        :param image_blob: Source image blob as returned by a listing.
+        :type image_blob: StoredObject
+        :param transformation: Type of img transformation to check for.
+        :type transformation: str
+        :returns: bool
+        """
+        entry = manifest.get(image_blob.name)
+        return (
+            entry is not None
+            and entry["source"] == GCS._fingerprint(image_blob)
+            and transformation in entry["variants"]
+        )
 
     @staticmethod
+    def _record_processed(
+        manifest: dict,
+        image_blob: StoredObject,
+        transformation: str,
+        variants: List[Optional[str]],
+    ):
+        """
+        Record variants produced from a source image in the manifest.
+
+        :param manifest: Map of source image names -> fingerprint & variants.
+        :type manifest: dict
+        :param image_blob: Source image blob which was transformed.
+        :type image_blob: StoredObject
+        :param transformation: Type of img transformation applied.
+        :type transformation: str
+        :param variants: Names of blobs created by the transformation.
+        :type variants: List[Optional[str]]
+        """
+        fingerprint = GCS._fingerprint(image_blob)
+        entry = manifest.get(image_blob.name)
+        if entry is None or entry["source"] != fingerprint:
+            entry = {
+                "source": fingerprint,
+                "generation": image_blob.generation,
+                "variants": {},
+            }
+            manifest[image_blob.name] = entry
+        entry["variants"][transformation] = [v for v in variants if v is not None]
+
+    @staticmethod
+    def _fingerprint(image_blob: StoredObject) -> str:
+        """
+        Content hash of a blob; composite objects lacking an MD5 fall back to generation.
+
+        :param image_blob: StoredObject as returned by a bucket listing.
+        :type image_blob: StoredObject
+        :returns: str
+        """
+        return image_blob.md5_hash or str(image_blob.generation)
+
     def _create_mobile_image(
-        original_image_blob: Blob, new_image_blob: Blob
+        self, original_image_name: str, new_image_name: str, dry_run: bool = False
     ) -> Optional[str]:
         """
-        Create smaller image size to be served on mobile devices.
+        Create smaller image size to be served on mobile devices; returns `None` for
+        images too narrow to need one. Errors are logged & re-raised.
 
-        :param original_image_blob: Original image blob.
-        :type original_image_blob: Blob
-        :param new_image_blob: New newly created Blob for mobile image.
-        :type new_image_blob: Blob
+        :param original_image_name: Original image blob name.
+        :type original_image_name: str
+        :param new_image_name: Name of newly created blob for mobile image.
+        :type new_image_name: str
+        :param dry_run: Report the image which would be created without writing it.
+        :type dry_run: bool
         :returns: Optional[str]
         """
-        img_bytes = original_image_blob.download_as_bytes()
-        if img_bytes:
-            stream = BytesIO(img_bytes)
-            im = Image.open(stream)
-            width, height = im.size
-            if width > 1000:
-                try:
-                    with BytesIO() as output:
-                        new_image = im.resize((800, 461))
-                        new_image.save(output, format="JPEG")
-                        new_image_blob.upload_from_string(
-                            output.getvalue(), content_type="image/jpg"
-                        )
-                        LOGGER.success(f"Created mobile image `{new_image_blob.name}`")
-                        return new_image_blob.name
-                except GoogleCloudError as e:
-                    LOGGER.error(
-                        f"GoogleCloudError while saving mobile image `{new_image_blob.name}`: {e}"
-                    )
-                except Exception as e:
-                    LOGGER.error(
-                        f"Unexpected exception while saving mobile image `{new_image_blob.name}`: {e}"
-                    )
+        try:
+            with self.backend.open(original_image_name) as reader:
+                im = Image.open(reader)
+                width, height = im.size
+                if width <= 1000:
+                    return None
+                if dry_run:
+                    return self._would_create([new_image_name])[0]
+                new_image = im.resize((800, 461))
+            with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as output:
+                new_image.save(output, format="JPEG")
+                self.backend.write(new_image_name, output, "image/jpg")
+            LOGGER.success(f"Created mobile image `{new_image_name}`")
+            return new_image_name
+        except GoogleCloudError as e:
+            LOGGER.error(
+                f"GoogleCloudError while saving mobile image `{new_image_name}`: {e}"
+            )
+            raise
+        except Exception as e:
+            LOGGER.error(
+                f"Unexpected exception while saving mobile image `{new_image_name}`: {e}"
+            )
+            raise
+
+    @staticmethod
+    def _would_create(blob_names: List[str]) -> List[str]:
+        """
+        Log blobs which a dry run would have created.
+
+        :param blob_names: Names of blobs which would be created.
+        :type blob_names: List[str]
+        :returns: List[str]
+        """
+        for blob_name in blob_names:
+            LOGGER.info(f"Would create `{blob_name}`")
+        return blob_names
 
     @staticmethod
-    def _get_folder_and_filename(image_blob: Blob) -> Tuple[str, str]:
+    def _get_folder_and_filename(image_blob: StoredObject) -> Tuple[str, str]:
         """
         Get relative file path & filename from a given blob.
 
         :param image_blob: Image stored on GCS
-        :type image_blob: Blob
+        :type image_blob: StoredObject
         :returns: Tuple[str, str]
         """
         image_folder = image_blob.name.rsplit("/", 1)[0]
@@ -0,0 +1,421 @@
+"""Object storage backends for the image CDN."""
+import shutil
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from io import BytesIO
+from os import makedirs, path, remove, replace, stat, walk
+from threading import local
+from typing import IO, Iterator, List, NamedTuple, Optional, Tuple
+
+from google.api_core.exceptions import NotFound, PreconditionFailed
+from google.cloud import storage
+from google.cloud.exceptions import GoogleCloudError
+from google.cloud.storage.client import Bucket, Client
+
+from log import LOGGER
+
+# Chunk size of streamed downloads & resumable uploads; a multiple of 256 KiB.
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class StoredObject(NamedTuple):
+    """Object listed from a storage backend."""
+
+    name: str
+    size: int
+    md5_hash: Optional[str]
+    generation: Optional[int]
+    updated: Optional[datetime] = None
+
+
+class GenerationMismatch(Exception):
+    """Object changed between being read & conditionally rewritten."""
+
+
+class StorageBackend(ABC):
+    """Interface of object stores which images are read from & written to."""
+
+    @abstractmethod
+    def list(self, prefix: str) -> Iterator[StoredObject]:
+        """
+        List all objects whose names begin with a prefix.
+
+        :param prefix: Substring to match against the start of object names.
+        :type prefix: str
+        :returns: Iterator[StoredObject]
+        """
+
+    @abstractmethod
+    def stat(self, name: str) -> Optional[StoredObject]:
+        """
+        Fetch a single object's metadata.
+
+        :param name: Name of object.
+        :type name: str
+        :returns: Optional[StoredObject]
+        """
+
+    def exists(self, name: str) -> bool:
+        """
+        Check whether an object exists.
+
+        :param name: Name of object.
+        :type name: str
+        :returns: bool
+        """
+        return self.stat(name) is not None
+
+    @abstractmethod
+    def open(self, name: str) -> IO[bytes]:
+        """
+        Open an object as a seekable binary file object for streamed reads.
+
+        :param name: Name of object.
+        :type name: str
+        :returns: IO[bytes]
+        """
+
+    @abstractmethod
+    def write(self, name: str, file_obj: IO[bytes], content_type: str):
+        """
+        Stream a file object's contents into an object.
+
+        :param name: Name of object to create or overwrite.
+        :type name: str
+        :param file_obj: File object to read contents from.
+        :type file_obj: IO[bytes]
+        :param content_type: MIME type of contents.
+        :type content_type: str
+        """
+
+    @abstractmethod
+    def copy(self, moves: List[Tuple[str, str]]) -> List[str]:
+        """
+        Copy objects to new names.
+
+        :param moves: Pairs of (source, destination) object names.
+        :type moves: List[Tuple[str, str]]
+        :returns: List[str]
+        """
+
+    @abstractmethod
+    def delete(self, names: List[str]) -> List[str]:
+        """
+        Delete objects.
+
+        :param names: Names of objects to delete.
+        :type names: List[str]
+        :returns: List[str]
+        """
+
+    def read_bytes(self, name: str) -> Optional[bytes]:
+        """
+        Read a small object into memory.
+
+        :param name: Name of object.
+        :type name: str
+        :returns: Optional[bytes]
+        """
+        if not self.exists(name):
+            return None
+        with self.open(name) as reader:
+            return reader.read()
+
+    def read_versioned(self, name: str) -> Tuple[Optional[bytes], int]:
+        """
+        Read a small object into memory along with its generation; 0 if missing.
+
+        :param name: Name of object.
+        :type name: str
+        :returns: Tuple[Optional[bytes], int]
+        """
+        stored = self.stat(name)
+        if stored is None:
+            return None, 0
+        with self.open(name) as reader:
+            return reader.read(), stored.generation
+
+    def write_bytes(
+        self,
+        name: str,
+        data: bytes,
+        content_type: str,
+        if_generation_match: Optional[int] = None,
+    ):
+        """
+        Write a small in-memory payload to an object.
+
+        :param name: Name of object to create or overwrite.
+        :type name: str
+        :param data: Object contents.
+        :type data: bytes
+        :param content_type: MIME type of contents.
+        :type content_type: str
+        :param if_generation_match: Only write if the object is still at this generation.
+        :type if_generation_match: Optional[int]
+        """
+        if if_generation_match is not None:
+            stored = self.stat(name)
+            if (stored.generation if stored else 0) != if_generation_match:
+                raise GenerationMismatch(f"`{name}` changed since it was read.")
+        with BytesIO(data) as file_obj:
+            self.write(name, file_obj, content_type)
+
+
+class GCSBackend(StorageBackend):
+    """Google Cloud Storage bucket."""
+
+    # Maximum number of operations sent per storage batch request.
+    BATCH_SIZE = 100
+
+    def __init__(self, bucket_name: str, basedir: str):
+        self.bucket_name = bucket_name
+        self.basedir = basedir
+        self._local = local()
+
+    @property
+    def client(self) -> Client:
+        """
+        Google Cloud Storage client; one per thread as batches are client-scoped.
+
+        :returns: Client
+        """
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = storage.Client.from_service_account_json(
+                f"{self.basedir}/gcloud.json"
+            )
+            self._local.client = client
+        return client
+
+    @property
+    def bucket(self) -> Bucket:
+        """
+        Google Cloud Storage bucket where images are stored.
+
+        :returns: Bucket
+        """
+        return self.client.bucket(self.bucket_name)
+
+    def list(self, prefix: str) -> Iterator[StoredObject]:
+        for blob in self.bucket.list_blobs(prefix=prefix):
+            yield StoredObject(
+                blob.name, blob.size, blob.md5_hash, blob.generation, blob.updated
+            )
+
+    def stat(self, name: str) -> Optional[StoredObject]:
+        blob = self.bucket.get_blob(name)
+        if blob is None:
+            return None
+        return StoredObject(
+            blob.name, blob.size, blob.md5_hash, blob.generation, blob.updated
+        )
+
+    def exists(self, name: str) -> bool:
+        return self.bucket.blob(name).exists()
+
+    def open(self, name: str) -> IO[bytes]:
+        return self.bucket.blob(name).open("rb", chunk_size=STREAM_CHUNK_SIZE)
+
+    def write(self, name: str, file_obj: IO[bytes], content_type: str):
+        blob = self.bucket.blob(name, chunk_size=STREAM_CHUNK_SIZE)
+        file_obj.seek(0)
+        blob.upload_from_file(file_obj, content_type=content_type)
+
+    def read_versioned(self, name: str) -> Tuple[Optional[bytes], int]:
+        blob = self.bucket.get_blob(name)
+        if blob is None:
+            return None, 0
+        # Downloads the exact generation fetched above.
+        return blob.download_as_bytes(), blob.generation
+
+    def write_bytes(
+        self,
+        name: str,
+        data: bytes,
+        content_type: str,
+        if_generation_match: Optional[int] = None,
+    ):
+        blob = self.bucket.blob(name)
+        try:
+            blob.upload_from_string(
+                data,
+                content_type=content_type,
+                if_generation_match=if_generation_match,
+            )
+        except PreconditionFailed:
+            raise GenerationMismatch(f"`{name}` changed since it was read.")
+
+    def copy(self, moves: List[Tuple[str, str]]) -> List[str]:
+        copied = []
+        bucket = self.bucket
+        for chunk in self._chunks(moves, self.BATCH_SIZE):
+            try:
+                with self.client.batch():
+                    for source, destination in chunk:
+                        bucket.copy_blob(bucket.blob(source), bucket, destination)
+                copied.extend(destination for source, destination in chunk)
+                LOGGER.info(f"Copied {len(chunk)} blobs: {chunk}")
+            except GoogleCloudError as e:
+                LOGGER.warning(f"Retrying batch copy one blob at a time: {e}")
+                copied.extend(self._copy_each(chunk))
+        return copied
+
+    def _copy_each(self, moves: List[Tuple[str, str]]) -> List[str]:
+        """
+        Copy objects one request at a time, so one failure doesn't hide the rest.
+
+        :param moves: Pairs of (source, destination) object names.
+        :type moves: List[Tuple[str, str]]
+        :returns: List[str]
+        """
+        copied = []
+        bucket = self.bucket
+        for source, destination in moves:
+            try:
+                bucket.copy_blob(bucket.blob(source), bucket, destination)
+                copied.append(destination)
+            except GoogleCloudError as e:
+                LOGGER.error(f"GoogleCloudError while copying `{source}`: {e}")
+        LOGGER.info(f"Copied {len(copied)}/{len(moves)} blobs: {copied}")
+        return copied
+
+    def delete(self, names: List[str]) -> List[str]:
+        deleted = []
+        bucket = self.bucket
+        for chunk in self._chunks(names, self.BATCH_SIZE):
+            try:
+                with self.client.batch():
+                    for name in chunk:
+                        bucket.delete_blob(name)
+                deleted.extend(chunk)
+                LOGGER.info(f"Deleted {len(chunk)} blobs: {chunk}")
+            except GoogleCloudError as e:
+                LOGGER.warning(f"Retrying batch delete one blob at a time: {e}")
+                deleted.extend(self._delete_each(chunk))
+        return deleted
+
+    def _delete_each(self, names: List[str]) -> List[str]:
+        """
+        Delete objects one request at a time, counting objects already gone
+        (eg. deleted by the failed batch) as deleted.
+
+        :param names: Names of objects to delete.
+        :type names: List[str]
+        :returns: List[str]
+        """
+        deleted = []
+        bucket = self.bucket
+        for name in names:
+            try:
+                bucket.delete_blob(name)
+            except NotFound:
+                pass
+            except GoogleCloudError as e:
+                LOGGER.error(f"GoogleCloudError while deleting `{name}`: {e}")
+                continue
+            deleted.append(name)
+        LOGGER.info(f"Deleted {len(deleted)}/{len(names)} blobs: {deleted}")
+        return deleted
+
+    @staticmethod
+    def _chunks(items: list, size: int) -> Iterator[list]:
+        """
+        Split a list into consecutive chunks of at most `size` items.
+
+        :param items: List to split.
+        :type items: list
+        :param size: Maximum items per chunk.
+        :type size: int
+        :returns: Iterator[list]
+        """
+        for i in range(0, len(items), size):
+            yield items[i : i + size]
+
+
+class LocalBackend(StorageBackend):
+    """Local directory standing in for a bucket; used for offline profiling."""
+
+    def __init__(self, root: str):
+        self.root = path.abspath(root)
+        makedirs(self.root, exist_ok=True)
+
+    def _path(self, name: str) -> str:
+        """
+        Absolute filesystem path of an object.
+
+        :param name: Name of object.
+        :type name: str
+        :returns: str
+        """
+        file_path = path.normpath(path.join(self.root, *name.split("/")))
+        if file_path != self.root and not file_path.startswith(self.root + path.sep):
+            raise ValueError(f"Object name `{name}` resolves outside of `{self.root}`.")
+        return file_path
+
+    def list(self, prefix: str) -> Iterator[StoredObject]:
+        directory = self._path(prefix)
+        if not path.isdir(directory):
+            directory = path.dirname(directory)
+        for folder, _, files in walk(directory):
+            for file in sorted(files):
+                file_path = path.join(folder, file)
+                name = path.relpath(file_path, self.root).replace(path.sep, "/")
+                if name.startswith(prefix) and not file.endswith(".tmp"):
+                    yield self._stored_object(name, file_path)
+
+    def stat(self, name: str) -> Optional[StoredObject]:
+        file_path = self._path(name)
+        if not path.isfile(file_path):
+            return None
+        return self._stored_object(name, file_path)
+
+    def open(self, name: str) -> IO[bytes]:
+        return open(self._path(name), "rb")
+
+    def write(self, name: str, file_obj: IO[bytes], content_type: str):
+        file_path = self._path(name)
+        makedirs(path.dirname(file_path), exist_ok=True)
+        file_obj.seek(0)
+        with open(f"{file_path}.tmp", "wb") as output:
+            shutil.copyfileobj(file_obj, output, STREAM_CHUNK_SIZE)
+        replace(f"{file_path}.tmp", file_path)
+
+    def copy(self, moves: List[Tuple[str, str]]) -> List[str]:
+        copied = []
+        for source, destination in moves:
+            destination_path = self._path(destination)
+            makedirs(path.dirname(destination_path), exist_ok=True)
+            shutil.copyfile(self._path(source), destination_path)
+            copied.append(destination)
+        return copied
+
+    def delete(self, names: List[str]) -> List[str]:
+        deleted = []
+        for name in names:
+            try:
+                remove(self._path(name))
+                deleted.append(name)
+            except FileNotFoundError:
+                LOGGER.warning(f"Ignored deleting missing file `{name}`")
+        return deleted
+
+    @staticmethod
+    def _stored_object(name: str, file_path: str) -> StoredObject:
+        """
+        Describe a local file; modification time stands in for generation.
+
+        :param name: Name of object.
+        :type name: str
+        :param file_path: Absolute filesystem path of object.
+        :type file_path: str
+        :returns: StoredObject
+        """
+        file_stat = stat(file_path)
+        return StoredObject(
+            name,
+            file_stat.st_size,
+            None,
+            file_stat.st_mtime_ns,
+            datetime.fromtimestamp(file_stat.st_mtime, tz=timezone.utc),
+        )
@@ -0,0 +1,278 @@
+from datetime import datetime, timezone
+from io import BytesIO
+from os import utime
+
+import pytest
+from google.api_core.exceptions import Forbidden, NotFound
+from mock import MagicMock, Mock
+from PIL import Image
+
+from clients.storage import GCS
+from clients.storage_backends import GCSBackend, GenerationMismatch, LocalBackend
+
+
+def test_encode_variants():
+    """Encode each width & format from a single decoded image without upscaling."""
+    im = Image.new("RGB", (1000, 600))
+    variants = [(400, "jpeg"), (400, "webp"), (800, "jpeg"), (1200, "jpeg")]
+    encoded = [
+        (width, image_format, Image.open(output).size)
+        for width, image_format, output in GCS.encode_variants(im, variants)
+    ]
+    assert encoded == [
+        (400, "jpeg", (400, 240)),
+        (400, "webp", (400, 240)),
+        (800, "jpeg", (800, 480)),
+    ]
+
+
+def test_manifest_skips_unchanged_images():
+    """Only images whose content changed since the last run are re-processed."""
+    manifest = {}
+    image_blob = Mock(md5_hash="abc==", generation=1)
+    image_blob.name = "2021/06/_retina/image@2x.jpg"
+    assert GCS._is_processed(manifest, image_blob, "mobile") is False
+    GCS._record_processed(
+        manifest, image_blob, "mobile", ["2021/06/_mobile/image@2x.jpg", None]
+    )
+    assert GCS._is_processed(manifest, image_blob, "mobile") is True
+    assert GCS._is_processed(manifest, image_blob, "responsive") is False
+    image_blob.md5_hash = "xyz=="
+    assert GCS._is_processed(manifest, image_blob, "mobile") is False
+
+
+def test_failed_variants_are_retried(tmp_path):
+    """Images whose variants fail to render are left out of the manifest."""
+    backend = LocalBackend(str(tmp_path))
+    backend.write_bytes("2021/06/_retina/wide@2x.jpg", b"not an image", "image/jpg")
+    gcs = GCS(
+        "bucket",
+        "https://cdn.example.com/",
+        "roundup",
+        str(tmp_path),
+        variant_widths=[400],
+        variant_formats=["jpeg"],
+        backend=backend,
+    )
+    assert gcs.mobile_transformations("2021/06") == []
+    assert gcs.load_manifest() == {}
+    with BytesIO() as output:
+        Image.new("RGB", (1600, 922)).save(output, format="JPEG")
+        backend.write_bytes(
+            "2021/06/_retina/wide@2x.jpg", output.getvalue(), "image/jpg"
+        )
+    assert gcs.mobile_transformations("2021/06") == ["2021/06/_mobile/wide@2x.jpg"]
+
+
+def test_conditional_write(tmp_path):
+    """Writes conditioned on a stale generation are rejected."""
+    backend = LocalBackend(str(tmp_path))
+    assert backend.read_versioned("manifest.json") == (None, 0)
+    backend.write_bytes("manifest.json", b"{}", "application/json", 0)
+    data, generation = backend.read_versioned("manifest.json")
+    assert data == b"{}"
+    with pytest.raises(GenerationMismatch):
+        backend.write_bytes("manifest.json", b"{}", "application/json", 0)
+    backend.write_bytes("manifest.json", b"[]", "application/json", generation)
+
+
+def test_purge_dry_run():
+    """Dry runs report unwanted images without issuing any deletes."""
+    gcs = GCS("bucket", "https://cdn.example.com/", "roundup", ".")
+    blobs = []
+    for name in ["2021/06/image.jpg", "2021/06/image@2x@2x.jpg", "2021/06/image.psd"]:
+        blob = Mock()
+        blob.name = name
+        blobs.append(blob)
+    gcs.get = Mock(return_value=blobs)
+    gcs.delete_blobs = Mock(wraps=gcs.delete_blobs)
+    purged = gcs.purge_unwanted_images("2021/06", dry_run=True)
+    assert purged == ["2021/06/image@2x@2x.jpg", "2021/06/image.psd"]
+    gcs.delete_blobs.assert_called_once_with(purged, dry_run=True)
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    """Dry runs report every image each pass would create without writing it."""
+    backend = LocalBackend(str(tmp_path))
+    for name in ["2021/06/wide.jpg", "2021/06/_retina/tall@2x.jpg"]:
+        with BytesIO() as output:
+            Image.new("RGB", (1600, 922)).save(output, format="JPEG")
+            backend.write_bytes(name, output.getvalue(), "image/jpg")
+    gcs = GCS(
+        "bucket",
+        "https://cdn.example.com/",
+        "roundup",
+        str(tmp_path),
+        variant_widths=[400, 2000],
+        variant_formats=["jpeg"],
+        backend=backend,
+    )
+    before = sorted(blob.name for blob in backend.list("2021/06"))
+    images = gcs.bulk_transformations(["2021/06"], dry_run=True)
+    assert images == {
+        "purged": [],
+        "retina": ["2021/06/_retina/wide@2x.jpg"],
+        "mobile": ["2021/06/_mobile/tall@2x.jpg"],
+        "standard": ["2021/06/tall.jpg"],
+        "responsive": ["2021/06/_responsive/wide-400w.jpg"],
+    }
+    assert sorted(blob.name for blob in backend.list("2021")) == before
+    assert backend.read_bytes(gcs.manifest_path) is None
+
+
+def test_lynx_pool_no_repeat():
+    """Lynx images are listed once and not repeated until the pool is exhausted."""
+    gcs = GCS("bucket", "https://cdn.example.com/", "roundup", ".")
+    blobs = []
+    for i in range(5):
+        blob = Mock()
+        blob.name = f"roundup/lynx-{i}.jpg"
+        blobs.append(blob)
+    gcs.get = Mock(return_value=blobs)
+    images = [gcs.fetch_random_lynx_image(no_repeat=True) for _ in range(5)]
+    assert sorted(images) == [f"https://cdn.example.com/{b.name}" for b in blobs]
+    assert gcs.fetch_random_lynx_image(no_repeat=True) != images[-1]
+    gcs.get.assert_called_once()
+
+
+def test_local_backend_transformations(tmp_path):
+    """Run the image pipeline end-to-end against a local directory."""
+    backend = LocalBackend(str(tmp_path))
+    for name, size in [("2021/06/wide.jpg", (1600, 922)), ("2021/06/x.psd", (1, 1))]:
+        with BytesIO() as output:
+            Image.new("RGB", size).save(output, format="JPEG")
+            backend.write_bytes(name, output.getvalue(), "image/jpg")
+    gcs = GCS(
+        "bucket",
+        "https://cdn.example.com/",
+        "roundup",
+        str(tmp_path),
+        variant_widths=[400, 800],
+        variant_formats=["jpeg"],
+        backend=backend,
+    )
+    assert gcs.purge_unwanted_images("2021/06") == ["2021/06/x.psd"]
+    assert gcs.retina_transformations("2021/06") == ["2021/06/_retina/wide@2x.jpg"]
+    assert gcs.mobile_transformations("2021/06") == ["2021/06/_mobile/wide@2x.jpg"]
+    assert gcs.mobile_transformations("2021/06") == []
+    assert gcs.responsive_transformations("2021/06") == [
+        "2021/06/_responsive/wide-400w.jpg",
+        "2021/06/_responsive/wide-800w.jpg",
+    ]
+    assert gcs.responsive_srcset("https://cdn.example.com/2021/06/wide.jpg") == {
+        "jpeg": "https://cdn.example.com/2021/06/_responsive/wide-400w.jpg 400w, "
+        "https://cdn.example.com/2021/06/_responsive/wide-800w.jpg 800w"
+    }
+
+
+def test_incremental_transformations(tmp_path):
+    """Incremental runs only transform images uploaded since the previous run."""
+    backend = LocalBackend(str(tmp_path))
+    gcs = GCS(
+        "bucket",
+        "https://cdn.example.com/",
+        "roundup",
+        str(tmp_path),
+        variant_widths=[400],
+        variant_formats=["jpeg"],
+        backend=backend,
+    )
+
+    def upload(name):
+        with BytesIO() as output:
+            Image.new("RGB", (1200, 700)).save(output, format="JPEG")
+            backend.write_bytes(name, output.getvalue(), "image/jpg")
+
+    upload("2021/06/first.jpg")
+    first_run = gcs.incremental_transformations("2021/06")
+    assert first_run["retina"] == ["2021/06/_retina/first@2x.jpg"]
+    assert first_run["mobile"] == ["2021/06/_mobile/first@2x.jpg"]
+    assert first_run["responsive"] == ["2021/06/_responsive/first-400w.jpg"]
+    assert not any(gcs.incremental_transformations("2021/06").values())
+    upload("2021/06/second.jpg")
+    third_run = gcs.incremental_transformations("2021/06")
+    assert third_run["retina"] == ["2021/06/_retina/second@2x.jpg"]
+    assert third_run["responsive"] == ["2021/06/_responsive/second-400w.jpg"]
+
+
+def test_incremental_cursor_stops_at_failures(tmp_path):
+    """Dry runs and failed images never advance the incremental cursor past them."""
+    backend = LocalBackend(str(tmp_path))
+    gcs = GCS(
+        "bucket",
+        "https://cdn.example.com/",
+        "roundup",
+        str(tmp_path),
+        variant_widths=[400],
+        variant_formats=["jpeg"],
+        backend=backend,
+    )
+    with BytesIO() as output:
+        Image.new("RGB", (1200, 700)).save(output, format="JPEG")
+        image = output.getvalue()
+    uploads = [
+        ("2021/06/good.jpg", image, 1000),
+        ("2021/06/_retina/bad@2x.jpg", b"not an image", 2000),
+        ("2021/06/late.jpg", image, 3000),
+    ]
+    for name, data, updated in uploads:
+        backend.write_bytes(name, data, "image/jpg")
+        utime(tmp_path / name, (updated, updated))
+    gcs.incremental_transformations("2021/06", dry_run=True)
+    assert gcs.load_cursors() == {}
+    gcs.incremental_transformations("2021/06")
+    assert gcs.load_cursors() == {
+        "2021/06": datetime.fromtimestamp(1000, tz=timezone.utc).isoformat()
+    }
+
+
+def test_bulk_transformations(tmp_path):
+    """Transform several folders concurrently and merge results per pass."""
+    backend = LocalBackend(str(tmp_path))
+    folders = ["2020/01", "2020/02", "2021/06"]
+    for folder in folders:
+        with BytesIO() as output:
+            Image.new("RGB", (1200, 700)).save(output, format="JPEG")
+            backend.write_bytes(f"{folder}/image.jpg", output.getvalue(), "image/jpg")
+    gcs = GCS(
+        "bucket",
+        "https://cdn.example.com/",
+        "roundup",
+        str(tmp_path),
+        variant_widths=[400],
+        variant_formats=["jpeg"],
+        max_workers=3,
+        backend=backend,
+    )
+    images = gcs.bulk_transformations(folders)
+    assert sorted(images["retina"]) == [f"{f}/_retina/image@2x.jpg" for f in folders]
+    assert sorted(images["mobile"]) == [f"{f}/_mobile/image@2x.jpg" for f in folders]
+    assert len(gcs.load_manifest()) == 6
+    assert not any(gcs.bulk_transformations(folders).values())
+
+
+def test_expand_folders():
+    """Year ranges expand to monthly folders; plain folders pass through."""
+    assert GCS.expand_folders(["2019-2020", "2020/01", "roundup"]) == [
+        *[f"2019/{month:02d}" for month in range(1, 13)],
+        *[f"2020/{month:02d}" for month in range(1, 13)],
+        "roundup",
+    ]
+
+
+def test_failed_batch_retries_each_blob(tmp_path):
+    """A failed batch is retried per blob, so only the failing blob is dropped."""
+    backend = GCSBackend("bucket", str(tmp_path))
+    backend._local.client = MagicMock()
+    bucket = backend.client.bucket.return_value
+    bucket.blob.side_effect = lambda name: name
+
+    def copy_blob(source, bucket, destination):
+        if source == "b.jpg":
+            raise Forbidden("denied")
+
+    bucket.copy_blob.side_effect = copy_blob
+    moves = [("a.jpg", "_retina/a.jpg"), ("b.jpg", "_retina/b.jpg")]
+    assert backend.copy(moves) == ["_retina/a.jpg"]
+    bucket.delete_blob.side_effect = [Forbidden("denied"), NotFound("gone"), None]
+    assert backend.delete(["a.jpg", "b.jpg"]) == ["a.jpg", "b.jpg"]
@@ -66,6 +66,10 @@ class Settings(BaseSettings):
                 "name": "github",
                 "description": "Github notifications for new issues/PRs.",
             },
+            {
+                "name": "metrics",
+                "description": "Runtime performance metrics.",
+            },
         ],
     )
 
@@ -75,8 +79,28 @@ class Settings(BaseSettings):
     # Database
     SQLALCHEMY_DATABASE_URI: str = getenv("SQLALCHEMY_DATABASE_URI")
     SQLALCHEMY_DATABASE_PEM: str = getenv("SQLALCHEMY_DATABASE_PEM")
+    SQLALCHEMY_REPLICA_URIS: str = getenv("SQLALCHEMY_REPLICA_URIS", "")
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
-    SQLALCHEMY_ENGINE_OPTIONS: dict = {"ssl": {"key": SQLALCHEMY_DATABASE_PEM}}
+    SQLALCHEMY_LOCAL_INFILE: bool = getenv("SQLALCHEMY_LOCAL_INFILE") == "true"
+    SQLALCHEMY_ENGINE_OPTIONS: dict = {
+        "ssl": {"key": SQLALCHEMY_DATABASE_PEM},
+        "local_infile": SQLALCHEMY_LOCAL_INFILE,
+    }
+    SQLALCHEMY_POOL_SIZE: int = 5
+    SQLALCHEMY_MAX_OVERFLOW: int = 10
+    SQLALCHEMY_POOL_RECYCLE: int = 1800
+    SQLALCHEMY_POOL_TIMEOUT: int = 30
+    SQLALCHEMY_POOL_PRE_PING: bool = True
+    SQLALCHEMY_ASYNC_DRIVER: str = "aiomysql"
+    SQL_QUERY_DIRECTORY: str = f"{basedir}/database/queries"
+    SQL_QUERY_RELOAD: bool = getenv("SQL_QUERY_RELOAD") == "true"
+    SQL_WATERMARK_OVERLAP: int = 300
+    SQL_SLOW_QUERY_MS: int = 500
+    DATABASE_LOCAL: bool = getenv("DATABASE_LOCAL") == "true"
+    DATABASE_LOCAL_DIRECTORY: str = getenv(
+        "DATABASE_LOCAL_DIRECTORY", f"{basedir}/.sqlite"
+    )
+    DATABASE_LOCAL_POSTS: int = 1000
 
     # Algolia API
     ALGOLIA_BASE_URL: str = "https://analytics.algolia.com/2"
@@ -97,6 +121,29 @@ class Settings(BaseSettings):
     GCP_BUCKET_NAME: str = getenv("GCP_BUCKET_NAME")
     GCP_BUCKET_FOLDER: list = [f'{dt.year}/{dt.strftime("%m")}']
     GCP_LYNX_DIRECTORY: str = "roundup"
+    GCP_LYNX_POOL_TTL: int = 3600
+
+    # Image storage backend (`gcs` or `local`)
+    STORAGE_BACKEND: str = getenv("STORAGE_BACKEND", "gcs")
+    STORAGE_LOCAL_DIRECTORY: str = getenv(
+        "STORAGE_LOCAL_DIRECTORY", f"{basedir}/.storage"
+    )
+
+    # On-demand image derivatives
+    IMAGE_CACHE_DIRECTORY: str = getenv(
+        "IMAGE_CACHE_DIRECTORY", f"{basedir}/.cache/images"
+    )
+    IMAGE_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    IMAGE_CACHE_MAX_AGE: int = 60 * 60 * 24 * 365
+    IMAGE_RENDER_MAX_WIDTH: int = 3200
+    GCP_IMAGE_VARIANT_WIDTHS: list = [400, 800, 1200, 1600]
+    GCP_IMAGE_VARIANT_FORMATS: list = ["jpeg", "webp", "avif"]
+    GCP_IMAGE_MANIFEST: str = "_manifest/variants.json"
+    GCP_IMAGE_CURSORS: str = "_manifest/cursors.json"
+    GCP_IMAGE_WORKERS: int = 4
+    GCP_PUBSUB_PUSH_TOKEN: str = getenv("GCP_PUBSUB_PUSH_TOKEN")
+    GCP_PUBSUB_PUSH_AUDIENCE: str = getenv("GCP_PUBSUB_PUSH_AUDIENCE")
+    GCP_PUBSUB_PUSH_SERVICE_ACCOUNT: str = getenv("GCP_PUBSUB_PUSH_SERVICE_ACCOUNT")
     # GOOGLE_APPLICATION_CREDENTIALS: str = getenv("GOOGLE_APPLICATION_CREDENTIALS")
     # GCP_CREDENTIALS = service_account.Credentials.from_service_account_file(
     #     f"{basedir}/{GOOGLE_APPLICATION_CREDENTIALS}"
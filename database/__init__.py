@@ -1,8 +1,41 @@
-from config import Settings
+from config import settings
 
+from .engines import EngineRegistry
+from .local import LOCAL_ENGINE_ARGS, local_uri
+from .query_registry import QueryRegistry
+from .query_stats import QueryStats
 from .sql_db import Database
 
+# Timing of every statement executed, logging those slower than the threshold
+query_stats = QueryStats(slow_query_ms=settings.SQL_SLOW_QUERY_MS)
+
+# Connection pools shared by raw SQL & ORM sessions; reads may use replicas
+if settings.DATABASE_LOCAL:
+    # SQLite files standing in for each database, seeded upon API startup
+    engines = EngineRegistry(
+        uri=local_uri(settings.DATABASE_LOCAL_DIRECTORY),
+        args=LOCAL_ENGINE_ARGS,
+        async_driver="aiosqlite",
+        query_stats=query_stats,
+    )
+else:
+    engines = EngineRegistry(
+        uri=settings.SQLALCHEMY_DATABASE_URI,
+        args=settings.SQLALCHEMY_ENGINE_OPTIONS,
+        pool_size=settings.SQLALCHEMY_POOL_SIZE,
+        max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,
+        pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
+        pool_timeout=settings.SQLALCHEMY_POOL_TIMEOUT,
+        pool_pre_ping=settings.SQLALCHEMY_POOL_PRE_PING,
+        async_driver=settings.SQLALCHEMY_ASYNC_DRIVER,
+        query_stats=query_stats,
+        replica_uris=[
+            uri for uri in settings.SQLALCHEMY_REPLICA_URIS.split(",") if uri
+        ],
+    )
+
 # Database connection
-rdbms = Database(
-    uri=Settings().SQLALCHEMY_DATABASE_URI, args=Settings().SQLALCHEMY_ENGINE_OPTIONS
-)
+rdbms = Database(engines)
+
+# SQL queries from `database/queries`, keyed by relative path minus `.sql`
+queries = QueryRegistry(settings.SQL_QUERY_DIRECTORY, reload=settings.SQL_QUERY_RELOAD)
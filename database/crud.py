@@ -1,34 +1,60 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
+from sqlalchemy import delete, select
 from sqlalchemy.engine.result import Result
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from database.models import Account, Comment, CommentUpvote, Donation
+from database.models import Account, Comment, CommentUpvote, Donation, JobWatermark
 from database.schemas import NetlifyAccount, NewComment, NewDonation
 from log import LOGGER
 
 
-def get_donation(db: Session, donation_id: int) -> Optional[Result]:
+def read_bind(db: AsyncSession, primary: bool = False) -> Optional[dict]:
+    """
+    Route a session's read to its replica engine, unless the primary is requested.
+
+    :param db: ORM database session.
+    :type db: AsyncSession
+    :param primary: Read from the primary, eg. to see this session's own writes.
+    :type primary: bool
+    :returns: Optional[dict]
+    """
+    replica = db.sync_session.info.get("replica")
+    if primary or replica is None:
+        return None
+    return {"bind": replica}
+
+
+async def get_donation(
+    db: AsyncSession, donation_id: int, primary: bool = False
+) -> Optional[Result]:
     """
     Fetch BuyMeACoffee donation by ID.
 
     :param db: ORM database session.
-    :type db: Session
+    :type db: AsyncSession
     :param donation_id: Primary key for donation record.
     :type donation_id: int
+    :param primary: Read from the primary, eg. to see this session's own writes.
+    :type primary: bool
     :returns: Optional[Result]
     """
-    return db.query(Donation).filter(Donation.coffee_id == donation_id).first()
+    result = await db.execute(
+        select(Donation).where(Donation.coffee_id == donation_id),
+        bind_arguments=read_bind(db, primary),
+    )
+    return result.scalars().first()
 
 
-def create_donation(db: Session, donation: NewDonation) -> Donation:
+async def create_donation(db: AsyncSession, donation: NewDonation) -> Donation:
     """
     Create new BuyMeACoffee donation record.
 
     :param db: ORM database session.
-    :type db: Session
+    :type db: AsyncSession
     :param donation: Donation schema object.
     :type donation: NewDonation
     :returns: Donation
@@ -44,7 +70,7 @@ def create_donation(db: Session, donation: NewDonation) -> Donation:
             created_at=datetime.now(),
         )
         db.add(db_item)
-        db.commit()
+        await db.commit()
         LOGGER.success(
             f"Received and recorded donation: `{donation.name}` donated `{donation.count}` coffees."
         )
@@ -57,25 +83,33 @@ def create_donation(db: Session, donation: NewDonation) -> Donation:
         LOGGER.error(f"Unexpected error while creating donation record: {e}")
 
 
-def get_comment(db: Session, comment_id: int) -> Optional[Result]:
+async def get_comment(
+    db: AsyncSession, comment_id: int, primary: bool = False
+) -> Optional[Result]:
     """
     Fetch BuyMeACoffee donation by ID.
 
     :param db: ORM database session.
-    :type db: Session
+    :type db: AsyncSession
     :param comment_id: Primary key for user comment record.
     :type comment_id: int
+    :param primary: Read from the primary, eg. to see this session's own writes.
+    :type primary: bool
     :returns: Optional[Result]
     """
-    return db.query(Comment).filter(Comment.id == comment_id).first()
+    result = await db.execute(
+        select(Comment).where(Comment.id == comment_id),
+        bind_arguments=read_bind(db, primary),
+    )
+    return result.scalars().first()
 
 
-def create_comment(db: Session, comment: NewComment) -> Comment:
+async def create_comment(db: AsyncSession, comment: NewComment) -> Comment:
     """
     Create new user-submitted comment.
 
     :param db: ORM database session.
-    :type db: Session
+    :type db: AsyncSession
     :param comment: User comment object.
     :type comment: NewComment
     :returns: Comment
@@ -93,7 +127,7 @@ def create_comment(db: Session, comment: NewComment) -> Comment:
             post_id=comment.post_id,
         )
         db.add(new_comment)
-        db.commit()
+        await db.commit()
         LOGGER.success(
             f"New comment submitted by user `{new_comment.user_name}` on post `{new_comment.post_slug}`"
         )
@@ -106,12 +140,14 @@ def create_comment(db: Session, comment: NewComment) -> Comment:
         LOGGER.error(f"Unexpected error while creating comment: {e}")
 
 
-def submit_comment_upvote(db: Session, user_id: str, comment_id: int) -> CommentUpvote:
+async def submit_comment_upvote(
+    db: AsyncSession, user_id: str, comment_id: int
+) -> CommentUpvote:
     """
     Create a record of a user's upvote for a given comment.
 
     :param db: ORM database session.
-    :type db: Session
+    :type db: AsyncSession
     :param user_id: Primary key for account record.
     :type user_id: str
     :param comment_id: Unique ID of comment user attempted to upvote.
@@ -119,9 +155,9 @@ def submit_comment_upvote(db: Session, user_id: str, comment_id: int) -> Comment
     :returns: CommentUpvote
     """
     try:
-        upvote = CommentUpvote(user_id=user_id, comment_id=comment_id)
+        upvote = CommentUpvote(account_id=user_id, comment_id=comment_id)
         db.add(upvote)
-        db.commit()
+        await db.commit()
         LOGGER.success(
             f"Upvote submitted for comment `{comment_id}` from user `{user_id}`."
         )
@@ -134,12 +170,12 @@ def submit_comment_upvote(db: Session, user_id: str, comment_id: int) -> Comment
         LOGGER.error(f"Unexpected error while registering comment upvote: {e}")
 
 
-def remove_comment_upvote(db: Session, user_id: str, comment_id: int):
+async def remove_comment_upvote(db: AsyncSession, user_id: str, comment_id: int):
     """
     Delete a record of a user's upvote for a given comment.
 
     :param db: ORM database session.
-    :type db: Session
+    :type db: AsyncSession
     :param user_id: Primary key for account record.
     :type user_id: str
     :param comment_id: Unique ID of comment user attempted to upvote.
@@ -147,9 +183,13 @@ def remove_comment_upvote(db: Session, user_id: str, comment_id: int):
     :returns: CommentUpvote
     """
     try:
-        upvote = CommentUpvote(user_id=user_id, comment_id=comment_id)
-        db.delete(upvote)
-        db.commit()
+        await db.execute(
+            delete(CommentUpvote).where(
+                CommentUpvote.account_id == user_id,
+                CommentUpvote.comment_id == comment_id,
+            )
+        )
+        await db.commit()
         LOGGER.success(
             f"Removed upvote for comment `{comment_id}` from user `{user_id}`."
         )
@@ -161,46 +201,58 @@ def remove_comment_upvote(db: Session, user_id: str, comment_id: int):
         LOGGER.error(f"Unexpected error while attempting to remove comment upvote: {e}")
 
 
-def get_comment_upvote(db: Session, user_id: str, comment_id: int) -> Optional[Result]:
+async def get_comment_upvote(
+    db: AsyncSession, user_id: str, comment_id: int, primary: bool = False
+) -> Optional[Result]:
     """
     Validate whether a user has upvoted a given comment.
 
     :param db: ORM database session.
-    :type db: Session
+    :type db: AsyncSession
     :param user_id: Primary key for account record.
     :type user_id: str
     :param comment_id: Unique ID of comment user attempted to upvote.
     :type comment_id: int
+    :param primary: Read from the primary, eg. to see this session's own writes.
+    :type primary: bool
     :returns: Optional[Result]
     """
-    return (
-        db.query(CommentUpvote)
-        .filter(
-            CommentUpvote.user_id == user_id and CommentUpvote.comment_id == comment_id
-        )
-        .first()
+    result = await db.execute(
+        select(CommentUpvote).where(
+            CommentUpvote.account_id == user_id, CommentUpvote.comment_id == comment_id
+        ),
+        bind_arguments=read_bind(db, primary),
     )
+    return result.scalars().first()
 
 
-def get_account(db: Session, account_email: str) -> Optional[Result]:
+async def get_account(
+    db: AsyncSession, account_email: str, primary: bool = False
+) -> Optional[Result]:
     """
     Fetch account by email address.
 
     :param db: ORM database session.
-    :type db: Session
+    :type db: AsyncSession
     :param account_email: Primary key for account record.
     :type account_email: str
+    :param primary: Read from the primary, eg. to see this session's own writes.
+    :type primary: bool
     :returns: Optional[Result]
     """
-    return db.query(Account).filter(Account.email == account_email).first()
+    result = await db.execute(
+        select(Account).where(Account.email == account_email),
+        bind_arguments=read_bind(db, primary),
+    )
+    return result.scalars().first()
 
 
-def create_account(db: Session, account: NetlifyAccount) -> NetlifyAccount:
+async def create_account(db: AsyncSession, account: NetlifyAccount) -> NetlifyAccount:
     """
     Create new account record sourced from Netlify.
 
     :param db: ORM database session.
-    :type db: Session
+    :type db: AsyncSession
     :param account: User comment schema object.
     :type account: NetlifyAccount
     :returns: NetlifyAccount
@@ -217,7 +269,7 @@ def create_account(db: Session, account: NetlifyAccount) -> NetlifyAccount:
             updated_at=account.updated_at,
         )
         db.add(new_account)
-        db.commit()
+        await db.commit()
         LOGGER.success(
             f"New Netlify account created: `{account.user_metadata.full_name}`"
         )
@@ -228,3 +280,41 @@ def create_account(db: Session, account: NetlifyAccount) -> NetlifyAccount:
         LOGGER.error(f"IntegrityError while creating Netlify account: {e}")
     except Exception as e:
         LOGGER.error(f"Unexpected error while creating Netlify account: {e}")
+
+
+def get_watermarks(db: Session, jobs: List[str]) -> Dict[str, datetime]:
+    """
+    Fetch time of each job's last successful run; jobs never run default to epoch.
+
+    :param db: ORM database session.
+    :type db: Session
+    :param jobs: Names of incremental batch jobs.
+    :type jobs: List[str]
+    :returns: Dict[str, datetime]
+    """
+    watermarks = dict.fromkeys(jobs, datetime(1970, 1, 1))
+    for record in db.query(JobWatermark).filter(JobWatermark.job.in_(jobs)):
+        watermarks[record.job] = record.watermark
+    return watermarks
+
+
+def set_watermarks(db: Session, watermarks: Dict[str, datetime]) -> Optional[int]:
+    """
+    Record successful runs of incremental batch jobs.
+
+    :param db: ORM database session.
+    :type db: Session
+    :param watermarks: Map of job names -> time from which the next run should resume.
+    :type watermarks: Dict[str, datetime]
+    :returns: Optional[int]
+    """
+    try:
+        for job, watermark in watermarks.items():
+            db.merge(JobWatermark(job=job, watermark=watermark))
+        db.commit()
+        return len(watermarks)
+    except SQLAlchemyError as e:
+        db.rollback()
+        LOGGER.error(f"SQLAlchemyError while saving job watermarks: {e}")
+    except Exception as e:
+        LOGGER.error(f"Unexpected error while saving job watermarks: {e}")
@@ -0,0 +1,282 @@
+"""Shared SQLAlchemy engines & connection pool metrics."""
+import ssl
+from itertools import count
+from threading import Lock
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.engine.base import Engine
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from database.query_stats import QueryStats
+
+
+class PoolMetrics:
+    """Running totals of time spent waiting to check out pooled connections."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False):
+        """
+        Record a single connection checkout.
+
+        :param wait: Seconds spent waiting for a connection.
+        :type wait: float
+        :param timed_out: Whether the checkout gave up after `pool_timeout`.
+        :type timed_out: bool
+        """
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += int(timed_out)
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> dict:
+        """
+        Summarize checkout wait times in milliseconds.
+
+        :returns: dict
+        """
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(
+                    self.total_wait / self.checkouts * 1000 if self.checkouts else 0, 3
+                ),
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """Queue pool which measures how long each connection checkout waits."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            connection = super()._do_get()
+        except TimeoutError:
+            self.metrics.record(perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(perf_counter() - start)
+        return connection
+
+    def recreate(self) -> "TimedQueuePool":
+        # Keep metrics when an engine is disposed & its pool rebuilt.
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class TimedAsyncAdaptedQueuePool(TimedQueuePool, AsyncAdaptedQueuePool):
+    """Asyncio queue pool which measures how long each connection checkout waits."""
+
+
+class EngineRegistry:
+    """One pooled engine per database, shared by the ORM & raw SQL clients."""
+
+    def __init__(
+        self,
+        uri: str,
+        args: dict,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_recycle: int = 1800,
+        pool_timeout: int = 30,
+        pool_pre_ping: bool = True,
+        async_driver: str = "aiomysql",
+        query_stats: Optional[QueryStats] = None,
+        replica_uris: Optional[List[str]] = None,
+    ):
+        self.uri = uri
+        self.replica_uris = replica_uris or []
+        self._replica_cursor = count()
+        self.args = args
+        self.async_driver = async_driver
+        self.query_stats = query_stats
+        self.pool_options = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_recycle": pool_recycle,
+            "pool_timeout": pool_timeout,
+            "pool_pre_ping": pool_pre_ping,
+        }
+        self._engines: Dict[str, Engine] = {}
+        self._async_engines: Dict[str, AsyncEngine] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, database_name: str) -> Engine:
+        """
+        Fetch engine for a database, creating its connection pool on first use.
+
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :returns: Engine
+        """
+        return self._engine(database_name, self.uri, database_name)
+
+    def replica(self, database_name: str) -> Engine:
+        """
+        Fetch engine for reads, rotating between replicas; the primary if none.
+
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :returns: Engine
+        """
+        if not self.replica_uris:
+            return self[database_name]
+        i = next(self._replica_cursor) % len(self.replica_uris)
+        return self._engine(
+            f"{database_name}@replica-{i}", self.replica_uris[i], database_name
+        )
+
+    def _engine(self, key: str, uri: str, database_name: str) -> Engine:
+        """
+        Fetch a pooled engine by key, creating it on first use.
+
+        :param key: Name of engine, eg. `hackers_prod@replica-0`.
+        :type key: str
+        :param uri: URI of database server.
+        :type uri: str
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :returns: Engine
+        """
+        with self._lock:
+            if key not in self._engines:
+                engine = create_engine(
+                    f"{uri}/{database_name}",
+                    connect_args=self.args,
+                    poolclass=TimedQueuePool,
+                    echo=False,
+                    **self.pool_options,
+                )
+                if self.query_stats:
+                    self.query_stats.attach(engine, key)
+                self._engines[key] = engine
+            return self._engines[key]
+
+    def async_engine(self, database_name: str) -> AsyncEngine:
+        """
+        Fetch asyncio engine for a database, backed by the `async_driver` DBAPI.
+
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :returns: AsyncEngine
+        """
+        return self._async_engine(database_name, self.uri, database_name)
+
+    def async_replica(self, database_name: str) -> AsyncEngine:
+        """
+        Fetch asyncio engine for reads, rotating between replicas; the primary if none.
+
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :returns: AsyncEngine
+        """
+        if not self.replica_uris:
+            return self.async_engine(database_name)
+        i = next(self._replica_cursor) % len(self.replica_uris)
+        return self._async_engine(
+            f"{database_name}@replica-{i}", self.replica_uris[i], database_name
+        )
+
+    def _async_engine(self, key: str, uri: str, database_name: str) -> AsyncEngine:
+        """
+        Fetch a pooled asyncio engine by key, creating it on first use.
+
+        :param key: Name of engine, eg. `hackers_prod@replica-0`.
+        :type key: str
+        :param uri: URI of database server.
+        :type uri: str
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :returns: AsyncEngine
+        """
+        with self._lock:
+            if key not in self._async_engines:
+                url = make_url(f"{uri}/{database_name}")
+                url = url.set(
+                    drivername=f"{url.get_backend_name()}+{self.async_driver}"
+                )
+                engine = create_async_engine(
+                    url,
+                    connect_args=self._async_connect_args(self.args),
+                    poolclass=TimedAsyncAdaptedQueuePool,
+                    echo=False,
+                    **self.pool_options,
+                )
+                if self.query_stats:
+                    self.query_stats.attach(engine.sync_engine, key)
+                self._async_engines[key] = engine
+            return self._async_engines[key]
+
+    @staticmethod
+    def _async_connect_args(args: dict) -> dict:
+        """
+        Translate PyMySQL's `ssl` dict into the `SSLContext` asyncio drivers expect.
+
+        :param args: Connection arguments of synchronous engines.
+        :type args: dict
+        :returns: dict
+        """
+        ssl_args = args.get("ssl")
+        if not isinstance(ssl_args, dict):
+            return args
+        context = ssl.create_default_context(cafile=ssl_args.get("ca"))
+        if ssl_args.get("ca") is None:
+            # Matches PyMySQL, which skips verification when no CA is given.
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        if ssl_args.get("cert"):
+            context.load_cert_chain(ssl_args["cert"], keyfile=ssl_args.get("key"))
+        return {**args, "ssl": context}
+
+    def pool_status(self) -> Dict[str, dict]:
+        """
+        Report connection usage & checkout wait time of each engine's pool;
+        asyncio engines are reported as `<database> (async)`.
+
+        :returns: Dict[str, dict]
+        """
+        with self._lock:
+            engines = dict(self._engines)
+            engines.update(
+                (f"{key} (async)", engine.sync_engine)
+                for key, engine in self._async_engines.items()
+            )
+        return {
+            database_name: {
+                "size": engine.pool.size(),
+                "checked_out": engine.pool.checkedout(),
+                "overflow": engine.pool.overflow(),
+                **engine.pool.metrics.as_dict(),
+            }
+            for database_name, engine in engines.items()
+        }
+
+    def dispose(self):
+        """Close all pooled connections, eg. after forking a worker process."""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+
+    async def dispose_async(self):
+        """Close connections pooled by asyncio engines, eg. upon shutdown."""
+        with self._lock:
+            async_engines = list(self._async_engines.values())
+        for engine in async_engines:
+            await engine.dispose()
@@ -0,0 +1,326 @@
+"""SQLite stand-ins for the production databases, seeded with synthetic Ghost posts.
+
+Usage: python -m database.local --posts 10000 --reset
+"""
+import argparse
+import random
+from datetime import datetime, timedelta
+from os import makedirs, path, remove
+from typing import Dict, List
+
+import simplejson as json
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    inspect,
+)
+from sqlalchemy.engine.base import Engine
+
+from database.engines import EngineRegistry
+from log import LOGGER
+
+# Connection arguments of local SQLite engines, shared across pooled threads.
+LOCAL_ENGINE_ARGS = {"check_same_thread": False}
+
+# Databases which SQLite files stand in for.
+LOCAL_DATABASES = ["hackers_prod", "analytics"]
+
+# Rows inserted per `executemany` when seeding.
+SEED_CHUNK_SIZE = 5000
+
+# Subset of Ghost's schema read or written by the SQL batch jobs.
+ghost_metadata = MetaData()
+
+posts = Table(
+    "posts",
+    ghost_metadata,
+    Column("id", String(24), primary_key=True),
+    Column("uuid", String(36)),
+    Column("title", String(2000)),
+    Column("slug", String(191), index=True),
+    Column("mobiledoc", Text),
+    Column("html", Text),
+    Column("plaintext", Text),
+    Column("feature_image", String(2000)),
+    Column("featured", Integer, default=0),
+    Column("type", String(50), default="post"),
+    Column("status", String(50)),
+    Column("visibility", String(50), default="public"),
+    Column("email_recipient_filter", String(50), default="none"),
+    Column("custom_excerpt", String(2000)),
+    Column("created_at", DateTime),
+    Column("created_by", String(24)),
+    Column("updated_at", DateTime, index=True),
+    Column("published_at", DateTime),
+)
+
+posts_meta = Table(
+    "posts_meta",
+    ghost_metadata,
+    Column("id", String(24), primary_key=True),
+    Column("post_id", String(24), unique=True),
+    Column("og_image", String(2000)),
+    Column("og_title", String(300)),
+    Column("og_description", String(500)),
+    Column("twitter_image", String(2000)),
+    Column("twitter_title", String(300)),
+    Column("twitter_description", String(500)),
+    Column("meta_title", String(2000)),
+    Column("meta_description", String(2000)),
+)
+
+tags = Table(
+    "tags",
+    ghost_metadata,
+    Column("id", String(24), primary_key=True),
+    Column("name", String(191)),
+    Column("slug", String(191)),
+    Column("feature_image", String(2000)),
+    Column("meta_title", String(2000)),
+    Column("meta_description", String(2000)),
+    Column("og_image", String(2000)),
+    Column("og_title", String(300)),
+    Column("og_description", String(500)),
+    Column("twitter_image", String(2000)),
+    Column("twitter_title", String(300)),
+    Column("twitter_description", String(500)),
+    Column("updated_at", DateTime),
+)
+
+integrations = Table(
+    "integrations",
+    ghost_metadata,
+    Column("id", String(24), primary_key=True),
+    Column("name", String(191)),
+    Column("icon_image", String(2000)),
+    Column("updated_at", DateTime),
+)
+
+# Legacy image hosts which the CDN rewrite queries replace.
+LEGACY_CDN_URLS = [
+    "https://storage.googleapis.com/hackersandslackers-cdn/",
+    "https://hackersandslackers-cdn.storage.googleapis.com/",
+]
+CDN_URL = "https://cdn.hackersandslackers.com/"
+WORDS = ["python", "sql", "flask", "pandas", "data", "async", "gcp", "django", "api"]
+
+
+def local_uri(directory: str) -> str:
+    """
+    Engine URI under which each database is a SQLite file in `directory`.
+
+    :param directory: Directory containing local database files.
+    :type directory: str
+    :returns: str
+    """
+    makedirs(directory, exist_ok=True)
+    return f"sqlite:///{path.abspath(directory)}"
+
+
+def synthetic_post(i: int, rng: random.Random, now: datetime) -> Dict[str, dict]:
+    """
+    Generate a Ghost post and its metadata, with the defects batch jobs repair.
+
+    :param i: Index of post, used to derive unique IDs.
+    :type i: int
+    :param rng: Seeded random number generator.
+    :type rng: random.Random
+    :param now: Time the most recent post was updated.
+    :type now: datetime
+    :returns: Dict[str, dict]
+    """
+    post_id = f"{i:024x}"
+    lynx = rng.random() < 0.2
+    words = rng.choices(WORDS, k=rng.randint(3, 8))
+    title = f"Lynx Roundup, Issue {i}" if lynx else " ".join(words).title()
+    if rng.random() < 0.05:
+        title = f'"{title}"'
+    host = rng.choice(LEGACY_CDN_URLS) if rng.random() < 0.3 else CDN_URL
+    link = "http://" if rng.random() < 0.3 else "https://"
+    image_url = f"{host}{now.year}/{i}.jpg"
+    cards = []
+    if rng.random() < 0.6:
+        image = {"src": image_url}
+        if rng.random() < 0.5:
+            image["alt"] = title
+        cards.append(["image", image])
+    if lynx and rng.random() < 0.5:
+        cards.append(["bookmark", {"url": f"https://example.com/{i}"}])
+    body = " ".join(rng.choices(WORDS, k=200))
+    updated_at = now - timedelta(minutes=i)
+    feature_image = f"{host}{now.year}/{i}@2x.jpg" if rng.random() < 0.9 else None
+    return {
+        "post": {
+            "id": post_id,
+            "uuid": f"{i:032x}",
+            "title": title,
+            "slug": f"{'-'.join(words)}-{i}",
+            "mobiledoc": json.dumps({"version": "0.3.1", "cards": cards}),
+            "html": (
+                f'<p>{body} <a href="{link}example.com/{i}">link</a></p>'
+                f'<img src="{image_url}">'
+            ),
+            "plaintext": f"{body} {link}example.com/{i} {image_url}",
+            "feature_image": feature_image,
+            "featured": 0,
+            "type": "post",
+            "status": rng.choice(["published"] * 8 + ["draft", "scheduled"]),
+            "visibility": "public",
+            "email_recipient_filter": rng.choice(["none"] * 9 + ["all"]),
+            "custom_excerpt": " ".join(rng.choices(WORDS, k=20)),
+            "created_at": updated_at,
+            "created_by": str(rng.randint(1, 3)),
+            "updated_at": updated_at,
+            "published_at": updated_at,
+        },
+        "meta": {
+            "id": post_id,
+            "post_id": post_id,
+            "og_image": feature_image,
+            "og_title": title,
+            "og_description": None,
+            "twitter_image": feature_image,
+            "twitter_title": title,
+            "twitter_description": None,
+            "meta_title": title,
+            "meta_description": None,
+        },
+    }
+
+
+def seed_local_database(engine: Engine, count: int, seed: int = 0) -> int:
+    """
+    Create Ghost's tables and insert `count` synthetic posts, most with metadata.
+
+    :param engine: Engine of local `hackers_prod` database.
+    :type engine: Engine
+    :param count: Number of posts to generate.
+    :type count: int
+    :param seed: Seed for generated content.
+    :type seed: int
+    :returns: int
+    """
+    rng = random.Random(seed)
+    now = datetime.utcnow().replace(microsecond=0)
+    ghost_metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for offset in range(0, count, SEED_CHUNK_SIZE):
+            generated = [
+                synthetic_post(i, rng, now)
+                for i in range(offset, min(offset + SEED_CHUNK_SIZE, count))
+            ]
+            conn.execute(posts.insert(), [post["post"] for post in generated])
+            # Leave some posts without metadata for `missing_all_metadata`.
+            conn.execute(
+                posts_meta.insert(),
+                [post["meta"] for post in generated if rng.random() < 0.95],
+            )
+        conn.execute(tags.insert(), synthetic_tags(max(count // 20, 1), rng, now))
+        conn.execute(
+            integrations.insert(),
+            [
+                {
+                    "id": f"{i:024x}",
+                    "name": f"Integration {i}",
+                    "icon_image": f"{rng.choice(LEGACY_CDN_URLS)}icons/{i}.png",
+                    "updated_at": now,
+                }
+                for i in range(5)
+            ],
+        )
+    LOGGER.success(f"Seeded {count} synthetic posts into `{engine.url}`.")
+    return count
+
+
+def synthetic_tags(count: int, rng: random.Random, now: datetime) -> List[dict]:
+    """
+    Generate tags, some lacking the social metadata which batch jobs fill in.
+
+    :param count: Number of tags to generate.
+    :type count: int
+    :param rng: Seeded random number generator.
+    :type rng: random.Random
+    :param now: Time tags were last updated.
+    :type now: datetime
+    :returns: List[dict]
+    """
+    tags_ = []
+    for i in range(count):
+        name = f"{rng.choice(WORDS).title()} {i}"
+        image = f"{CDN_URL}tags/{i}.jpg"
+        tags_.append(
+            {
+                "id": f"{i:024x}",
+                "name": name,
+                "slug": name.lower().replace(" ", "-"),
+                "feature_image": image,
+                "meta_title": name,
+                "meta_description": f"Posts about {name}.",
+                **{
+                    column: value if rng.random() < 0.5 else None
+                    for column, value in [
+                        ("og_image", image),
+                        ("og_title", name),
+                        ("og_description", f"Posts about {name}."),
+                        ("twitter_image", image),
+                        ("twitter_title", name),
+                        ("twitter_description", f"Posts about {name}."),
+                    ]
+                },
+                "updated_at": now,
+            }
+        )
+    return tags_
+
+
+def ensure_local_database(engines: EngineRegistry, count: int, seed: int = 0):
+    """
+    Seed the local `hackers_prod` database unless its `posts` table exists.
+
+    :param engines: Engines of local databases.
+    :type engines: EngineRegistry
+    :param count: Number of posts to generate.
+    :type count: int
+    :param seed: Seed for generated content.
+    :type seed: int
+    """
+    engine = engines["hackers_prod"]
+    if not inspect(engine).has_table("posts"):
+        seed_local_database(engine, count, seed)
+
+
+def main():
+    from config import settings
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--posts", type=int, default=settings.DATABASE_LOCAL_POSTS, help="Posts."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument(
+        "--directory",
+        default=settings.DATABASE_LOCAL_DIRECTORY,
+        help="Directory of local database files.",
+    )
+    parser.add_argument(
+        "--reset", action="store_true", help="Delete existing local databases first."
+    )
+    args = parser.parse_args()
+    uri = local_uri(args.directory)
+    if args.reset:
+        for database_name in LOCAL_DATABASES:
+            database_file = path.join(args.directory, database_name)
+            if path.exists(database_file):
+                remove(database_file)
+    engines = EngineRegistry(uri, LOCAL_ENGINE_ARGS)
+    ensure_local_database(engines, args.posts, args.seed)
+    engines.dispose()
+
+
+if __name__ == "__main__":
+    main()
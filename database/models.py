@@ -1,5 +1,14 @@
 """Data models."""
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -68,3 +77,32 @@ class Donation(Base):
     link = Column(String(255))
     created_at = Column(DateTime)
     coffee_id = Column(Integer, unique=True, index=True)
+
+
+class JobWatermark(Base):
+    """Last successful run of an incremental batch job."""
+
+    __tablename__ = "job_watermarks"
+
+    job = Column(String(255), primary_key=True)
+    watermark = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class PostFlags(Base):
+    """Indexed flags derived from a Ghost post's content, in place of text scans."""
+
+    __tablename__ = "post_flags"
+    __table_args__ = (
+        Index("ix_post_flags_image_alt", "has_image_card", "has_img_alt"),
+        Index("ix_post_flags_lynx_bookmark", "is_lynx", "has_bookmark"),
+        Index("ix_post_flags_lynx_http_link", "is_lynx", "has_http_link"),
+    )
+
+    post_id = Column(String(24), primary_key=True)
+    is_lynx = Column(Boolean, nullable=False, default=False)
+    has_image_card = Column(Boolean, nullable=False, default=False)
+    has_img_alt = Column(Boolean, nullable=False, default=False)
+    has_bookmark = Column(Boolean, nullable=False, default=False)
+    has_http_link = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(DateTime)
@@ -1,15 +1,20 @@
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-from config import settings
+from database import engines
 
-URI = settings.SQLALCHEMY_DATABASE_URI
-ARGS = settings.SQLALCHEMY_ENGINE_OPTIONS
-
-engine = create_engine(f"{URI}/hackers_prod", connect_args=ARGS, echo=False)
+engine = engines["hackers_prod"]
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = engines.async_engine("hackers_prod")
+AsyncSessionLocal = sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 
@@ -19,3 +24,10 @@ def get_db():
         yield ses
     finally:
         ses.close()
+
+
+async def get_async_db():
+    # Pick a replica per session so reads spread across every replica.
+    replica = engines.async_replica("hackers_prod")
+    async with AsyncSessionLocal(info={"replica": replica.sync_engine}) as ses:
+        yield ses
@@ -0,0 +1,21 @@
+REPLACE INTO post_flags (
+	post_id,
+	is_lynx,
+	has_image_card,
+	has_img_alt,
+	has_bookmark,
+	has_http_link,
+	updated_at
+)
+SELECT
+	id,
+	COALESCE(title LIKE '%%Lynx%%', 0),
+	COALESCE(mobiledoc LIKE '%%["image"%%', 0),
+	COALESCE(mobiledoc LIKE '%%alt%%', 0),
+	COALESCE(mobiledoc LIKE '%%bookmark%%', 0),
+	COALESCE(html LIKE '%%http://%%', 0) OR COALESCE(plaintext LIKE '%%http://%%', 0),
+	updated_at
+FROM
+	posts
+WHERE
+	updated_at >= :since;
\ No newline at end of file
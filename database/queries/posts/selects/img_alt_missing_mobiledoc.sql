@@ -1,9 +1,10 @@
 SELECT
-	id,
-    mobiledoc
+	posts.id,
+	posts.mobiledoc
 FROM
-	posts
+	post_flags
+	JOIN posts ON posts.id = post_flags.post_id
 WHERE
-	mobiledoc NOT LIKE '%%alt%%'
-	AND mobiledoc LIKE '%%["image"%%'
-	AND status = 'published';
\ No newline at end of file
+	post_flags.has_image_card = 1
+	AND post_flags.has_img_alt = 0
+	AND posts.status = 'published';
\ No newline at end of file
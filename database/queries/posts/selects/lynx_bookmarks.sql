@@ -1,13 +1,14 @@
 SELECT
-    id,
-    slug,
-	title,
-	html,
-	mobiledoc
+	posts.id,
+	posts.slug,
+	posts.title,
+	posts.html,
+	posts.mobiledoc
 FROM
-	posts
+	post_flags
+	JOIN posts ON posts.id = post_flags.post_id
 WHERE
-	title LIKE '%%Lynx%%'
-	AND status IN ('scheduled', 'draft')
-	AND mobiledoc NOT LIKE '%%bookmark%%'
-	AND html IS NOT NULL;
\ No newline at end of file
+	post_flags.is_lynx = 1
+	AND post_flags.has_bookmark = 0
+	AND posts.status IN ('scheduled', 'draft')
+	AND posts.html IS NOT NULL;
\ No newline at end of file
@@ -1,6 +1,7 @@
 UPDATE
 	posts
 SET
-	custom_excerpt = REPLACE(custom_excerpt, '\"', '\'')
+	custom_excerpt = REPLACE(custom_excerpt, '"', '''')
 WHERE
-	custom_excerpt LIKE '%%\"%%';
+	custom_excerpt LIKE '%%"%%'
+	AND updated_at >= :since;
@@ -4,4 +4,5 @@ SET
 	email_recipient_filter = 'none'
 WHERE
 	email_recipient_filter != 'none'
-	AND created_by != 1;
\ No newline at end of file
+	AND created_by != 1
+	AND updated_at >= :since;
\ No newline at end of file
@@ -3,4 +3,5 @@ UPDATE
 SET
 	feature_image = REPLACE(feature_image, 'https://storage.googleapis.com/hackersandslackers-cdn/', 'https://cdn.hackersandslackers.com/')
 WHERE
-	feature_image LIKE '%https://storage.googleapis.com/hackersandslackers-cdn/%';
\ No newline at end of file
+	feature_image LIKE '%https://storage.googleapis.com/hackersandslackers-cdn/%'
+	AND updated_at >= :since;
\ No newline at end of file
@@ -3,4 +3,5 @@ UPDATE
 SET
 	html = REPLACE(html, 'https://hackersandslackers-cdn.storage.googleapis.com', 'https://cdn.hackersandslackers.com')
 WHERE
-	html LIKE '%https://hackersandslackers-cdn.storage.googleapis.com%';
\ No newline at end of file
+	html LIKE '%https://hackersandslackers-cdn.storage.googleapis.com%'
+	AND updated_at >= :since;
\ No newline at end of file
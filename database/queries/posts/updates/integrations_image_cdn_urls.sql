@@ -3,4 +3,5 @@ UPDATE
 SET
 	icon_image = REPLACE(icon_image, 'https://hackersandslackers-cdn.storage.googleapis.com/', 'https://cdn.hackersandslackers.com/')
 WHERE
-	icon_image LIKE '%https://hackersandslackers-cdn.storage.googleapis.com/%';
\ No newline at end of file
+	icon_image LIKE '%https://hackersandslackers-cdn.storage.googleapis.com/%'
+	AND updated_at >= :since;
\ No newline at end of file
@@ -3,5 +3,11 @@ UPDATE
 SET
 	html = REPLACE(html, 'http://', 'https://')
 WHERE
-	title LIKE '%%Lynx%%'
-	AND html LIKE '%%http://%%';
\ No newline at end of file
+	id IN (
+		SELECT
+			post_id FROM post_flags
+		WHERE
+			is_lynx = 1
+			AND has_http_link = 1)
+	AND html LIKE '%%http://%%'
+	AND updated_at >= :since;
\ No newline at end of file
@@ -3,5 +3,11 @@ UPDATE
 SET
 	plaintext = REPLACE(plaintext, 'http://', 'https://')
 WHERE
-	title LIKE '%%Lynx%%'
-    AND plaintext LIKE '%%http://%%';
\ No newline at end of file
+	id IN (
+		SELECT
+			post_id FROM post_flags
+		WHERE
+			is_lynx = 1
+			AND has_http_link = 1)
+    AND plaintext LIKE '%%http://%%'
+	AND updated_at >= :since;
\ No newline at end of file
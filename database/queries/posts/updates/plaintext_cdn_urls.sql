@@ -3,4 +3,5 @@ UPDATE
 SET
 	plaintext = REPLACE(plaintext, 'https://hackersandslackers-cdn.storage.googleapis.com', 'https://cdn.hackersandslackers.com')
 WHERE
-	plaintext LIKE '%https://hackersandslackers-cdn.storage.googleapis.com%';
\ No newline at end of file
+	plaintext LIKE '%https://hackersandslackers-cdn.storage.googleapis.com%'
+	AND updated_at >= :since;
\ No newline at end of file
@@ -3,4 +3,5 @@ UPDATE
 SET og_description = meta_description
 WHERE
 	meta_description IS NOT NULL
-	AND og_description IS NULL;
\ No newline at end of file
+	AND og_description IS NULL
+	AND updated_at >= :since;
\ No newline at end of file
@@ -3,4 +3,5 @@ UPDATE
 SET og_image = feature_image
 WHERE
 	feature_image IS NOT NULL
-	AND og_image IS NULL;
\ No newline at end of file
+	AND og_image IS NULL
+	AND updated_at >= :since;
\ No newline at end of file
@@ -3,4 +3,5 @@ UPDATE
 SET og_title = meta_title
 WHERE
 	meta_title IS NOT NULL
-	AND og_title IS NULL;
\ No newline at end of file
+	AND og_title IS NULL
+	AND updated_at >= :since;
\ No newline at end of file
@@ -3,4 +3,5 @@ UPDATE
 SET twitter_description = meta_description
 WHERE
 	meta_title IS NOT NULL
-	AND twitter_description IS NULL;
\ No newline at end of file
+	AND twitter_description IS NULL
+	AND updated_at >= :since;
\ No newline at end of file
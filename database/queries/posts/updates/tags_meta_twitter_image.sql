@@ -3,4 +3,5 @@ UPDATE
 SET twitter_image = feature_image
 WHERE
 	feature_image IS NOT NULL
-	AND twitter_image IS NULL;
\ No newline at end of file
+	AND twitter_image IS NULL
+	AND updated_at >= :since;
\ No newline at end of file
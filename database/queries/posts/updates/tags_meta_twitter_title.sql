@@ -3,4 +3,5 @@ UPDATE
 SET twitter_title = meta_title
 WHERE
 	meta_title IS NOT NULL
-	AND twitter_title IS NULL;
\ No newline at end of file
+	AND twitter_title IS NULL
+	AND updated_at >= :since;
\ No newline at end of file
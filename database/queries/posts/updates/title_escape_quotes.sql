@@ -1,6 +1,7 @@
 UPDATE
 	posts
 SET
-	title = REPLACE(title, '\"', '\'')
+	title = REPLACE(title, '"', '''')
 WHERE
-	title LIKE '%%\"%%';
+	title LIKE '%%"%%'
+	AND updated_at >= :since;
@@ -3,4 +3,5 @@ UPDATE
 SET
 	twitter_image = REPLACE(twitter_image, 'https://storage.googleapis.com/hackersandslackers-cdn/', 'https://cdn.hackersandslackers.com/')
 WHERE
-	twitter_image LIKE '%https://storage.googleapis.com/hackersandslackers-cdn/%';
\ No newline at end of file
+	twitter_image LIKE '%https://storage.googleapis.com/hackersandslackers-cdn/%'
+	AND post_id IN (SELECT id FROM posts WHERE updated_at >= :since);
\ No newline at end of file
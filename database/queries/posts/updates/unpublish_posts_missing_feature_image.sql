@@ -5,4 +5,5 @@ SET
 WHERE
 	feature_image IS NULL
 	AND TYPE = 'post'
-	AND status = 'published';
\ No newline at end of file
+	AND status = 'published'
+	AND updated_at >= :since;
\ No newline at end of file
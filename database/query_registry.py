@@ -0,0 +1,126 @@
+"""Registry of SQL queries loaded once from `.sql` files."""
+from os import path, walk
+from threading import Lock
+from typing import Dict, NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+from log import LOGGER
+
+
+class SQLQuery(NamedTuple):
+    """SQL read from a file, alongside its compiled statement."""
+
+    sql: str
+    statement: TextClause
+    mtime: float
+
+
+class QueryRegistry:
+    """SQL files keyed by path relative to the queries directory, minus `.sql`."""
+
+    def __init__(self, directory: str, reload: bool = False):
+        self.directory = directory
+        self.reload = reload
+        self._queries: Dict[str, SQLQuery] = {}
+        self._lock = Lock()
+        self.load()
+
+    def load(self):
+        """Read & compile every `.sql` file beneath the queries directory."""
+        queries = {}
+        for folder, _, files in walk(self.directory):
+            for file in sorted(files):
+                if file.endswith(".sql"):
+                    file_path = path.join(folder, file)
+                    queries[self._name(file_path)] = self._read(file_path)
+        with self._lock:
+            self._queries = queries
+        LOGGER.info(f"Loaded {len(queries)} SQL queries from `{self.directory}`")
+
+    def __getitem__(self, name: str) -> TextClause:
+        """
+        Fetch compiled SQL statement by name, eg. `posts/selects/lynx_bookmarks`.
+
+        :param name: Path of SQL file relative to queries directory, without `.sql`.
+        :type name: str
+        :returns: TextClause
+        """
+        return self._get(name).statement
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._queries
+
+    def sql(self, name: str) -> str:
+        """
+        Fetch raw SQL by name, eg. for clients which don't accept SQLAlchemy statements.
+
+        :param name: Path of SQL file relative to queries directory, without `.sql`.
+        :type name: str
+        :returns: str
+        """
+        return self._get(name).sql
+
+    def collection(self, subdirectory: str) -> Dict[str, TextClause]:
+        """
+        Fetch all compiled statements in a subdirectory, keyed by filename.
+
+        :param subdirectory: Subdirectory of queries directory, eg. `posts/updates`.
+        :type subdirectory: str
+        :returns: Dict[str, TextClause]
+        """
+        if self.reload:
+            self.load()
+        prefix = f"{subdirectory.strip('/')}/"
+        return {
+            f"{name[len(prefix):]}.sql": self[name]
+            for name in sorted(self._queries)
+            if name.startswith(prefix) and "/" not in name[len(prefix) :]
+        }
+
+    def _get(self, name: str) -> SQLQuery:
+        """
+        Fetch a loaded query, re-reading its file if changed and `reload` is enabled.
+
+        :param name: Path of SQL file relative to queries directory, without `.sql`.
+        :type name: str
+        :returns: SQLQuery
+        """
+        query = self._queries.get(name)
+        if self.reload:
+            file_path = path.join(self.directory, f"{name}.sql")
+            if path.isfile(file_path) and (
+                query is None or path.getmtime(file_path) != query.mtime
+            ):
+                query = self._read(file_path)
+                with self._lock:
+                    self._queries[name] = query
+                LOGGER.info(f"Reloaded SQL query `{name}`")
+        if query is None:
+            raise KeyError(f"No SQL query named `{name}` in `{self.directory}`.")
+        return query
+
+    def _name(self, file_path: str) -> str:
+        """
+        Logical name of a SQL file.
+
+        :param file_path: Absolute path of SQL file.
+        :type file_path: str
+        :returns: str
+        """
+        name = path.relpath(file_path, self.directory).replace(path.sep, "/")
+        return name[: -len(".sql")]
+
+    @staticmethod
+    def _read(file_path: str) -> SQLQuery:
+        """
+        Read & compile a SQL file.
+
+        :param file_path: Absolute path of SQL file.
+        :type file_path: str
+        :returns: SQLQuery
+        """
+        with open(file_path, "r") as sql_file:
+            sql = sql_file.read()
+        return SQLQuery(sql, text(sql), path.getmtime(file_path))
@@ -0,0 +1,147 @@
+"""Per-statement timing & slow query logging for SQLAlchemy engines."""
+import re
+from functools import lru_cache
+from threading import Lock
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine.base import Engine
+
+from log import LOGGER
+
+# Literals & placeholders which vary between executions of the same statement.
+LITERALS = re.compile(
+    r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"|\b\d+(?:\.\d+)?\b|%\(\w+\)s|%s|:\w+|\?"
+)
+
+# Repeated placeholders of `IN (...)` lists & multi-row `VALUES` clauses.
+REPEATED_PLACEHOLDERS = re.compile(r"\?(?:\s*,\s*\?)+")
+REPEATED_ROWS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """
+    Normalize a statement so executions differing only by values share stats.
+
+    :param statement: SQL statement as sent to the DBAPI cursor.
+    :type statement: str
+    :returns: str
+    """
+    normalized = LITERALS.sub("?", " ".join(statement.split()))
+    normalized = REPEATED_PLACEHOLDERS.sub("?", normalized)
+    return REPEATED_ROWS.sub("(?)", normalized)
+
+
+class QueryStats:
+    """Aggregate duration & rows of statements executed by instrumented engines."""
+
+    def __init__(self, slow_query_ms: float = 1000):
+        self.slow_query_ms = slow_query_ms
+        self._stats: Dict[Tuple[str, str], dict] = {}
+        self._lock = Lock()
+
+    def attach(self, engine: Engine, database_name: str):
+        """
+        Time every statement an engine executes via cursor execution events.
+
+        :param engine: Engine to instrument.
+        :type engine: Engine
+        :param database_name: Name of database the engine connects to.
+        :type database_name: str
+        """
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def start_timer(conn, cursor, statement, parameters, context, executemany):
+            if context is not None:
+                context.query_start = perf_counter()
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def stop_timer(conn, cursor, statement, parameters, context, executemany):
+            if context is None or not hasattr(context, "query_start"):
+                return
+            self.record(
+                database_name,
+                statement,
+                perf_counter() - context.query_start,
+                cursor.rowcount,
+                context.execution_options.get("query_name"),
+            )
+
+    def record(
+        self,
+        database_name: str,
+        statement: str,
+        duration: float,
+        rowcount: int,
+        name: Optional[str] = None,
+    ):
+        """
+        Add a single execution to its statement's totals, logging it if slow.
+
+        :param database_name: Name of database statement ran against.
+        :type database_name: str
+        :param statement: SQL statement as sent to the DBAPI cursor.
+        :type statement: str
+        :param duration: Seconds spent executing statement.
+        :type duration: float
+        :param rowcount: Rows affected or returned, or -1 if unknown.
+        :type rowcount: int
+        :param name: Name of query, eg. its SQL file, if known.
+        :type name: Optional[str]
+        """
+        key = (database_name, fingerprint(statement))
+        duration_ms = duration * 1000
+        slow = duration_ms >= self.slow_query_ms
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {
+                    "name": name,
+                    "calls": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "rows": 0,
+                    "slow_calls": 0,
+                }
+            stats["name"] = name or stats["name"]
+            stats["calls"] += 1
+            stats["total_ms"] += duration_ms
+            stats["max_ms"] = max(stats["max_ms"], duration_ms)
+            stats["rows"] += max(rowcount, 0)
+            stats["slow_calls"] += int(slow)
+        if slow:
+            LOGGER.warning(
+                f"Slow query `{name or key[1]}` on `{database_name}` took "
+                f"{duration_ms:.2f}ms ({rowcount} rows)."
+            )
+
+    def summary(self, limit: Optional[int] = None) -> List[dict]:
+        """
+        Per-statement totals, slowest in aggregate first.
+
+        :param limit: Maximum number of statements to report.
+        :type limit: Optional[int]
+        :returns: List[dict]
+        """
+        with self._lock:
+            stats = [
+                {"database": database_name, "statement": statement, **totals}
+                for (database_name, statement), totals in self._stats.items()
+            ]
+        stats.sort(key=lambda query: query["total_ms"], reverse=True)
+        return [
+            {
+                **query,
+                "total_ms": round(query["total_ms"], 2),
+                "avg_ms": round(query["total_ms"] / query["calls"], 2),
+                "max_ms": round(query["max_ms"], 2),
+            }
+            for query in stats[:limit]
+        ]
+
+    def reset(self):
+        """Discard all recorded statement totals."""
+        with self._lock:
+            self._stats.clear()
@@ -1,12 +1,9 @@
 """Read analytics from local SQL files."""
-from os import listdir
-from os.path import isfile, join
-from typing import List
+from typing import Iterator
 
-from sqlalchemy.engine.result import Result
+from sqlalchemy.engine.row import Row
 
-from config import basedir
-from database import rdbms
+from database import queries, rdbms
 
 
 def collect_sql_queries(subdirectory: str) -> dict:
@@ -17,53 +14,16 @@ def collect_sql_queries(subdirectory: str) -> dict:
     :type subdirectory: str
     :returns: dict
     """
-    sql_file_paths = fetch_sql_files(subdirectory)
-    sql_queries = parse_sql_batch(sql_file_paths)
-    sql_file_names = [file.split("/")[-1] for file in sql_file_paths]
-    query_dict = dict(zip(sql_file_names, sql_queries))
-    return query_dict
+    return queries.collection(subdirectory)
 
 
-def fetch_sql_files(subdirectory: str) -> List[str]:
+def fetch_raw_lynx_posts() -> Iterator[Row]:
     """
-    Fetch all SQL query files in folder.
+    Read all Lynx posts lacking embedded link previews a page at a time, so no
+    cursor is held open while link previews are scraped.
 
-    :param subdirectory: Subdirectory containing SQL files to fetch.
-    :type subdirectory: str
-    :returns: List[str]
-    """
-    folder = f"{basedir}/database/queries/{subdirectory}"
-    directory = listdir(folder)
-    files = [
-        folder + "/" + f for f in directory if isfile(join(folder, f)) if ".sql" in f
-    ]
-    return files
-
-
-def parse_sql_batch(sql_file_paths: List[str]) -> List[str]:
-    """
-    Read SQL analytics from .sql files.
-
-    :param sql_file_paths: List of paths to SQL files to read and parse.
-    :type sql_file_paths: List[str]
-    :returns: List[str]
-    """
-    queries = []
-    for file in sql_file_paths:
-        sql_file = open(file, "r")
-        query = sql_file.read()
-        queries.append(query)
-        sql_file.close()
-    return queries
-
-
-def fetch_raw_lynx_posts() -> Result:
-    """
-    Find all Lynx posts lacking embedded link previews.
-
-    :returns: Result
+    :returns: Iterator[Row]
     """
-    sql_file = open(f"{basedir}/database/queries/posts/selects/lynx_bookmarks.sql", "r")
-    query = sql_file.read()
-    posts = rdbms.execute_query(query, "hackers_prod").fetchall()
-    return posts
+    pages = rdbms.read_pages(queries["posts/selects/lynx_bookmarks"], "hackers_prod")
+    for page in pages:
+        yield from page
@@ -490,20 +490,23 @@ class PostBulkUpdate(BaseModel):
             "updated": {
                 "count": 0,
                 "posts": {
-                    "tags_meta_og_image.sql": 0,
-                    "tags_meta_og_description.sql": 0,
-                    "lynx_plaintext_https.sql": 0,
-                    "tags_meta_twitter_title.sql": 0,
-                    "feature_image_cdn_urls.sql": 0,
-                    "title_escape_quotes.sql": 0,
-                    "description_escape_quotes.sql": 0,
-                    "plaintext_cdn_urls.sql": 0,
-                    "tags_meta_twitter_description.sql": 0,
-                    "tags_meta_twitter_image.sql": 0,
-                    "email_unset_newsletter.sql": 0,
-                    "tags_meta_og_title.sql": 0,
-                    "lynx_html_https.sql": 0,
-                    "html_cdn_urls.sql": 0,
+                    "tags_meta_og_image.sql": {"rows": 0, "duration_ms": 0.0},
+                    "tags_meta_og_description.sql": {"rows": 0, "duration_ms": 0.0},
+                    "lynx_plaintext_https.sql": {"rows": 0, "duration_ms": 0.0},
+                    "tags_meta_twitter_title.sql": {"rows": 0, "duration_ms": 0.0},
+                    "feature_image_cdn_urls.sql": {"rows": 0, "duration_ms": 0.0},
+                    "title_escape_quotes.sql": {"rows": 0, "duration_ms": 0.0},
+                    "description_escape_quotes.sql": {"rows": 0, "duration_ms": 0.0},
+                    "plaintext_cdn_urls.sql": {"rows": 0, "duration_ms": 0.0},
+                    "tags_meta_twitter_description.sql": {
+                        "rows": 0,
+                        "duration_ms": 0.0,
+                    },
+                    "tags_meta_twitter_image.sql": {"rows": 0, "duration_ms": 0.0},
+                    "email_unset_newsletter.sql": {"rows": 0, "duration_ms": 0.0},
+                    "tags_meta_og_title.sql": {"rows": 0, "duration_ms": 0.0},
+                    "lynx_html_https.sql": {"rows": 0, "duration_ms": 0.0},
+                    "html_cdn_urls.sql": {"rows": 0, "duration_ms": 0.0},
                 },
             },
         }
@@ -528,3 +531,24 @@ class AnalyticsRowsUpdated(BaseModel):
 
 class AnalyticsResponse(BaseModel):
     updated: AnalyticsRowsUpdated
+
+
+class PubSubMessage(BaseModel):
+    attributes: Dict[str, str] = Field(
+        {},
+        example={
+            "eventType": "OBJECT_FINALIZE",
+            "bucketId": "hackersandslackers-cdn",
+            "objectId": "2021/06/my-image.jpg",
+        },
+    )
+    data: Optional[str] = Field(None, example="eyJraW5kIjogInN0b3JhZ2Ujb2JqZWN0In0=")
+    messageId: Optional[str] = Field(None, example="2521583938327383")
+    publishTime: Optional[str] = Field(None, example="2021-06-14T07:33:24.000Z")
+
+
+class StorageNotification(BaseModel):
+    message: PubSubMessage
+    subscription: Optional[str] = Field(
+        None, example="projects/hackers/subscriptions/cdn-uploads"
+    )
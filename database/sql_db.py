@@ -1,111 +1,529 @@
 """Database client."""
-from typing import List, Optional, Tuple
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from pandas import DataFrame
-from sqlalchemy import MetaData, Table, create_engine, text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    Float,
+    MetaData,
+    Table,
+    Text,
+    case,
+    inspect,
+    text,
+)
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.result import Result
+from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.sql.elements import TextClause
 
+from database.engines import EngineRegistry
 from log import LOGGER
 
+# Statements which may change a table's schema, invalidating reflected tables.
+DDL_STATEMENT = re.compile(r"^\s*(ALTER|CREATE|DROP|RENAME|TRUNCATE)\b", re.IGNORECASE)
+
+# Table written by a DML statement; statements writing the same table run serially.
+TARGET_TABLE = re.compile(
+    r"^\s*(?:UPDATE|INSERT\s+INTO|REPLACE\s+INTO|DELETE\s+FROM)\s+`?(\w+)`?",
+    re.IGNORECASE,
+)
+
+# Ways `execute_queries` may run a batch of statements.
+EXECUTION_MODES = ("autocommit", "transaction", "concurrent")
+
+# Rows fetched per round trip when streaming results from a server-side cursor.
+STREAM_CHUNK_SIZE = 500
+
+# Rows per multi-row `INSERT ... VALUES` statement when bulk inserting.
+INSERT_CHUNK_SIZE = 1000
+
+# SQL types of DataFrame columns by NumPy dtype kind; strings map to `TEXT`.
+DATAFRAME_DTYPES = {
+    "b": Boolean,
+    "i": BigInteger,
+    "u": BigInteger,
+    "f": Float,
+    "M": DateTime,
+    "O": Text,
+}
+
+# Characters escaped in files read by `LOAD DATA INFILE`'s default text format.
+INFILE_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"}
+)
+
 
 class Database:
     """Database client."""
 
-    def __init__(self, uri: str, args: dict):
-        self.engines = {
-            "analytics": create_engine(
-                f"{uri}/analytics", connect_args=args, echo=False
-            ),
-            "hackers_prod": create_engine(
-                f"{uri}/hackers_prod", connect_args=args, echo=False
-            ),
-        }
+    def __init__(self, engines: EngineRegistry):
+        self.engines = engines
+        self._tables: Dict[Tuple[str, str], Table] = {}
+        self._tables_lock = Lock()
 
     def _table(self, table_name: str, database_name: str) -> Table:
         """
+        Fetch table schema, reflecting it from the database only on first use.
+
         :param table_name: Name of database table to fetch
         :type table_name: str
         :param database_name: Name of database to connect to.
         :type database_name: str
         :returns: Table
         """
-        return Table(
-            table_name, MetaData(bind=self.engines[database_name]), autoload=True
-        )
+        with self._tables_lock:
+            table = self._tables.get((database_name, table_name))
+            if table is None:
+                table = Table(
+                    table_name,
+                    MetaData(),
+                    autoload_with=self.engines[database_name],
+                )
+                self._tables[(database_name, table_name)] = table
+            return table
+
+    def invalidate_tables(self, database_name: str, table_name: Optional[str] = None):
+        """
+        Discard reflected table schemas after DDL so they are reflected again.
+
+        :param database_name: Name of database containing changed tables.
+        :type database_name: str
+        :param table_name: Name of changed table; all tables in database if omitted.
+        :type table_name: Optional[str]
+        """
+        with self._tables_lock:
+            for key in list(self._tables):
+                if key[0] == database_name and table_name in (None, key[1]):
+                    del self._tables[key]
+
+    def _invalidate_after_ddl(self, query: Union[str, TextClause], database_name: str):
+        """
+        Invalidate reflected tables if a raw SQL statement may have altered them.
+
+        :param query: SQL statement which was executed.
+        :type query: Union[str, TextClause]
+        :param database_name: Name of database the statement ran against.
+        :type database_name: str
+        """
+        if DDL_STATEMENT.match(str(query)):
+            self.invalidate_tables(database_name)
+
+    def _reader(self, database_name: str, primary: bool = False) -> Engine:
+        """
+        Engine to read from: a replica, unless the primary is explicitly requested.
+
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :param primary: Read from the primary, eg. to see this request's own writes.
+        :type primary: bool
+        :returns: Engine
+        """
+        if primary:
+            return self.engines[database_name]
+        return self.engines.replica(database_name)
+
+    @staticmethod
+    def _statement(query: Union[str, TextClause]) -> TextClause:
+        """
+        Compile raw SQL, passing through statements precompiled by the query registry.
+
+        :param query: Raw SQL or compiled statement.
+        :type query: Union[str, TextClause]
+        :returns: TextClause
+        """
+        if isinstance(query, TextClause):
+            return query
+        return text(query)
 
     @LOGGER.catch
-    def execute_queries(self, queries: dict, database_name: str) -> Tuple[dict, int]:
-        """Execute collection of SQL analytics.
+    def execute_queries(
+        self,
+        queries: dict,
+        database_name: str,
+        mode: str = "autocommit",
+        params: Optional[Dict[str, dict]] = None,
+    ) -> Tuple[dict, int]:
+        """Execute collection of SQL analytics, timing each statement.
+
+        `autocommit` commits each statement separately; `transaction` runs the
+        batch in a single transaction; `concurrent` runs statements writing
+        different tables in parallel, one transaction & pooled connection per table.
+        Only statements which committed are returned, so a failed statement or
+        table group doesn't hide work committed alongside it.
 
-        :param queries: Map of query names -> SQL analytics.
+        :param queries: Map of query names -> raw SQL or compiled statements.
         :type queries: dict
         :param database_name: Name of database to connect to.
         :type database_name: str
+        :param mode: One of `autocommit`, `transaction` or `concurrent`.
+        :type mode: str
+        :param params: Map of query names -> values to bind to that query.
+        :type params: Optional[Dict[str, dict]]
         :returns: Tuple[dict, int]
         """
+        params = params or {}
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode `{mode}`.")
+        engine = self.engines[database_name]
         results = {}
-        total_rows = 0
-        for k, v in queries.items():
-            query_result = self.engines[database_name].execute(text(v))
-            results[k] = query_result.rowcount
-            total_rows += query_result.rowcount
-        return results, total_rows
+        if mode == "autocommit":
+            for name, query in queries.items():
+                try:
+                    with engine.connect() as conn:
+                        results.update(
+                            self._execute_timed(conn, name, query, params.get(name))
+                        )
+                except SQLAlchemyError as e:
+                    LOGGER.error(f"Failed to execute query `{name}`: {e}")
+        elif mode == "transaction":
+            try:
+                with engine.begin() as conn:
+                    for name, query in queries.items():
+                        results.update(
+                            self._execute_timed(conn, name, query, params.get(name))
+                        )
+            except SQLAlchemyError as e:
+                LOGGER.error(f"Rolled back transaction of {len(queries)} queries: {e}")
+                return {}, 0
+        else:
+            groups = self._group_by_table(queries)
+            workers = min(len(groups), self.engines.pool_options["pool_size"])
+            with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+                for group in executor.map(
+                    lambda group: self._execute_group(engine, group, params),
+                    groups.values(),
+                ):
+                    results.update(group)
+        for name in results:
+            self._invalidate_after_ddl(queries[name], database_name)
+        total_rows = sum(result["rows"] for result in results.values())
+        return {name: results[name] for name in queries if name in results}, total_rows
+
+    def _execute_group(
+        self, engine: Engine, queries: dict, params: Dict[str, dict]
+    ) -> Dict[str, dict]:
+        """
+        Execute dependent statements serially within one transaction.
+
+        :param engine: Engine to check out a pooled connection from.
+        :type engine: Engine
+        :param queries: Map of query names -> raw SQL or compiled statements.
+        :type queries: dict
+        :param params: Map of query names -> values to bind to that query.
+        :type params: Dict[str, dict]
+        :returns: Dict[str, dict]
+        """
+        results = {}
+        try:
+            with engine.begin() as conn:
+                for name, query in queries.items():
+                    results.update(
+                        self._execute_timed(conn, name, query, params.get(name))
+                    )
+        except SQLAlchemyError as e:
+            LOGGER.error(f"Rolled back queries {', '.join(queries)}: {e}")
+            return {}
+        return results
+
+    def _execute_timed(
+        self,
+        conn: Connection,
+        name: str,
+        query: Union[str, TextClause],
+        params: Optional[dict] = None,
+    ) -> Dict[str, dict]:
+        """
+        Execute a statement, recording rows affected & duration.
+
+        :param conn: Connection to execute statement with.
+        :type conn: Connection
+        :param name: Name of query.
+        :type name: str
+        :param query: Raw SQL or compiled statement.
+        :type query: Union[str, TextClause]
+        :param params: Values to bind to statement.
+        :type params: Optional[dict]
+        :returns: Dict[str, dict]
+        """
+        start = perf_counter()
+        statement = self._statement(query).execution_options(query_name=name)
+        rows = conn.execute(statement, params or {}).rowcount
+        duration = round((perf_counter() - start) * 1000, 2)
+        LOGGER.info(f"Query `{name}` affected {rows} rows in {duration}ms")
+        return {name: {"rows": rows, "duration_ms": duration}}
+
+    @staticmethod
+    def _group_by_table(queries: dict) -> Dict[str, dict]:
+        """
+        Group statements by the table they write; unrecognized statements share a group.
+
+        :param queries: Map of query names -> raw SQL or compiled statements.
+        :type queries: dict
+        :returns: Dict[str, dict]
+        """
+        groups = {}
+        for name, query in queries.items():
+            target = TARGET_TABLE.match(str(query))
+            table = target.group(1).lower() if target else None
+            groups.setdefault(table, {})[name] = query
+        return groups
 
     @LOGGER.catch
-    def execute_query(self, query: str, database_name: str) -> Optional[Result]:
+    def execute_query(
+        self, query: Union[str, TextClause], database_name: str
+    ) -> Optional[Result]:
         """
         Execute single SQL query.
 
-        :param query: SQL query to run against database.
-        :type query: str
+        :param query: SQL query or compiled statement to run against database.
+        :type query: Union[str, TextClause]
         :param database_name: Name of database to connect to.
         :type database_name: str
         :returns: Optional[Result]
         """
         try:
-            result = self.engines[database_name].execute(text(query))
+            result = self.engines[database_name].execute(self._statement(query))
+            self._invalidate_after_ddl(query, database_name)
             return result
         except SQLAlchemyError as e:
             LOGGER.error(f"Failed to execute SQL query {query}: {e}")
 
     @LOGGER.catch
-    def execute_query_from_file(
-        self, sql_file: str, database_name: str
-    ) -> Optional[Result]:
+    def read_query(
+        self,
+        query: Union[str, TextClause],
+        database_name: str,
+        params: Optional[dict] = None,
+        primary: bool = False,
+    ) -> Optional[List[Row]]:
         """
-        Execute single SQL query.
+        Fetch all rows of a `SELECT`, from a replica where configured.
 
-        :param sql_file: Filepath of SQL query to run.
-        :type sql_file: str
+        :param query: SQL query or compiled statement to run against database.
+        :type query: Union[str, TextClause]
         :param database_name: Name of database to connect to.
         :type database_name: str
-        :returns: Optional[Result]
+        :param params: Values to bind to query.
+        :type params: Optional[dict]
+        :param primary: Read from the primary, eg. to see this request's own writes.
+        :type primary: bool
+        :returns: Optional[List[Row]]
+        """
+        try:
+            with self._reader(database_name, primary).connect() as conn:
+                return conn.execute(self._statement(query), params or {}).fetchall()
+        except SQLAlchemyError as e:
+            LOGGER.error(f"Failed to read SQL query {query}: {e}")
+
+    @LOGGER.catch
+    def execute_params(
+        self,
+        query: Union[str, TextClause],
+        params: Union[dict, List[dict]],
+        database_name: str,
+    ) -> Optional[int]:
+        """
+        Execute a statement with bound parameters; a list of parameter sets
+        runs the same statement via a single `executemany` in one transaction.
+
+        :param query: SQL with `:name` placeholders, or a compiled statement.
+        :type query: Union[str, TextClause]
+        :param params: Values to bind, or a list of values to bind per execution.
+        :type params: Union[dict, List[dict]]
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :returns: Optional[int]
+        """
+        try:
+            with self.engines[database_name].begin() as conn:
+                result = conn.execute(self._statement(query), params)
+                return result.rowcount
+        except SQLAlchemyError as e:
+            LOGGER.error(f"Failed to execute parameterized SQL query {query}: {e}")
+
+    @LOGGER.catch
+    def bulk_update(
+        self, rows: List[dict], table_name: str, database_name: str, key: str = "id"
+    ) -> Optional[int]:
+        """
+        Update many rows with differing values in a single `UPDATE ... CASE` statement.
+
+        :param rows: Dictionaries of columns to set, each including `key`.
+        :type rows: List[dict]
+        :param table_name: Name of database table to update.
+        :type table_name: str
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :param key: Column identifying each row.
+        :type key: str
+        :returns: Optional[int]
         """
+        if not rows:
+            return 0
         try:
-            query = open(sql_file, "r").read()
-            return self.engines[database_name].execute(query).fetchall()
+            table = self._table(table_name, database_name)
+            columns = {column for row in rows for column in row if column != key}
+            values = {
+                column: case(
+                    {row[key]: row[column] for row in rows if column in row},
+                    value=table.c[key],
+                    else_=table.c[column],
+                )
+                for column in sorted(columns)
+            }
+            statement = (
+                table.update()
+                .where(table.c[key].in_([row[key] for row in rows]))
+                .values(values)
+            )
+            with self.engines[database_name].begin() as conn:
+                return conn.execute(statement).rowcount
         except SQLAlchemyError as e:
-            LOGGER.error(f"Failed to execute SQL {sql_file}: {e}")
+            LOGGER.error(f"SQLAlchemyError while bulk updating `{table_name}`: {e}")
+
+    def stream_query(
+        self,
+        query: Union[str, TextClause],
+        database_name: str,
+        params: Optional[dict] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        primary: bool = False,
+    ) -> Iterator[List[Row]]:
+        """
+        Stream rows in fixed-size chunks from a server-side cursor, holding at
+        most `chunk_size` rows in memory; the connection is released once exhausted.
+
+        :param query: SQL query or compiled statement to run against database.
+        :type query: Union[str, TextClause]
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :param params: Values to bind to query.
+        :type params: Optional[dict]
+        :param chunk_size: Maximum rows fetched per round trip.
+        :type chunk_size: int
+        :param primary: Read from the primary, eg. to see this request's own writes.
+        :type primary: bool
+        :returns: Iterator[List[Row]]
+        """
+        with self._reader(database_name, primary).connect() as conn:
+            result = conn.execution_options(stream_results=True).execute(
+                self._statement(query), params or {}
+            )
+            for chunk in result.partitions(chunk_size):
+                yield chunk
+
+    def stream_rows(
+        self,
+        query: Union[str, TextClause],
+        database_name: str,
+        params: Optional[dict] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        primary: bool = False,
+    ) -> Iterator[Row]:
+        """
+        Stream rows one at a time from a server-side cursor.
+
+        :param query: SQL query or compiled statement to run against database.
+        :type query: Union[str, TextClause]
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :param params: Values to bind to query.
+        :type params: Optional[dict]
+        :param chunk_size: Maximum rows fetched per round trip.
+        :type chunk_size: int
+        :param primary: Read from the primary, eg. to see this request's own writes.
+        :type primary: bool
+        :returns: Iterator[Row]
+        """
+        for chunk in self.stream_query(
+            query, database_name, params, chunk_size, primary
+        ):
+            yield from chunk
+
+    def read_pages(
+        self,
+        query: Union[str, TextClause],
+        database_name: str,
+        params: Optional[dict] = None,
+        key: str = "id",
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        primary: bool = False,
+    ) -> Iterator[List[Row]]:
+        """
+        Read rows in pages ordered by `key`, releasing the connection before each
+        page is yielded so callers may make slow calls per row (eg. HTTP requests)
+        without holding a cursor open.
+
+        :param query: SQL query or compiled statement selecting a unique `key` column.
+        :type query: Union[str, TextClause]
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :param params: Values to bind to query.
+        :type params: Optional[dict]
+        :param key: Unique column to page through rows by.
+        :type key: str
+        :param chunk_size: Maximum rows per page.
+        :type chunk_size: int
+        :param primary: Read from the primary, eg. to see this request's own writes.
+        :type primary: bool
+        :returns: Iterator[List[Row]]
+        """
+        sql = query.text if isinstance(query, TextClause) else query
+        page = text(
+            f"SELECT * FROM ({sql.strip().rstrip(';')}) AS page "
+            f"WHERE :page_after IS NULL OR page.{key} > :page_after "
+            f"ORDER BY page.{key} LIMIT :page_size"
+        )
+        after = None
+        while True:
+            with self._reader(database_name, primary).connect() as conn:
+                rows = conn.execute(
+                    page,
+                    {**(params or {}), "page_after": after, "page_size": chunk_size},
+                ).fetchall()
+            if rows:
+                yield rows
+            if len(rows) < chunk_size:
+                return
+            after = rows[-1]._mapping[key]
 
     @LOGGER.catch
-    def fetch_records(self, query: str, database_name: str) -> Optional[List[str]]:
+    def fetch_records(
+        self, query: str, database_name: str, primary: bool = False
+    ) -> Optional[List[str]]:
         """
-        Fetch all rows via query.
+        Fetch all rows via query, streamed from a server-side cursor so only
+        the returned records are held in memory rather than a copy of each row.
 
         :param query: SQL query to run against database.
         :type query: str
         :param database_name: Name of database to connect to.
         :type database_name: str
+        :param primary: Read from the primary, eg. to see this request's own writes.
+        :type primary: bool
         :returns: Optional[List[str]]
         """
-        rows = self.engines[database_name].execute(query).fetchall()
-        if bool(rows):
-            return [row.items() for row in rows]
-        return None
+        records = [
+            row.items()
+            for row in self.stream_rows(query, database_name, primary=primary)
+        ]
+        return records or None
 
     @LOGGER.catch
-    def fetch_record(self, query: str, database_name: str) -> Optional[str]:
+    def fetch_record(
+        self, query: str, database_name: str, primary: bool = False
+    ) -> Optional[str]:
         """
         Fetch a single row; typically used to verify whether a
         record already exists (ie: users).
@@ -114,12 +532,73 @@ class Database:
         :type query: str
         :param database_name: Name of database to connect to.
         :type database_name: Optional[str]
+        :param primary: Read from the primary, eg. to see this request's own writes.
+        :type primary: bool
         :returns: Optional[str]
         """
-        return self.engines[database_name].execute(query).first()
+        return self._reader(database_name, primary).execute(query).first()
+
+    @contextmanager
+    def staging_table(self, table_name: str, database_name: str) -> Iterator[str]:
+        """
+        Load into an empty copy of a table, then swap it in with a single atomic
+        rename so readers never see a missing or partially loaded table. The
+        staging table is dropped instead if loading raises.
+
+        :param table_name: Name of database table to replace.
+        :type table_name: str
+        :param database_name: Name of database containing table.
+        :type database_name: str
+        :returns: Iterator[str]
+        """
+        engine = self.engines[database_name]
+        staging, retired = f"{table_name}_staging", f"{table_name}_retired"
+        exists = inspect(engine).has_table(table_name)
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {staging}")
+            if exists and engine.dialect.name == "sqlite":
+                conn.exec_driver_sql(
+                    f"CREATE TABLE {staging} AS SELECT * FROM {table_name} WHERE 0"
+                )
+            elif exists:
+                conn.exec_driver_sql(f"CREATE TABLE {staging} LIKE {table_name}")
+        self.invalidate_tables(database_name, staging)
+        try:
+            yield staging
+        except Exception:
+            with engine.begin() as conn:
+                conn.exec_driver_sql(f"DROP TABLE IF EXISTS {staging}")
+            raise
+        finally:
+            self.invalidate_tables(database_name, staging)
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {retired}")
+            if engine.dialect.name == "sqlite":
+                # SQLite DDL is transactional, so consecutive renames swap atomically.
+                if exists:
+                    conn.exec_driver_sql(
+                        f"ALTER TABLE {table_name} RENAME TO {retired}"
+                    )
+                conn.exec_driver_sql(f"ALTER TABLE {staging} RENAME TO {table_name}")
+            elif exists:
+                conn.exec_driver_sql(
+                    f"RENAME TABLE {table_name} TO {retired}, {staging} TO {table_name}"
+                )
+            else:
+                conn.exec_driver_sql(f"RENAME TABLE {staging} TO {table_name}")
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {retired}")
+        self.invalidate_tables(database_name, table_name)
+        LOGGER.info(f"Swapped `{staging}` in for `{database_name}`.`{table_name}`.")
 
     def insert_records(
-        self, rows: List[dict], table_name: str, database_name: str, replace=False
+        self,
+        rows: List[dict],
+        table_name: str,
+        database_name: str,
+        replace=False,
+        chunk_size: int = INSERT_CHUNK_SIZE,
+        load_data: bool = False,
+        swap: bool = False,
     ) -> Optional[int]:
         """
         Insert rows into SQL table.
@@ -130,16 +609,30 @@ class Database:
         :type table_name: str
         :param database_name: Name of database to connect to.
         :type database_name: Optional[str]
-        :param replace: Flag to truncate table prior to insert.
+        :param replace: Replace existing rows via `swap`, keeping them if loading fails.
         :type replace: bool
+        :param chunk_size: Rows per multi-row `INSERT` statement; unused by `load_data`.
+        :type chunk_size: int
+        :param load_data: Load all rows in one `LOAD DATA LOCAL INFILE` where supported.
+        :type load_data: bool
+        :param swap: Replace table contents by loading & swapping in a staging table.
+        :type swap: bool
         :returns: Optional[int]
         """
         try:
-            if replace:
-                self.engines[database_name].execute(f"TRUNCATE TABLE {table_name}")
-            table = self._table(table_name, database_name)
-            self.engines[database_name].execute(table.insert(), rows)
-            return len(rows)
+            if swap or replace:
+                with self.staging_table(table_name, database_name) as staging:
+                    inserted = self.bulk_insert(
+                        rows, staging, database_name, chunk_size, load_data
+                    )
+                    if inserted < len(rows):
+                        raise SQLAlchemyError(
+                            f"Loaded {inserted} of {len(rows)} rows into `{staging}`."
+                        )
+                return inserted
+            return self.bulk_insert(
+                rows, table_name, database_name, chunk_size, load_data
+            )
         except SQLAlchemyError as e:
             LOGGER.error(f"SQLAlchemyError while inserting rows: {e}")
         except IntegrityError as e:
@@ -147,11 +640,129 @@ class Database:
         except Exception as e:
             LOGGER.error(f"Unexpected error while inserting rows: {e}")
 
+    def bulk_insert(
+        self,
+        rows: List[dict],
+        table_name: str,
+        database_name: str,
+        chunk_size: int = INSERT_CHUNK_SIZE,
+        load_data: bool = False,
+    ) -> int:
+        """
+        Insert rows in chunks, each a single multi-row `INSERT ... VALUES`
+        committed separately; stops at the first failing chunk.
+
+        :param rows: List of dictionaries to insert where keys are columns.
+        :type rows: List[dict]
+        :param table_name: Name of database table to insert into.
+        :type table_name: str
+        :param database_name: Name of database to connect to.
+        :type database_name: str
+        :param chunk_size: Rows per multi-row `INSERT` statement; unused by `load_data`.
+        :type chunk_size: int
+        :param load_data: Load all rows in one `LOAD DATA LOCAL INFILE` where supported.
+        :type load_data: bool
+        :returns: int
+        """
+        if not rows:
+            return 0
+        engine = self.engines[database_name]
+        table = self._table(table_name, database_name)
+        start = perf_counter()
+        if load_data and engine.dialect.name == "mysql":
+            inserted = self._load_data_infile(rows, table, engine)
+        else:
+            if load_data:
+                LOGGER.warning(
+                    f"`LOAD DATA` unsupported by {engine.dialect.name}; "
+                    "falling back to multi-row inserts."
+                )
+            inserted = 0
+            for offset in range(0, len(rows), chunk_size):
+                chunk = rows[offset : offset + chunk_size]
+                try:
+                    with engine.begin() as conn:
+                        conn.execute(table.insert().values(chunk))
+                except SQLAlchemyError as e:
+                    LOGGER.error(
+                        f"Stopped inserting into `{table_name}` at row {offset}: {e}"
+                    )
+                    break
+                inserted += len(chunk)
+                LOGGER.debug(
+                    f"Inserted {inserted}/{len(rows)} rows into `{table_name}`"
+                )
+        elapsed = perf_counter() - start
+        rate = round(inserted / elapsed) if elapsed else inserted
+        LOGGER.info(
+            f"Inserted {inserted} rows into `{database_name}`.`{table_name}` "
+            f"in {elapsed:.2f}s ({rate} rows/sec)."
+        )
+        return inserted
+
+    def _load_data_infile(self, rows: List[dict], table: Table, engine: Engine) -> int:
+        """
+        Stream rows to a temporary tab-delimited file and bulk load it server-side.
+
+        Unlike multi-row inserts, the file is loaded by one statement in a single
+        transaction regardless of `chunk_size`: either every row is loaded or none.
+        Requires `local_infile` on both the client connection & MySQL server.
+
+        :param rows: List of dictionaries to insert where keys are columns.
+        :type rows: List[dict]
+        :param table: Table to load rows into.
+        :type table: Table
+        :param engine: Engine of database containing table.
+        :type engine: Engine
+        :returns: int
+        """
+        columns = [column.name for column in table.columns if column.name in rows[0]]
+        with NamedTemporaryFile("w", suffix=".tsv", encoding="utf-8") as infile:
+            for row in rows:
+                infile.write(
+                    "\t".join(self._infile_value(row.get(col)) for col in columns)
+                )
+                infile.write("\n")
+            infile.flush()
+            statement = text(
+                f"LOAD DATA LOCAL INFILE :path INTO TABLE `{table.name}` "
+                "CHARACTER SET utf8mb4 "
+                f"({', '.join(f'`{column}`' for column in columns)})"
+            )
+            with engine.begin() as conn:
+                return conn.execute(statement, {"path": infile.name}).rowcount
+
+    @staticmethod
+    def _infile_value(value) -> str:
+        """
+        Format a value in MySQL's default `LOAD DATA` text format.
+
+        :param value: Value of a single column.
+        :type value: Any
+        :returns: str
+        """
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            return str(int(value))
+        return str(value).translate(INFILE_ESCAPES)
+
     def insert_dataframe(
-        self, df: DataFrame, table_name: str, database_name: str, action="append"
+        self,
+        df: DataFrame,
+        table_name: str,
+        database_name: str,
+        action="append",
+        chunksize: int = INSERT_CHUNK_SIZE,
+        dtype: Optional[dict] = None,
+        method: Optional[str] = None,
     ) -> DataFrame:
         """
-        Insert Pandas DataFrame into SQL table.
+        Insert Pandas DataFrame into SQL table in chunks of multi-row inserts.
+
+        The default `executemany` is rewritten by PyMySQL into multi-row
+        `INSERT ... VALUES` statements, avoiding the cost of compiling a bound
+        parameter per value which pandas' `multi` method incurs.
 
         :param df: Tabular data to insert into SQL table.
         :type df: DataFrame
@@ -159,12 +770,51 @@ class Database:
         :type table_name: str
         :param database_name: Name of database to connect to.
         :type database_name: str
-        :param action: Method of dealing with duplicate rows.
+        :param action: Method of dealing with existing rows; `swap` replaces them atomically.
         :type action: str
+        :param chunksize: Rows per `INSERT` statement.
+        :type chunksize: int
+        :param dtype: SQL types of columns, overriding those mapped from `df.dtypes`.
+        :type dtype: Optional[dict]
+        :param method: Pandas insert method; `None` for the driver's `executemany`.
+        :type method: Optional[str]
         :returns: DataFrame
         """
-        df.to_sql(table_name, self.engines[database_name], if_exists=action)
+        start = perf_counter()
+        load = partial(
+            df.to_sql,
+            con=self.engines[database_name],
+            index=False,
+            chunksize=chunksize,
+            dtype={**self.dataframe_dtypes(df), **(dtype or {})},
+            method=method,
+        )
+        if action == "swap":
+            with self.staging_table(table_name, database_name) as staging:
+                load(staging, if_exists="append")
+        else:
+            load(table_name, if_exists=action)
+        elapsed = perf_counter() - start
+        if action == "replace":
+            self.invalidate_tables(database_name, table_name)
+        rate = round(len(df) / elapsed) if elapsed else len(df)
         LOGGER.info(
-            f"Updated {len(df)} rows via {action} into `{database_name}`.`{table_name}`."
+            f"Updated {len(df)} rows via {action} into `{database_name}`.`{table_name}` "
+            f"in {elapsed:.2f}s ({rate} rows/sec)."
         )
         return df
+
+    @staticmethod
+    def dataframe_dtypes(df: DataFrame) -> dict:
+        """
+        Map DataFrame columns to SQL types, so replaced tables keep a stable schema.
+
+        :param df: Tabular data to insert into SQL table.
+        :type df: DataFrame
+        :returns: dict
+        """
+        return {
+            column: DATAFRAME_DTYPES[dtype.kind]
+            for column, dtype in df.dtypes.items()
+            if dtype.kind in DATAFRAME_DTYPES
+        }
@@ -0,0 +1,63 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from database.crud import (
+    get_comment_upvote,
+    get_watermarks,
+    read_bind,
+    remove_comment_upvote,
+    set_watermarks,
+    submit_comment_upvote,
+)
+from database.models import JobWatermark
+from database.orm import Base
+
+
+def test_job_watermarks():
+    """Jobs resume from their last recorded run; unseen jobs start from epoch."""
+    engine = create_engine("sqlite://")
+    JobWatermark.__table__.create(bind=engine)
+    db = Session(bind=engine)
+    jobs = ["posts/updates/html_cdn_urls.sql", "posts/updates/title_escape_quotes.sql"]
+    assert set(get_watermarks(db, jobs).values()) == {datetime(1970, 1, 1)}
+    last_run = datetime(2021, 6, 1, 12, 30)
+    assert set_watermarks(db, {jobs[0]: last_run}) == 1
+    assert set_watermarks(db, {jobs[0]: last_run}) == 1
+    assert get_watermarks(db, jobs) == {
+        jobs[0]: last_run,
+        jobs[1]: datetime(1970, 1, 1),
+    }
+
+
+def test_async_comment_upvotes():
+    """Upvotes are submitted, found & revoked per user through an async session."""
+
+    async def upvote_flow():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            await submit_comment_upvote(db, "user-1", 1)
+            await submit_comment_upvote(db, "user-2", 2)
+            assert await get_comment_upvote(db, "user-1", 1) is not None
+            assert await get_comment_upvote(db, "user-1", 2) is None
+            await remove_comment_upvote(db, "user-1", 1)
+            assert await get_comment_upvote(db, "user-1", 1) is None
+            assert await get_comment_upvote(db, "user-2", 2) is not None
+        await engine.dispose()
+
+    asyncio.run(upvote_flow())
+
+
+def test_read_bind_routes_to_replica():
+    """Session reads bind to the replica engine unless the primary is requested."""
+    primary = create_async_engine("sqlite+aiosqlite://")
+    replica = create_engine("sqlite://")
+    db = AsyncSession(primary, info={"replica": replica})
+    assert read_bind(db) == {"bind": replica}
+    assert read_bind(db, primary=True) is None
+    assert read_bind(AsyncSession(primary)) is None
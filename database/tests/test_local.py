@@ -0,0 +1,57 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+
+from config import basedir
+from database.engines import EngineRegistry
+from database.local import (
+    LEGACY_CDN_URLS,
+    LOCAL_ENGINE_ARGS,
+    ensure_local_database,
+    local_uri,
+    posts,
+    posts_meta,
+)
+from database.models import PostFlags
+from database.query_registry import QueryRegistry
+from database.sql_db import Database
+
+
+def test_post_updates_run_against_seeded_database(tmp_path):
+    """Every post update batch job runs against a locally seeded database."""
+    engines = EngineRegistry(local_uri(str(tmp_path)), LOCAL_ENGINE_ARGS)
+    ensure_local_database(engines, 500, seed=1)
+    ensure_local_database(engines, 500, seed=1)
+    engine = engines["hackers_prod"]
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(posts)).scalar() == 500
+        assert 0 < conn.execute(select(func.count()).select_from(posts_meta)).scalar()
+    PostFlags.__table__.create(bind=engine)
+    rdbms = Database(engines)
+    queries = QueryRegistry(f"{basedir}/database/queries")
+    since = {"since": datetime(1970, 1, 1)}
+    assert (
+        rdbms.execute_params(queries["posts/flags/refresh"], since, "hackers_prod")
+        == 500
+    )
+    updates = queries.collection("posts/updates")
+    results, num_updated = rdbms.execute_queries(
+        updates,
+        "hackers_prod",
+        mode="transaction",
+        params={name: since for name in updates},
+    )
+    assert set(results) == set(updates)
+    assert num_updated > 0
+    with engine.connect() as conn:
+        remaining = conn.execute(
+            select(func.count())
+            .select_from(posts)
+            .where(
+                posts.c.title.like('%"%')
+                | posts.c.html.like(f"%{LEGACY_CDN_URLS[1]}%")
+                | posts.c.feature_image.like(f"%{LEGACY_CDN_URLS[0]}%")
+            )
+        ).scalar()
+    assert remaining == 0
+    engines.dispose()
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+from config import basedir
+from database.engines import EngineRegistry
+from database.models import PostFlags
+from database.query_registry import QueryRegistry
+from database.sql_db import Database
+
+
+def test_selects_use_post_flags(tmp_path):
+    """Scanning selects match posts by their derived flags once refreshed."""
+    engines = EngineRegistry(f"sqlite:///{tmp_path}", {})
+    rdbms = Database(engines)
+    queries = QueryRegistry(f"{basedir}/database/queries")
+    rdbms.execute_query(
+        "CREATE TABLE posts (id TEXT, slug TEXT, title TEXT, status TEXT, "
+        "mobiledoc TEXT, html TEXT, plaintext TEXT, updated_at DATETIME)",
+        "hackers_prod",
+    )
+    PostFlags.__table__.create(bind=engines["hackers_prod"])
+    posts = [
+        ("lynx", "Lynx Roundup", "draft", '{"cards":[]}', "<a href='http://a'>"),
+        ("alt", "Images", "published", '[["image",{"alt":"a"}]]', ""),
+        ("no-alt", "Images", "published", '[["image",{"src":"b"}]]', ""),
+    ]
+    rdbms.execute_params(
+        "INSERT INTO posts VALUES (:id, :id, :title, :status, :mobiledoc, :html, "
+        "NULL, :updated_at)",
+        [
+            {
+                **dict(zip(["id", "title", "status", "mobiledoc", "html"], post)),
+                "updated_at": datetime(2021, 6, 1),
+            }
+            for post in posts
+        ],
+        "hackers_prod",
+    )
+    assert (
+        rdbms.read_query(queries["posts/selects/lynx_bookmarks"], "hackers_prod") == []
+    )
+    refreshed = rdbms.execute_params(
+        queries["posts/flags/refresh"], {"since": datetime(2021, 1, 1)}, "hackers_prod"
+    )
+    assert refreshed == 3
+    lynx = rdbms.read_query(queries["posts/selects/lynx_bookmarks"], "hackers_prod")
+    assert [post.id for post in lynx] == ["lynx"]
+    missing_alt = rdbms.read_query(
+        queries["posts/selects/img_alt_missing_mobiledoc"], "hackers_prod"
+    )
+    assert [post.id for post in missing_alt] == ["no-alt"]
+    rdbms.execute_params(
+        "UPDATE posts SET mobiledoc = '[[\"bookmark\",{}]]' WHERE id = 'lynx'",
+        {},
+        "hackers_prod",
+    )
+    rdbms.execute_params(
+        queries["posts/flags/refresh_post"], {"post_id": "lynx"}, "hackers_prod"
+    )
+    assert (
+        rdbms.read_query(queries["posts/selects/lynx_bookmarks"], "hackers_prod") == []
+    )
+    flags = rdbms.read_query(
+        "SELECT * FROM post_flags WHERE post_id = 'lynx'", "hackers_prod"
+    )
+    assert flags[0].has_http_link and flags[0].has_bookmark
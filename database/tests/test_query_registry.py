@@ -0,0 +1,19 @@
+from os import utime
+
+from database.query_registry import QueryRegistry
+
+
+def test_query_registry(tmp_path):
+    """SQL files are loaded once by name and re-read on change when reloading."""
+    (tmp_path / "posts" / "updates").mkdir(parents=True)
+    query_file = tmp_path / "posts" / "updates" / "html_cdn_urls.sql"
+    query_file.write_text("UPDATE posts SET html = 'a';")
+    (tmp_path / "posts" / "lynx_bookmarks.sql").write_text("SELECT 1;")
+    queries = QueryRegistry(str(tmp_path))
+    assert queries.sql("posts/updates/html_cdn_urls") == "UPDATE posts SET html = 'a';"
+    assert list(queries.collection("posts/updates")) == ["html_cdn_urls.sql"]
+    query_file.write_text("UPDATE posts SET html = 'b';")
+    utime(query_file, (0, 0))
+    assert str(queries["posts/updates/html_cdn_urls"]) == "UPDATE posts SET html = 'a';"
+    queries.reload = True
+    assert str(queries["posts/updates/html_cdn_urls"]) == "UPDATE posts SET html = 'b';"
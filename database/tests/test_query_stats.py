@@ -0,0 +1,39 @@
+from database.engines import EngineRegistry
+from database.query_stats import QueryStats, fingerprint
+from database.sql_db import Database
+
+
+def test_fingerprint_normalizes_values():
+    """Statements differing only by literals, placeholders or list lengths match."""
+    assert fingerprint(
+        "SELECT *  FROM posts\nWHERE id IN (1, 2, 3) AND slug = 'it''s'"
+    ) == fingerprint("SELECT * FROM posts WHERE id IN (%s, %s) AND slug = %s")
+    assert fingerprint("INSERT INTO tags VALUES (?, ?), (?, ?), (?, ?)") == (
+        "INSERT INTO tags VALUES (?)"
+    )
+
+
+def test_query_stats_per_statement(tmp_path):
+    """Named queries are timed per statement; those over the threshold are slow."""
+    query_stats = QueryStats(slow_query_ms=0)
+    rdbms = Database(
+        EngineRegistry(f"sqlite:///{tmp_path}", {}, query_stats=query_stats)
+    )
+    rdbms.execute_query("CREATE TABLE posts (id INT, title TEXT)", "hackers_prod")
+    for i in range(3):
+        rdbms.execute_query(f"INSERT INTO posts VALUES ({i}, 'a')", "hackers_prod")
+    rdbms.execute_queries(
+        {"posts_title.sql": "UPDATE posts SET title = 'b'"}, "hackers_prod"
+    )
+    stats = {query["statement"]: query for query in query_stats.summary()}
+    inserts = stats["INSERT INTO posts VALUES (?)"]
+    assert inserts["calls"] == 3
+    assert inserts["rows"] == 3
+    assert inserts["slow_calls"] == 3
+    updates = stats["UPDATE posts SET title = ?"]
+    assert updates["name"] == "posts_title.sql"
+    assert updates["rows"] == 3
+    assert updates["avg_ms"] <= updates["max_ms"]
+    assert len(query_stats.summary(limit=1)) == 1
+    query_stats.reset()
+    assert query_stats.summary() == []
@@ -0,0 +1,194 @@
+from mock import patch
+from pandas import DataFrame
+from sqlalchemy import BIGINT, Table, event
+
+from database.engines import EngineRegistry
+from database.sql_db import Database
+
+
+def test_reflected_tables_are_cached(tmp_path):
+    """Tables are reflected once per (database, table) until DDL invalidates them."""
+    rdbms = Database(EngineRegistry(f"sqlite:///{tmp_path}", {}))
+    rdbms.execute_query("CREATE TABLE weekly_stats (slug TEXT, views INT)", "analytics")
+    rows = [{"slug": "lynx", "views": 1}]
+    with patch("database.sql_db.Table", wraps=Table) as reflect:
+        assert rdbms.insert_records(rows, "weekly_stats", "analytics") == 1
+        assert rdbms.insert_records(rows, "weekly_stats", "analytics") == 1
+        assert reflect.call_count == 1
+        rdbms.execute_query("ALTER TABLE weekly_stats ADD title TEXT", "analytics")
+        assert "title" in rdbms._table("weekly_stats", "analytics").columns
+        assert reflect.call_count == 2
+
+
+def test_parameterized_updates(tmp_path):
+    """Bound parameters run as one executemany or one `UPDATE ... CASE`."""
+    rdbms = Database(EngineRegistry(f"sqlite:///{tmp_path}", {}))
+    rdbms.execute_query(
+        "CREATE TABLE posts (id TEXT, feature_image TEXT)", "hackers_prod"
+    )
+    posts = [{"id": f"post-{i}", "feature_image": None} for i in range(3)]
+    insert = "INSERT INTO posts (id, feature_image) VALUES (:id, :feature_image)"
+    assert rdbms.execute_params(insert, posts, "hackers_prod") == 3
+    images = [
+        {"id": "post-0", "feature_image": "a.jpg"},
+        {"id": "post-2", "feature_image": "c'.jpg"},
+    ]
+    assert rdbms.bulk_update(images, "posts", "hackers_prod") == 2
+    rows = rdbms.execute_query("SELECT * FROM posts ORDER BY id", "hackers_prod")
+    assert [tuple(row) for row in rows] == [
+        ("post-0", "a.jpg"),
+        ("post-1", None),
+        ("post-2", "c'.jpg"),
+    ]
+
+
+def test_execute_queries_modes(tmp_path):
+    """Batches report rows & duration per committed query; transactions roll back."""
+    engines = EngineRegistry(f"sqlite:///{tmp_path}", {"check_same_thread": False})
+    rdbms = Database(engines)
+    rdbms.execute_query("CREATE TABLE posts (id INT, title TEXT)", "hackers_prod")
+    rdbms.execute_query("CREATE TABLE tags (id INT, og_title TEXT)", "hackers_prod")
+    rdbms.execute_query("INSERT INTO posts VALUES (1, 'a'), (2, 'b')", "hackers_prod")
+    rdbms.execute_query("INSERT INTO tags VALUES (1, NULL)", "hackers_prod")
+    queries = {
+        "posts_title.sql": "UPDATE posts SET title = 'c'",
+        "tags_og_title.sql": "UPDATE tags SET og_title = 'c'",
+    }
+    results, total = rdbms.execute_queries(queries, "hackers_prod", mode="concurrent")
+    assert total == 3
+    assert results["posts_title.sql"]["rows"] == 2
+    assert results["tags_og_title.sql"]["duration_ms"] >= 0
+    queries["broken.sql"] = "UPDATE missing SET title = 'd'"
+    queries["posts_title.sql"] = "UPDATE posts SET title = 'd'"
+    assert rdbms.execute_queries(queries, "hackers_prod", mode="transaction") == ({}, 0)
+    titles = rdbms.execute_query("SELECT title FROM posts", "hackers_prod")
+    assert [row.title for row in titles] == ["c", "c"]
+    for mode in ("autocommit", "concurrent"):
+        results, total = rdbms.execute_queries(queries, "hackers_prod", mode=mode)
+        assert set(results) == {"posts_title.sql", "tags_og_title.sql"}
+        assert total == 3
+
+
+def test_stream_query_chunks(tmp_path):
+    """Rows are streamed in bounded chunks rather than fetched all at once."""
+    rdbms = Database(EngineRegistry(f"sqlite:///{tmp_path}", {}))
+    rdbms.execute_query("CREATE TABLE posts (id INT, mobiledoc TEXT)", "hackers_prod")
+    posts = [{"id": i, "mobiledoc": "{}"} for i in range(5)]
+    rdbms.execute_params(
+        "INSERT INTO posts VALUES (:id, :mobiledoc)", posts, "hackers_prod"
+    )
+    query = "SELECT id FROM posts WHERE id >= :id ORDER BY id"
+    chunks = rdbms.stream_query(query, "hackers_prod", {"id": 1}, chunk_size=2)
+    assert [[row.id for row in chunk] for chunk in chunks] == [[1, 2], [3, 4]]
+    assert [
+        row["id"] for row in rdbms.stream_rows(query, "hackers_prod", {"id": 3})
+    ] == [3, 4]
+    assert rdbms.engines.pool_status()["hackers_prod"]["checked_out"] == 0
+
+
+def test_read_pages_release_connection(tmp_path):
+    """Pages are read by key with the connection released before each is yielded."""
+    rdbms = Database(EngineRegistry(f"sqlite:///{tmp_path}", {}))
+    rdbms.execute_query("CREATE TABLE posts (id INT, title TEXT)", "hackers_prod")
+    posts = [{"id": i, "title": "a" if i % 2 else "b"} for i in range(7)]
+    rdbms.execute_params(
+        "INSERT INTO posts VALUES (:id, :title)", posts, "hackers_prod"
+    )
+    query = "SELECT id FROM posts WHERE title = :title;"
+    pages = []
+    for page in rdbms.read_pages(query, "hackers_prod", {"title": "a"}, chunk_size=2):
+        assert rdbms.engines.pool_status()["hackers_prod"]["checked_out"] == 0
+        pages.append([row.id for row in page])
+    assert pages == [[1, 3], [5]]
+
+
+def test_bulk_insert_chunks(tmp_path):
+    """Each chunk is one multi-row INSERT; chunks before a failure are kept."""
+    engines = EngineRegistry(f"sqlite:///{tmp_path}", {})
+    rdbms = Database(engines)
+    rdbms.execute_query(
+        "CREATE TABLE algolia_searches (id INT PRIMARY KEY, search TEXT)", "analytics"
+    )
+    statements = []
+    event.listen(
+        engines["analytics"],
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    rows = [{"id": i, "search": f"query {i}"} for i in range(5)]
+    assert (
+        rdbms.insert_records(rows, "algolia_searches", "analytics", chunk_size=2) == 5
+    )
+    assert sum(sql.startswith("INSERT") for sql in statements) == 3
+    rows = [{"id": i, "search": None} for i in range(5, 9)] + [{"id": 0, "search": ""}]
+    assert rdbms.bulk_insert(rows, "algolia_searches", "analytics", chunk_size=4) == 4
+    total = rdbms.execute_query("SELECT COUNT(*) FROM algolia_searches", "analytics")
+    assert total.scalar() == 9
+    assert [
+        Database._infile_value(value) for value in [None, True, 7, "a\tb\\c\n"]
+    ] == ["\\N", "1", "7", "a\\tb\\\\c\\n"]
+
+
+def test_insert_dataframe_multirow(tmp_path):
+    """DataFrames load in chunks with mapped column types and no index column."""
+    engines = EngineRegistry(f"sqlite:///{tmp_path}", {})
+    rdbms = Database(engines)
+    statements = []
+    event.listen(
+        engines["analytics"],
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    df = DataFrame({"slug": [f"post-{i}" for i in range(5)], "views": [5, 4, 3, 2, 1]})
+    rdbms.insert_dataframe(
+        df, "yearly_stats", "analytics", "replace", chunksize=2, method="multi"
+    )
+    assert sum(sql.startswith("INSERT") for sql in statements) == 3
+    table = rdbms._table("yearly_stats", "analytics")
+    assert [column.name for column in table.columns] == ["slug", "views"]
+    assert isinstance(table.c.views.type, BIGINT)
+    views = rdbms.execute_query("SELECT SUM(views) FROM yearly_stats", "analytics")
+    assert views.scalar() == 15
+
+
+def test_staging_table_swap(tmp_path):
+    """Swapped loads replace a table whole, leaving it untouched if loading fails."""
+    rdbms = Database(EngineRegistry(f"sqlite:///{tmp_path}", {}))
+    df = DataFrame({"slug": ["lynx", "pandas"], "views": [2, 1]})
+    rdbms.insert_dataframe(df, "weekly_stats", "analytics", action="swap")
+    rdbms.insert_dataframe(df.head(1), "weekly_stats", "analytics", action="swap")
+    rows = [{"slug": "flask", "views": 3}, {"slug": "sql", "views": 4}]
+    assert rdbms.insert_records(rows, "weekly_stats", "analytics", swap=True) == 2
+    rows.append({"slug": "gcp", "missing": 5})
+    assert rdbms.insert_records(rows, "weekly_stats", "analytics", swap=True) is None
+    assert (
+        rdbms.insert_records(
+            rows, "weekly_stats", "analytics", replace=True, chunk_size=1
+        )
+        is None
+    )
+    stats = rdbms.execute_query("SELECT slug FROM weekly_stats", "analytics")
+    assert [row.slug for row in stats] == ["flask", "sql"]
+    tables = rdbms.execute_query("SELECT name FROM sqlite_master", "analytics")
+    assert [row.name for row in tables] == ["weekly_stats"]
+
+
+def test_reads_route_to_replica(tmp_path):
+    """Reads use a replica unless the primary is requested; writes use the primary."""
+    (tmp_path / "primary").mkdir()
+    (tmp_path / "replica").mkdir()
+    engines = EngineRegistry(
+        f"sqlite:///{tmp_path}/primary",
+        {},
+        replica_uris=[f"sqlite:///{tmp_path}/replica"],
+    )
+    rdbms = Database(engines)
+    for engine in (engines["hackers_prod"], engines.replica("hackers_prod")):
+        engine.execute("CREATE TABLE posts (id INT)")
+    rdbms.execute_params("INSERT INTO posts VALUES (:id)", {"id": 1}, "hackers_prod")
+    query = "SELECT COUNT(*) AS posts FROM posts"
+    assert rdbms.read_query(query, "hackers_prod")[0].posts == 0
+    assert rdbms.read_query(query, "hackers_prod", primary=True)[0].posts == 1
+    assert rdbms.fetch_record(query, "hackers_prod").posts == 0
+    assert next(rdbms.stream_rows(query, "hackers_prod", primary=True)).posts == 1
+    assert sorted(engines.pool_status()) == ["hackers_prod", "hackers_prod@replica-0"]
@@ -3,7 +3,8 @@ import pprint
 from fastapi.testclient import TestClient
 
 from app import api
-from config import basedir, settings
+from config import settings
+from database import queries
 from database.schemas import NewsletterSubscriber
 from log import LOGGER
 
@@ -20,9 +21,7 @@ def test_api_docs():
 
 def test_batch_lynx_previews(rdbms):
     """"""
-    sql_file = open(f"{basedir}/database/queries/posts/selects/lynx_bookmarks.sql", "r")
-    query = sql_file.read()
-    posts = rdbms.execute_query(query, "hackers_prod").fetchall()
+    posts = rdbms.read_query(queries["posts/selects/lynx_bookmarks"], "hackers_prod")
     assert isinstance(posts, list)
     for post in posts:
         assert "lynx" in post["slug"]